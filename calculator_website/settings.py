@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import hashlib
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -47,6 +48,7 @@ MIDDLEWARE = [
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
+    'calculators.middleware.private_flash_messages',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
@@ -56,13 +58,19 @@ TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
         'DIRS': [],
-        'APP_DIRS': True,
         'OPTIONS': {
             'context_processors': [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
             ],
+            # Cached loader that minifies HTML templates once when loading them
+            'loaders': [
+                ('calculators.loaders.MinifyingLoader', [
+                    'django.template.loaders.filesystem.Loader',
+                    'django.template.loaders.app_directories.Loader',
+                ]),
+            ],
         },
     },
 ]
@@ -128,4 +136,85 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # Security Settings for SEO and Security
 SECURE_BROWSER_XSS_FILTER = True
 SECURE_CONTENT_TYPE_NOSNIFF = True
-X_FRAME_OPTIONS = 'DENY'
\ No newline at end of file
+X_FRAME_OPTIONS = 'DENY'
+
+# Grade scales
+# Built-in scales: '4.0', '4.3', '5.0', 'letter', 'seven_point'. Add or override
+# scales with GRADE_SCALES = {'key': {'name': ..., 'points': {letter: points},
+# 'cutoffs': [(letter, minimum_percentage), ...]}}
+DEFAULT_GRADE_SCALE = '4.0'
+
+# Result permalinks (e.g. /mortgage-calculator/r/?price=...) are public and
+# cacheable by browsers and proxies for this many seconds
+PERMALINK_CACHE_SECONDS = 60 * 60 * 24
+
+# Absolute site URL for generated sitemaps
+SITE_URL = 'https://mycalculator.us'
+
+# Pre-rendered landing pages (manage.py build_landing_pages). The front web
+# server serves this directory at the site root, ahead of Django.
+LANDING_PAGES_ROOT = BASE_DIR / 'landing'
+
+# Static export of GET-only pages (manage.py export_static_site). The front
+# web server serves files listed in manifest.json from here; saving any row
+# the pages render (calculators.signals.PAGE_CONTENT_MODELS) re-exports changed
+# pages, and so does manage.py build_assets.
+STATIC_EXPORT_ROOT = BASE_DIR / 'static_site'
+
+# Two tiers: a small in-process LRU (calculators.tiered_cache) in front of a
+# cache shared by every worker process on the host through a memory-mapped
+# file in /dev/shm (calculators.shm_cache). The content version, memoized
+# results and rendered pages are computed once per host rather than per
+# worker; L1 copies live at most L1_TIMEOUT seconds. manage.py
+# benchmark_cache compares the shared backend with the stock ones. The file is
+# named after the checkout, so two checkouts on one host (staging next to
+# production) never read each other's entries. Results and page data pickle
+# to about 1 KB and go to the small slots; rendered pages (100-130 KB) go to
+# the large ones. The file name carries these sizes, so changing them starts a
+# fresh file rather than resizing the one running workers have mapped.
+CACHE_LOCATION = 'calculator-website-' + hashlib.md5(str(BASE_DIR).encode()).hexdigest()[:12]
+CACHES = {
+    'default': {
+        'BACKEND': 'calculators.tiered_cache.TieredCache',
+        'LOCATION': CACHE_LOCATION,
+        'TIMEOUT': 300,
+        'OPTIONS': {'L2': 'shared', 'L1_MAX_ENTRIES': 1000, 'L1_TIMEOUT': 5},
+    },
+    'shared': {
+        'BACKEND': 'calculators.shm_cache.SharedMemoryCache',
+        'LOCATION': CACHE_LOCATION,
+        'TIMEOUT': 300,
+        'OPTIONS': {'SLOTS': 2048, 'SLOT_SIZE': 16 * 1024, 'LARGE_SLOTS': 64, 'LARGE_SLOT_SIZE': 256 * 1024},
+    },
+}
+
+# manage.py test points the shared cache at a temporary directory
+# (calculators.testing) so test runs never touch the live /dev/shm file
+TEST_RUNNER = 'calculators.testing.TemporaryCacheRunner'
+
+# Memoized page data and results (calculators.tiered_cache.remember): fresh
+# for the first number of seconds, then served stale for up to the second
+# while one request recomputes it in the background
+CALCULATOR_CACHE_SECONDS = (300, 3600)
+RESULT_CACHE_SECONDS = (3600, 3600)
+
+# Calculator pages answer If-None-Match from a content version token kept in
+# the cache. Saves bump it; without a shared cache each process re-reads it
+# from the database after this many seconds.
+CONTENT_VERSION_TIMEOUT = 60
+
+# Minify HTML templates at load time (calculators.loaders.MinifyingLoader).
+# Off while debugging so template errors point at the right lines.
+TEMPLATE_MINIFY = not DEBUG
+
+# Self-hosted Bootstrap / Font Awesome (manage.py build_assets). Unmodified
+# vendor files are downloaded here once; the purged, content-hashed output in
+# calculators/static/build/ never changes under a given name, so serve
+# /static/build/ with "Cache-Control: public, max-age=31536000, immutable".
+# Without a build the pages fall back to the CDN copies.
+ASSETS_VENDOR_DIR = BASE_DIR / 'vendor'
+
+# Service worker (/sw.js): precaches the page shell, serves pages
+# stale-while-revalidate and queues calculation POSTs while offline. Off while
+# debugging so edited templates show up on the next reload.
+SERVICE_WORKER = not DEBUG
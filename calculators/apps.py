@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class CalculatorsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'calculators'
+
+    def ready(self):
+        from . import signals  # noqa: F401
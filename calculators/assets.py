@@ -0,0 +1,431 @@
+"""
+Self-hosted, trimmed builds of the vendor front-end assets.
+
+``manage.py build_assets`` scans the templates, forms and scripts for the CSS
+classes they use, drops every Bootstrap and Font Awesome rule that can't
+match any of them and subsets the icon fonts to the glyphs that are left.
+Output files carry a content hash in their name, so the web server can cache
+them as immutable, and ``assets.json`` maps logical names to those files for
+the ``{% asset_url %}`` tag.
+"""
+import hashlib
+import io
+import json
+import re
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Set
+
+from django.conf import settings
+
+APP_DIR = Path(__file__).resolve().parent
+BUILD_DIR = APP_DIR / 'static' / 'build'
+BUILD_MANIFEST = BUILD_DIR / 'assets.json'
+BUILD_STATIC_PREFIX = 'build/'
+
+BOOTSTRAP_CDN = 'https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist'
+FONT_AWESOME_CDN = 'https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0'
+
+# Logical asset name -> CDN URL, used to fetch sources and as the fallback
+# when no build has been made
+VENDOR_ASSETS = {
+    'bootstrap.css': f'{BOOTSTRAP_CDN}/css/bootstrap.min.css',
+    'bootstrap.js': f'{BOOTSTRAP_CDN}/js/bootstrap.bundle.min.js',
+    'fontawesome.css': f'{FONT_AWESOME_CDN}/css/all.min.css',
+    'fa-solid-900.woff2': f'{FONT_AWESOME_CDN}/webfonts/fa-solid-900.woff2',
+    'fa-regular-400.woff2': f'{FONT_AWESOME_CDN}/webfonts/fa-regular-400.woff2',
+    'fa-brands-400.woff2': f'{FONT_AWESOME_CDN}/webfonts/fa-brands-400.woff2',
+}
+FONT_AWESOME_FONTS = {
+    # Font file stem -> classes that select its style
+    'fa-solid-900': ('fa', 'fas', 'fa-solid'),
+    'fa-regular-400': ('far', 'fa-regular'),
+    'fa-brands-400': ('fab', 'fa-brands'),
+}
+
+# Classes Bootstrap's JavaScript adds at runtime for the components we use
+SAFELIST = frozenset({
+    'show', 'showing', 'hiding', 'fade', 'collapse', 'collapsing', 'collapsed',
+    'offcanvas-backdrop', 'modal-backdrop', 'modal-open', 'dropdown-menu-end',
+    'was-validated', 'is-valid', 'is-invalid',
+})
+
+# Classes pages use only as script hooks or markers; no stylesheet styles them
+UNSTYLED = frozenset({
+    'action-col', 'assignment-row', 'bmi-chart-container', 'bmi-gauge', 'clear-icon', 'credits-col',
+    'date-input', 'detailed-bmi-results', 'export-icon', 'form-fields', 'grade-col', 'header-text',
+    'hero', 'notification', 'plus-icon', 'points-col', 'preview-content', 'sample-icon', 'save-icon',
+    'section', 'subject-col', 'unit-label', 'weight-warning',
+})
+
+SCAN_SUFFIXES = ('.html', '.js', '.py')
+
+# Our own stylesheets; templates also carry rules in <style> blocks
+OWN_STYLESHEETS = (APP_DIR / 'static' / 'css' / 'style.css',)
+
+
+class UsedClasses(NamedTuple):
+    names: Set[str]
+    prefixes: Set[str]
+
+    def matches(self, name: str) -> bool:
+        return name in self.names or any(name.startswith(prefix) for prefix in self.prefixes)
+
+
+# Scanning sources for class names
+
+_DYNAMIC = '\x00'  # {{ value }} / ${value}: any text
+_BRANCH = '\x01'   # {% tag %}: one of the literal alternatives around it
+
+_CLASS_ATTR_RE = re.compile(r'''\bclass\s*=\s*(?:"([^"]*)"|'([^']*)')''')
+_CLASS_LIST_RE = re.compile(r'\bclassList\.(?:add|remove|toggle|contains|replace)\(([^)]*)\)')
+_CLASS_NAME_RE = re.compile(r'\bclassName\s*=\s*([^;\n]+)')
+_ATTRS_CLASS_RE = re.compile(r'''['"]class['"]\s*:\s*(?:"([^"]*)"|'([^']*)')''')
+_STRING_RE = re.compile(r'''"([^"\\\n]*)"|'([^'\\\n]*)'|`([^`\\]*)`''')
+_TEMPLATE_VAR_RE = re.compile(r'{{.*?}}|\${[^}]*}')
+_TEMPLATE_TAG_RE = re.compile(r'{%.*?%}')
+_CLASS_TOKEN_RE = re.compile(r'-?[A-Za-z_][\w-]*')
+
+
+def _class_tokens(value: str, used: UsedClasses):
+    """Add the classes in a class attribute value, template syntax included."""
+    value = _TEMPLATE_TAG_RE.sub(_BRANCH, _TEMPLATE_VAR_RE.sub(_DYNAMIC, value))
+    for token in value.split():
+        head, *branches = token.split(_BRANCH)
+        candidates = [head + branch for branch in branches if branch] if head else branches
+        if not branches or not candidates:
+            candidates.append(head)
+        for candidate in candidates:
+            if _DYNAMIC in candidate:
+                prefix = candidate.split(_DYNAMIC, 1)[0]
+                if prefix:
+                    used.prefixes.add(prefix)
+            elif _CLASS_TOKEN_RE.fullmatch(candidate):
+                used.names.add(candidate)
+
+
+def _string_literals(code: str) -> List[str]:
+    return [next(group for group in match.groups() if group is not None) for match in _STRING_RE.finditer(code)]
+
+
+def scan_source(text: str, used: UsedClasses):
+    """Collect class names from HTML, template, script or form source text."""
+    for pattern in (_CLASS_ATTR_RE, _ATTRS_CLASS_RE):
+        for match in pattern.finditer(text):
+            _class_tokens(match.group(1) if match.group(1) is not None else match.group(2), used)
+
+    for match in _CLASS_LIST_RE.finditer(text):
+        for literal in _string_literals(match.group(1)):
+            _class_tokens(literal, used)
+
+    for match in _CLASS_NAME_RE.finditer(text):
+        expression = match.group(1)
+        for literal in _string_literals(expression):
+            # 'bmi-' + category: everything starting with the literal is in use
+            if literal.endswith('-') and not literal.endswith(' '):
+                _class_tokens(literal + _DYNAMIC, used)
+            else:
+                _class_tokens(literal, used)
+
+
+def source_files() -> Iterable[Path]:
+    """Templates, scripts and Python modules that can put classes on a page."""
+    directories = [APP_DIR]
+    for engine in settings.TEMPLATES:
+        directories.extend(Path(directory) for directory in engine.get('DIRS', []))
+    for directory in directories:
+        for path in sorted(Path(directory).rglob('*')):
+            if (path.suffix in SCAN_SUFFIXES and path.is_file()
+                    and BUILD_DIR not in path.parents and 'migrations' not in path.parts):
+                yield path
+
+
+def collect_used_classes(paths: Iterable[Path] = None) -> UsedClasses:
+    used = UsedClasses(set(SAFELIST), set())
+    for path in (source_files() if paths is None else paths):
+        scan_source(path.read_text(encoding='utf-8', errors='replace'), used)
+    return used
+
+
+# CSS parsing and purging
+
+class Rule(NamedTuple):
+    """A qualified rule, an at-rule with a nested block, or a raw at-rule."""
+    prelude: str
+    body: Optional[str]
+    children: Optional[List['Rule']] = None
+
+    def render(self) -> str:
+        if self.children is not None:
+            return f"{self.prelude}{{{''.join(child.render() for child in self.children)}}}"
+        if self.body is None:
+            return f"{self.prelude};"
+        return f"{self.prelude}{{{self.body}}}"
+
+
+# At-rules whose blocks hold further rules rather than declarations
+_NESTED_AT_RULES = ('@media', '@supports', '@layer', '@container', '@document')
+
+
+def _skip_string(css: str, index: int) -> int:
+    quote = css[index]
+    index += 1
+    while index < len(css) and css[index] != quote:
+        index += 2 if css[index] == '\\' else 1
+    return index + 1
+
+
+def _block_end(css: str, index: int) -> int:
+    """Index just past the brace that closes the block opened at ``index``."""
+    depth = 0
+    while index < len(css):
+        char = css[index]
+        if char in '"\'':
+            index = _skip_string(css, index)
+            continue
+        if char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                return index + 1
+        index += 1
+    raise ValueError('Unbalanced braces in stylesheet')
+
+
+def parse_css(css: str) -> List[Rule]:
+    """Split a stylesheet into rules, recursing into @media and similar blocks."""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.DOTALL)
+    rules = []
+    index = 0
+    while index < len(css):
+        while index < len(css) and css[index].isspace():
+            index += 1
+        if index >= len(css):
+            break
+
+        start = index
+        while index < len(css) and css[index] not in '{;':
+            index = _skip_string(css, index) if css[index] in '"\'' else index + 1
+        prelude = css[start:index].strip()
+        if index >= len(css) or css[index] == ';':
+            # @charset / @import / @layer a, b;
+            rules.append(Rule(prelude, None))
+            index += 1
+            continue
+
+        end = _block_end(css, index)
+        body = css[index + 1:end - 1]
+        if prelude.lower().startswith(_NESTED_AT_RULES):
+            rules.append(Rule(prelude, body, parse_css(body)))
+        else:
+            rules.append(Rule(prelude, body.strip()))
+        index = end
+    return rules
+
+
+def _split_top_level(text: str, separator: str = ',') -> List[str]:
+    parts, depth, start = [], 0, 0
+    for index, char in enumerate(text):
+        if char in '([':
+            depth += 1
+        elif char in ')]':
+            depth -= 1
+        elif char == separator and depth == 0:
+            parts.append(text[start:index])
+            start = index + 1
+    parts.append(text[start:])
+    return [part.strip() for part in parts if part.strip()]
+
+
+_NOT_RE = re.compile(r':not\(')
+_ATTRIBUTE_RE = re.compile(r'\[[^\]]*\]')
+_SELECTOR_CLASS_RE = re.compile(r'\.((?:[\w-]|\\.)+)')
+
+
+def selector_classes(selector: str) -> Set[str]:
+    """
+    Classes an element must have for the selector to match.
+
+    Classes inside :not(...) only exclude elements, so they are ignored.
+    """
+    while True:
+        match = _NOT_RE.search(selector)
+        if not match:
+            break
+        depth, index = 1, match.end()
+        while index < len(selector) and depth:
+            depth += {'(': 1, ')': -1}.get(selector[index], 0)
+            index += 1
+        selector = selector[:match.start()] + selector[index:]
+    selector = _ATTRIBUTE_RE.sub('', selector)
+    return {re.sub(r'\\(.)', r'\1', name) for name in _SELECTOR_CLASS_RE.findall(selector)}
+
+
+def defined_classes(rules: List[Rule]) -> Set[str]:
+    classes = set()
+    for rule in rules:
+        if rule.children is not None:
+            classes |= defined_classes(rule.children)
+        elif not rule.prelude.startswith('@'):
+            for selector in _split_top_level(rule.prelude):
+                classes |= selector_classes(selector)
+    return classes
+
+
+def purge_rules(rules: List[Rule], used: UsedClasses,
+                keep: Callable[[str], bool] = None) -> List[Rule]:
+    """
+    Rules whose selectors can match the used classes, trimmed to those selectors.
+
+    ``keep``, when given, is an extra test every kept selector and nested
+    at-rule prelude must pass.
+    """
+    kept = []
+    for rule in rules:
+        if rule.children is not None:
+            children = purge_rules(rule.children, used, keep) if keep is None or keep(rule.prelude) else []
+            if children:
+                kept.append(rule._replace(children=children))
+        elif rule.prelude.startswith('@'):
+            # @font-face, @keyframes and friends are pruned by prune_unreferenced
+            kept.append(rule)
+        else:
+            selectors = [
+                selector for selector in _split_top_level(rule.prelude)
+                if all(used.matches(name) for name in selector_classes(selector))
+                and (keep is None or keep(selector))
+            ]
+            if selectors:
+                kept.append(rule._replace(prelude=','.join(selectors)))
+    return kept
+
+
+_KEYFRAMES_RE = re.compile(r'@(?:-webkit-)?keyframes\s+([\w-]+)', re.IGNORECASE)
+_FONT_FAMILY_RE = re.compile(r'font-family\s*:\s*([^;]+)')
+
+
+def _referenced_name(rule: Rule) -> Optional[str]:
+    """Animation or font family name a @keyframes / @font-face rule defines."""
+    keyframes = _KEYFRAMES_RE.match(rule.prelude)
+    if keyframes:
+        return keyframes.group(1)
+    if rule.prelude.lower() == '@font-face':
+        family = _FONT_FAMILY_RE.search(rule.body)
+        return family.group(1).strip() if family else None
+    return None
+
+
+def prune_unreferenced(rules: List[Rule]) -> List[Rule]:
+    """Drop @keyframes and @font-face rules no remaining rule refers to."""
+    declarations = ''.join(rule.render() for rule in rules if _referenced_name(rule) is None)
+    kept = []
+    for rule in rules:
+        name = _referenced_name(rule)
+        if name and not re.search(rf'(?<![\w-]){re.escape(name)}(?![\w-])', declarations):
+            continue
+        kept.append(rule)
+    return kept
+
+
+def render_css(rules: List[Rule]) -> str:
+    return ''.join(rule.render() for rule in rules)
+
+
+# Icon fonts
+
+_CONTENT_RE = re.compile(r'content\s*:\s*"\\([0-9a-fA-F]{1,6})"')
+_FONT_URL_RE = re.compile(r'url\((["\']?)\.\./webfonts/([\w.-]+?)\.(woff2|ttf)\1\)\s*format\([^)]*\)')
+
+
+def icon_codepoints(rules: List[Rule]) -> Set[int]:
+    """Private-use code points the kept rules render through ``content``."""
+    return {int(code, 16) for code in _CONTENT_RE.findall(render_css(rules)) if int(code, 16) >= 0xE000}
+
+
+def used_font_stems(used: UsedClasses) -> List[str]:
+    return [stem for stem, classes in FONT_AWESOME_FONTS.items() if any(used.matches(name) for name in classes)]
+
+
+def subset_font(source: bytes, codepoints: Set[int]) -> Optional[bytes]:
+    """
+    WOFF2 font with only the given glyphs, or None when fontTools (with
+    brotli for WOFF2) isn't installed.
+    """
+    try:
+        from fontTools import subset
+        from fontTools.ttLib import TTFont
+
+        font = TTFont(io.BytesIO(source))
+        options = subset.Options()
+        options.flavor = 'woff2'
+        subsetter = subset.Subsetter(options)
+        subsetter.populate(unicodes=codepoints & set(font.getBestCmap()))
+        subsetter.subset(font)
+        output = io.BytesIO()
+        subset.save_font(font, output, options)
+    except ImportError:
+        return None
+    return output.getvalue()
+
+
+def rewrite_font_faces(rules: List[Rule], font_urls: Dict[str, str]) -> List[Rule]:
+    """
+    Point @font-face rules at the built fonts; faces for fonts that weren't
+    built (unused styles) are dropped.
+    """
+    kept = []
+    for rule in rules:
+        if rule.prelude.lower() != '@font-face':
+            kept.append(rule)
+            continue
+        stems = {match.group(2) for match in _FONT_URL_RE.finditer(rule.body)}
+        if not stems or not stems <= set(font_urls):
+            continue
+        stem = stems.pop()
+        body = re.sub(r'src\s*:[^;}]+', f'src:url({font_urls[stem]}) format("woff2")', rule.body)
+        kept.append(rule._replace(body=body))
+    return kept
+
+
+# Output
+
+def hashed_name(name: str, content: bytes) -> str:
+    stem, _, suffix = name.rpartition('.')
+    return f"{stem}.{hashlib.sha256(content).hexdigest()[:12]}.{suffix}"
+
+
+def write_hashed(directory: Path, name: str, content: bytes) -> str:
+    filename = hashed_name(name, content)
+    (directory / filename).write_bytes(content)
+    return filename
+
+
+def load_build_manifest(path: Path = BUILD_MANIFEST) -> Dict[str, str]:
+    try:
+        with open(path) as f:
+            return json.load(f)['assets']
+    except (OSError, ValueError, KeyError):
+        return {}
+
+
+_STYLE_BLOCK_RE = re.compile(r'<style[^>]*>(.*?)</style>', re.DOTALL | re.IGNORECASE)
+
+
+def own_classes(paths: Iterable[Path] = None) -> Set[str]:
+    """Classes defined by our stylesheets and by the templates' <style> blocks."""
+    classes = set()
+    for path in OWN_STYLESHEETS:
+        classes |= defined_classes(parse_css(path.read_text(encoding='utf-8')))
+    for path in (source_files() if paths is None else paths):
+        if path.suffix == '.html':
+            for block in _STYLE_BLOCK_RE.findall(path.read_text(encoding='utf-8', errors='replace')):
+                classes |= defined_classes(parse_css(block))
+    return classes
+
+
+def undefined_classes(used: UsedClasses, defined: Set[str]) -> Set[str]:
+    """
+    Used classes that no stylesheet defines (typos, or styles lost in a
+    vendor upgrade), apart from runtime and hook-only classes.
+    """
+    return used.names - defined - SAFELIST - UNSTYLED
@@ -0,0 +1,269 @@
+import csv
+import math
+from bisect import bisect_right
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Union
+
+from .metabolic import INCHES_TO_CM, LBS_TO_KG
+
+LMS_TABLE_PATH = Path(__file__).resolve().parent / 'data' / 'cdc_bmi_for_age.csv'
+
+# Adult categories, lowest first; a BMI belongs to the last threshold it reaches
+ADULT_THRESHOLDS = (18.5, 25.0, 30.0)
+ADULT_CATEGORIES = tuple(MappingProxyType(record) for record in (
+    {
+        'category': 'Underweight',
+        'color': 'info',
+        'description': 'Below normal weight range',
+        'recommendation': 'Consider consulting a healthcare provider about healthy weight gain.',
+        'range': 'Below 18.5'
+    },
+    {
+        'category': 'Normal weight',
+        'color': 'success',
+        'description': 'Within healthy weight range',
+        'recommendation': 'Maintain your current lifestyle with balanced diet and regular exercise.',
+        'range': '18.5 - 24.9'
+    },
+    {
+        'category': 'Overweight',
+        'color': 'warning',
+        'description': 'Above normal weight range',
+        'recommendation': 'Consider a balanced diet and increased physical activity.',
+        'range': '25.0 - 29.9'
+    },
+    {
+        'category': 'Obese',
+        'color': 'danger',
+        'description': 'Significantly above normal weight range',
+        'recommendation': 'Consult a healthcare provider for personalized weight management advice.',
+        'range': '30.0 and above'
+    },
+))
+
+# CDC weight status categories for children and teens, by BMI-for-age percentile
+PEDIATRIC_THRESHOLDS = (5.0, 85.0, 95.0)
+PEDIATRIC_CATEGORIES = tuple(MappingProxyType(record) for record in (
+    {
+        'category': 'Underweight',
+        'color': 'info',
+        'description': 'Below the 5th percentile for age and sex',
+        'recommendation': 'Talk to a pediatrician about healthy growth and nutrition.',
+        'range': 'Below 5th percentile'
+    },
+    {
+        'category': 'Healthy weight',
+        'color': 'success',
+        'description': 'Between the 5th and 85th percentile for age and sex',
+        'recommendation': 'Keep up balanced meals and at least an hour of activity a day.',
+        'range': '5th to less than 85th percentile'
+    },
+    {
+        'category': 'Overweight',
+        'color': 'warning',
+        'description': 'Between the 85th and 95th percentile for age and sex',
+        'recommendation': 'Focus on healthy family habits and check in with a pediatrician.',
+        'range': '85th to less than 95th percentile'
+    },
+    {
+        'category': 'Obesity',
+        'color': 'danger',
+        'description': 'At or above the 95th percentile for age and sex',
+        'recommendation': 'Consult a pediatrician for a personalized plan.',
+        'range': '95th percentile and above'
+    },
+))
+
+SEX_CODES = {'male': '1', 'female': '2'}
+
+
+def adult_category(bmi: float) -> Mapping[str, str]:
+    """Shared, read-only category record for an adult BMI."""
+    return ADULT_CATEGORIES[bisect_right(ADULT_THRESHOLDS, bmi)]
+
+
+def pediatric_category(percentile: float) -> Mapping[str, str]:
+    """Shared, read-only category record for a BMI-for-age percentile."""
+    return PEDIATRIC_CATEGORIES[bisect_right(PEDIATRIC_THRESHOLDS, percentile)]
+
+
+def body_mass_index(weight: float, height: float, unit_system: str = 'metric') -> float:
+    """
+    Unrounded BMI from weight and height.
+
+    Metric takes kg and cm, imperial takes lbs and inches.
+    """
+    if unit_system == 'imperial':
+        weight = weight * LBS_TO_KG
+        height = height * INCHES_TO_CM
+    elif unit_system != 'metric':
+        raise ValueError(f"Unknown unit system: {unit_system}")
+    if weight <= 0 or height <= 0:
+        raise ValueError("Weight and height must be greater than 0")
+
+    height_m = height / 100
+    return weight / (height_m * height_m)
+
+
+@lru_cache(maxsize=None)
+def _lms_table() -> Dict[str, tuple]:
+    """
+    Load the CDC LMS reference once into parallel (ages, L, M, S) tuples per sex.
+    """
+    columns = {code: ([], [], [], []) for code in SEX_CODES.values()}
+    with open(LMS_TABLE_PATH, newline='') as table:
+        rows = csv.DictReader(line for line in table if not line.startswith('#'))
+        for row in rows:
+            ages, l_values, m_values, s_values = columns[row['Sex']]
+            ages.append(float(row['Agemos']))
+            l_values.append(float(row['L']))
+            m_values.append(float(row['M']))
+            s_values.append(float(row['S']))
+
+    return {
+        sex: tuple(tuple(column) for column in zip(*sorted(zip(*values))))
+        for sex, values in columns.items()
+    }
+
+
+def lms_at(sex: str, age_months: float):
+    """
+    L, M and S for a sex and age, linearly interpolated between table rows.
+    """
+    try:
+        ages, l_values, m_values, s_values = _lms_table()[SEX_CODES[sex]]
+    except KeyError:
+        raise ValueError("Sex must be 'male' or 'female'")
+    if not ages[0] <= age_months <= ages[-1]:
+        raise ValueError(
+            f"BMI-for-age is only defined from {ages[0]:g} to {ages[-1]:g} months"
+        )
+
+    index = bisect_right(ages, age_months)
+    if index == len(ages):
+        return l_values[-1], m_values[-1], s_values[-1]
+
+    low, high = index - 1, index
+    fraction = (age_months - ages[low]) / (ages[high] - ages[low])
+    return tuple(
+        values[low] + (values[high] - values[low]) * fraction
+        for values in (l_values, m_values, s_values)
+    )
+
+
+def bmi_for_age(bmi: float, sex: str, age_months: float) -> Dict[str, Any]:
+    """
+    BMI-for-age z-score, percentile and weight category for a child or teen.
+
+    Uses the LMS method: z = ((BMI / M) ** L - 1) / (L * S).
+    """
+    l_value, m_value, s_value = lms_at(sex, age_months)
+    if l_value:
+        z_score = ((bmi / m_value) ** l_value - 1) / (l_value * s_value)
+    else:
+        z_score = math.log(bmi / m_value) / s_value
+    percentile = 50 * (1 + math.erf(z_score / math.sqrt(2)))
+
+    return {
+        'z_score': round(z_score, 2),
+        'percentile': round(percentile, 1),
+        'median_bmi': round(m_value, 1),
+        **pediatric_category(percentile)
+    }
+
+
+def roster_columns(people: Iterable[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """
+    Turn a list of person dicts into the columns evaluate_batch expects.
+
+    Each person has 'weight', 'height' and optionally 'unit_system'
+    ('metric' or 'imperial'). Children also give 'sex' and either
+    'age_months' or 'age' (years) to be scored against BMI-for-age.
+    """
+    columns = {'weight': [], 'height': [], 'unit_system': [], 'sex': [], 'age_months': []}
+    for person in people:
+        age_months = person.get('age_months')
+        if age_months in (None, '') and person.get('age') not in (None, ''):
+            age_months = float(person['age']) * 12
+
+        columns['weight'].append(float(person['weight']))
+        columns['height'].append(float(person['height']))
+        columns['unit_system'].append(person.get('unit_system') or 'metric')
+        columns['sex'].append(person.get('sex') or None)
+        columns['age_months'].append(None if age_months in (None, '') else float(age_months))
+    return columns
+
+
+def evaluate_batch(weight: Sequence[float], height: Sequence[float],
+                   unit_system: Union[str, Sequence[str]] = 'metric',
+                   sex: Optional[Sequence[Optional[str]]] = None,
+                   age_months: Optional[Sequence[Optional[float]]] = None) -> Dict[str, Any]:
+    """
+    Score many people in one call.
+
+    Inputs are parallel columns (one entry per person) and so are the
+    outputs. People with a sex and an age under 20 years are scored with
+    BMI-for-age percentiles; everyone else gets the adult category.
+
+    Returns:
+        Dictionary with 'count' and 'bmi', 'category', 'color', 'percentile',
+        'z_score' and 'error' columns (percentile and z-score are None for
+        adults), plus 'categories' counting people per category. A person
+        who cannot be scored, such as a child under the 24 months the CDC
+        reference starts at, gets None values and an error message instead
+        of failing the whole batch.
+    """
+    count = len(weight)
+    if len(height) != count:
+        raise ValueError("All input columns must have the same length")
+    if isinstance(unit_system, str):
+        unit_system = [unit_system] * count
+    if sex is None:
+        sex = [None] * count
+    if age_months is None:
+        age_months = [None] * count
+    if not (len(unit_system) == len(sex) == len(age_months) == count):
+        raise ValueError("All input columns must have the same length")
+
+    adult_from = _lms_table()[SEX_CODES['male']][0][-1]
+    bmis, categories, colors, percentiles, z_scores, errors = [], [], [], [], [], []
+    category_counts = {}
+
+    for values in zip(weight, height, unit_system, sex, age_months):
+        person_weight, person_height, units, person_sex, months = values
+        try:
+            bmi = body_mass_index(person_weight, person_height, units)
+            if person_sex and months is not None and months <= adult_from:
+                child = bmi_for_age(bmi, person_sex, months)
+                category, color = child['category'], child['color']
+                percentile, z_score = child['percentile'], child['z_score']
+            else:
+                record = adult_category(bmi)
+                category, color = record['category'], record['color']
+                percentile = z_score = None
+        except ValueError as e:
+            for column in (bmis, categories, colors, percentiles, z_scores):
+                column.append(None)
+            errors.append(str(e))
+            continue
+
+        bmis.append(round(bmi, 1))
+        categories.append(category)
+        colors.append(color)
+        percentiles.append(percentile)
+        z_scores.append(z_score)
+        errors.append(None)
+        category_counts[category] = category_counts.get(category, 0) + 1
+
+    return {
+        'count': count,
+        'bmi': bmis,
+        'category': categories,
+        'color': colors,
+        'percentile': percentiles,
+        'z_score': z_scores,
+        'error': errors,
+        'categories': category_counts
+    }
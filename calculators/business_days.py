@@ -0,0 +1,190 @@
+"""
+Business-day arithmetic for the date calculators.
+
+Each region's calendar covers 1900-01-01 to 2150-12-31 and is built once per
+process: a holiday bitmap (one bit per day) and a prefix array holding the
+number of business days before each day. Counting business days between two
+dates is then two array reads, and moving N business days from a date is a
+bisect on the prefix array.
+"""
+from array import array
+from bisect import bisect_left
+from datetime import date, timedelta
+from functools import lru_cache
+from itertools import accumulate
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Tuple
+
+FIRST_DAY = date(1900, 1, 1)
+LAST_DAY = date(2150, 12, 31)
+_FIRST = FIRST_DAY.toordinal()
+_DAYS = LAST_DAY.toordinal() - _FIRST + 1
+
+SATURDAY, SUNDAY = 5, 6
+
+Holidays = List[Tuple[date, str]]
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """The nth given weekday of a month; n = -1 is the last one."""
+    if n > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    last = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _observed(day: date) -> date:
+    """Federal observance: Saturday holidays move to Friday, Sunday ones to Monday."""
+    if day.weekday() == SATURDAY:
+        return day - timedelta(days=1)
+    if day.weekday() == SUNDAY:
+        return day + timedelta(days=1)
+    return day
+
+
+def us_federal_holidays(year: int) -> Holidays:
+    """
+    Observed US federal holidays in a year, following the dates each was
+    established and the 1971 move of several holidays to Mondays. A New
+    Year's Day that falls on Saturday is observed on December 31 of the
+    year before and is listed under the year before.
+    """
+    fixed = [(date(year, 7, 4), "Independence Day"), (date(year, 12, 25), "Christmas Day")]
+    holidays = []
+    if 1971 <= year <= 1977:
+        holidays.append((_nth_weekday(year, 10, 0, 4), "Veterans Day"))
+    elif year >= 1938:
+        fixed.append((date(year, 11, 11), "Veterans Day"))
+    if year >= 2021:
+        fixed.append((date(year, 6, 19), "Juneteenth National Independence Day"))
+
+    holidays.append((_nth_weekday(year, 9, 0, 1), "Labor Day"))
+    if year >= 1971:
+        holidays += [
+            (_nth_weekday(year, 2, 0, 3), "Washington's Birthday"),
+            (_nth_weekday(year, 5, 0, -1), "Memorial Day"),
+            (_nth_weekday(year, 10, 0, 2), "Columbus Day"),
+        ]
+    else:
+        fixed += [(date(year, 2, 22), "Washington's Birthday"), (date(year, 5, 30), "Memorial Day")]
+        if year >= 1937:
+            fixed.append((date(year, 10, 12), "Columbus Day"))
+    if year >= 1986:
+        holidays.append((_nth_weekday(year, 1, 0, 3), "Birthday of Martin Luther King, Jr."))
+    holidays.append((_nth_weekday(year, 11, 3, 4 if year >= 1942 else -1), "Thanksgiving Day"))
+
+    holidays += [(_observed(day), name) for day, name in fixed]
+    new_year = _observed(date(year + 1, 1, 1))
+    if new_year.year == year:
+        holidays.append((new_year, "New Year's Day"))
+    new_year = _observed(date(year, 1, 1))
+    if new_year.year == year:
+        holidays.append((new_year, "New Year's Day"))
+    return sorted(holidays)
+
+
+def no_holidays(year: int) -> Holidays:
+    return []
+
+
+# Region code -> (display name, holidays of a year)
+REGIONS: Mapping[str, Tuple[str, Callable[[int], Holidays]]] = MappingProxyType({
+    'us': ('United States (federal)', us_federal_holidays),
+    'weekdays': ('Weekends only', no_holidays),
+})
+DEFAULT_REGION = 'us'
+
+
+class BusinessCalendar:
+    """Holidays and business-day counts for one region over the supported range."""
+    __slots__ = ('region', '_holidays', '_prefix')
+
+    def __init__(self, region: str, holidays: Holidays):
+        self.region = region
+        self._holidays = bytearray((_DAYS + 7) // 8)
+        for day, _ in holidays:
+            if not FIRST_DAY <= day <= LAST_DAY:
+                continue
+            offset = day.toordinal() - _FIRST
+            self._holidays[offset >> 3] |= 1 << (offset & 7)
+
+        # FIRST_DAY is a Monday, so weekday(offset) = offset % 7
+        flags = (offset % 7 < 5 and not self._is_holiday(offset) for offset in range(_DAYS))
+        self._prefix = array('l', accumulate(flags, initial=0))
+
+    def _is_holiday(self, offset: int) -> bool:
+        return bool(self._holidays[offset >> 3] >> (offset & 7) & 1)
+
+    @staticmethod
+    def _offset(day: date) -> int:
+        offset = day.toordinal() - _FIRST
+        if not 0 <= offset < _DAYS:
+            raise ValueError(f"Business days are only available from {FIRST_DAY.year} to {LAST_DAY.year}")
+        return offset
+
+    def is_business_day(self, day: date) -> bool:
+        offset = self._offset(day)
+        return self._prefix[offset + 1] > self._prefix[offset]
+
+    def count(self, start: date, end: date) -> int:
+        """
+        Business days from ``start`` up to but not including ``end``;
+        negative when ``end`` is before ``start``.
+        """
+        return self._prefix[self._offset(end)] - self._prefix[self._offset(start)]
+
+    def add(self, start: date, days: int) -> date:
+        """
+        The date ``days`` business days after ``start`` (before it, for a
+        negative count). ``start`` itself is never counted, so adding 1 to a
+        Friday gives the next Monday unless that is a holiday.
+        """
+        offset = self._offset(start)
+        prefix = self._prefix
+        if days > 0:
+            target = prefix[offset + 1] + days
+            if target > prefix[-1]:
+                raise ValueError("The result is past the end of the supported range")
+            # First day whose running count reaches the target
+            return FIRST_DAY + timedelta(days=bisect_left(prefix, target) - 1)
+        if days < 0:
+            target = prefix[offset] + days
+            if target < 0:
+                raise ValueError("The result is before the start of the supported range")
+            # Last day that is itself business day number target
+            return FIRST_DAY + timedelta(days=bisect_left(prefix, target + 1) - 1)
+        return start
+
+
+@lru_cache(maxsize=None)
+def business_calendar(region: str = DEFAULT_REGION) -> BusinessCalendar:
+    """The calendar of a region, built on first use."""
+    try:
+        _, holidays_of = REGIONS[region]
+    except KeyError:
+        raise ValueError(f"Unknown region: {region}")
+    holidays = []
+    for year in range(FIRST_DAY.year - 1, LAST_DAY.year + 1):
+        holidays += holidays_of(year)
+    return BusinessCalendar(region, holidays)
+
+
+def business_day_summary(start: date, end: date, region: str = DEFAULT_REGION) -> Dict[str, object]:
+    """Business days, weekend days and weekday holidays from ``start`` to ``end``."""
+    calendar = business_calendar(region)
+    if start > end:
+        start, end = end, start
+    business = calendar.count(start, end)
+    total = (end - start).days
+    # Weekend days in [start, end): whole weeks plus the leftover days
+    weeks, extra = divmod(total, 7)
+    first = start.weekday()
+    weekend = 2 * weeks + sum(1 for i in range(extra) if (first + i) % 7 >= SATURDAY)
+    return {
+        'region': region,
+        'region_name': REGIONS[region][0],
+        'business_days': business,
+        'weekend_days': weekend,
+        'holidays': total - weekend - business,
+    }
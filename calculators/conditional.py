@@ -0,0 +1,96 @@
+import hashlib
+import uuid
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.messages.storage.cookie import CookieStorage
+from django.core.cache import cache
+from django.db.models import Count, Max
+from django.views.decorators.http import condition
+
+CONTENT_VERSION_KEY = 'calculators:content-version'
+APP_DIR = Path(__file__).resolve().parent
+
+
+def content_version() -> str:
+    """
+    Token that changes whenever page content in the database changes.
+
+    Signals replace it on every content save. When it is missing from the
+    cache (first request, or after CONTENT_VERSION_TIMEOUT) it is seeded from
+    the row counts and latest ``updated_at`` of Calculator and SEOContent, so
+    processes that don't share a cache still converge.
+    """
+    version = cache.get(CONTENT_VERSION_KEY)
+    if version is None:
+        from .models import Calculator, SEOContent
+
+        snapshot = [
+            model.objects.aggregate(count=Count('pk'), latest=Max('updated_at'))
+            for model in (Calculator, SEOContent)
+        ]
+        version = hashlib.md5(repr(snapshot).encode()).hexdigest()[:16]
+        cache.set(CONTENT_VERSION_KEY, version, settings.CONTENT_VERSION_TIMEOUT)
+    return version
+
+
+def bump_content_version():
+    """Invalidate every page ETag after a content change."""
+    cache.set(CONTENT_VERSION_KEY, uuid.uuid4().hex[:16], settings.CONTENT_VERSION_TIMEOUT)
+
+
+@lru_cache(maxsize=None)
+def _source_version() -> str:
+    # Templates, code and data files of the app; a deploy changes their mtimes
+    latest = max(
+        (path.stat().st_mtime_ns for path in APP_DIR.rglob('*')
+         if path.suffix in ('.html', '.xml', '.py', '.json', '.csv') and '__pycache__' not in path.parts),
+        default=0
+    )
+    return format(latest, 'x')
+
+
+def source_version() -> str:
+    """Token for the templates and code the pages are rendered from."""
+    if settings.DEBUG:
+        # Templates are edited in place during development
+        _source_version.cache_clear()
+    return _source_version()
+
+
+def page_etag(request, *args, **kwargs):
+    """
+    ETag for a page from version counters alone, without running the view.
+
+    Returns None (no conditional handling) for anything but GET/HEAD and when
+    flash messages are waiting to be shown, since those make the page
+    one-off. The CSRF cookie is part of the tag so a cached page never carries
+    a token for an old cookie.
+    """
+    if request.method not in ('GET', 'HEAD'):
+        return None
+    if CookieStorage.cookie_name in request.COOKIES:
+        return None
+
+    key = '|'.join((
+        content_version(),
+        source_version(),
+        request.get_full_path(),
+        request.COOKIES.get(settings.CSRF_COOKIE_NAME, ''),
+    ))
+    return hashlib.md5(key.encode()).hexdigest()
+
+
+def dated_page_etag(request, *args, **kwargs):
+    """page_etag for pages that render today's date, so the tag changes at midnight."""
+    etag = page_etag(request)
+    if etag is None:
+        return None
+    return hashlib.md5(f'{etag}|{date.today().isoformat()}'.encode()).hexdigest()
+
+
+# Answer If-None-Match with 304 before the view body runs
+versioned_page = condition(etag_func=page_etag)
+dated_page = condition(etag_func=dated_page_etag)
@@ -0,0 +1,163 @@
+"""
+Per-template critical CSS.
+
+``manage.py build_critical_css`` renders every page, takes the start of its
+body markup as a stand-in for what is above the fold, and keeps only the
+stylesheet rules that markup can use. The ``{% stylesheets %}`` tag inlines
+that CSS and loads the full stylesheets without blocking first paint.
+Entries are keyed by template and carry a fingerprint of the template files
+and stylesheet URLs they were built from. The fingerprints are checked once
+when the file is loaded, not per request; a stale entry is ignored until the
+next build.
+"""
+import hashlib
+import json
+import re
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from django.contrib.staticfiles import finders
+from django.template import loader
+from django.template.loader_tags import ExtendsNode
+from django.templatetags.static import static
+
+from .assets import (
+    BUILD_DIR, BUILD_STATIC_PREFIX, UsedClasses, load_build_manifest, parse_css, prune_unreferenced,
+    purge_rules, render_css, scan_source
+)
+
+CRITICAL_CSS_FILE = BUILD_DIR / 'critical.json'
+
+# Characters of body markup (scripts, styles and comments removed) treated as
+# above the fold. Covers the navigation, its hidden menus and the page header.
+ABOVE_THE_FOLD_CHARS = 16 * 1024
+
+# (asset name, static path): vendor assets go through the build manifest
+STYLESHEETS = (
+    ('bootstrap.css', None),
+    ('fontawesome.css', None),
+    (None, 'css/style.css'),
+)
+
+_rendered_templates: ContextVar[Optional[List[str]]] = ContextVar('rendered_templates', default=None)
+
+# Selectors and media that can't affect the first paint of an untouched page
+_INTERACTION_RE = re.compile(r':(?:hover|focus|focus-visible|focus-within|active|checked|invalid|valid)\b')
+_ATTRIBUTE_NAME_RE = re.compile(r'\[\s*([\w-]+)')
+_MARKUP_ATTRIBUTE_RE = re.compile(r'\s([\w-]+)(?==|[\s>/])')
+
+_BODY_RE = re.compile(r'<body\b.*', re.DOTALL | re.IGNORECASE)
+_NON_VISUAL_RE = re.compile(r'<(script|style|noscript)\b.*?</\1\s*>|<!--.*?-->', re.DOTALL | re.IGNORECASE)
+
+
+def stylesheet_urls() -> List[str]:
+    from .templatetags.assets import asset_url
+
+    return [asset_url(name) if name else static(path) for name, path in STYLESHEETS]
+
+
+def stylesheet_files(vendor_dir: Path) -> List[Path]:
+    """Files of the stylesheets the pages link to, in order."""
+    built = load_build_manifest()
+    files = []
+    for name, path in STYLESHEETS:
+        if name in built:
+            files.append(BUILD_DIR / built[name][len(BUILD_STATIC_PREFIX):])
+        elif name:
+            files.append(vendor_dir / name)
+        else:
+            files.append(Path(finders.find(path)))
+    return files
+
+
+def template_files(name: str) -> List[str]:
+    """Source files of a template and the templates it extends."""
+    files = []
+    template = loader.get_template(name).template
+    while template is not None:
+        files.append(template.origin.name)
+        extends = next((node for node in template.nodelist if isinstance(node, ExtendsNode)), None)
+        parent = extends.parent_name.var if extends else None
+        template = loader.get_template(parent).template if isinstance(parent, str) else None
+    return files
+
+
+def fingerprint(files: Iterable[str], urls: Iterable[str]) -> str:
+    parts = []
+    for file in files:
+        try:
+            parts.append(f'{file}:{Path(file).stat().st_mtime_ns}')
+        except OSError:
+            parts.append(file)
+    return hashlib.md5('|'.join([*parts, *urls]).encode()).hexdigest()
+
+
+def above_the_fold(html: str, limit: int = ABOVE_THE_FOLD_CHARS) -> str:
+    body = _BODY_RE.search(html)
+    return _NON_VISUAL_RE.sub('', body.group(0) if body else html)[:limit]
+
+
+def _first_paint_filter(markup: str):
+    attributes = set(_MARKUP_ATTRIBUTE_RE.findall(markup))
+
+    def keep(selector: str) -> bool:
+        if selector.startswith('@'):
+            return not selector.lower().startswith('@media print')
+        return (not _INTERACTION_RE.search(selector)
+                and set(_ATTRIBUTE_NAME_RE.findall(selector)) <= attributes)
+    return keep
+
+
+def extract_critical_css(html: str, stylesheets: Iterable[str], limit: int = ABOVE_THE_FOLD_CHARS) -> str:
+    """
+    Rules from the stylesheets that the above-the-fold markup can match on
+    first paint: no interaction states, print styles, or attribute selectors
+    for attributes the markup doesn't use.
+    """
+    markup = above_the_fold(html, limit)
+    used = UsedClasses(set(), set())
+    scan_source(markup, used)
+    keep = _first_paint_filter(markup)
+    return ''.join(
+        render_css(prune_unreferenced(purge_rules(parse_css(css), used, keep))) for css in stylesheets
+    )
+
+
+def load_critical_css(path: Path = CRITICAL_CSS_FILE) -> Dict[str, Dict]:
+    try:
+        with open(path) as f:
+            return json.load(f)['templates']
+    except (OSError, ValueError, KeyError):
+        return {}
+
+
+def save_critical_css(entries: Dict[str, Dict], path: Path = CRITICAL_CSS_FILE):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump({'templates': entries}, f, indent=2)
+
+
+def current_critical_css(entries: Dict[str, Dict], urls: Iterable[str]) -> Dict[str, str]:
+    """Inline CSS by template, leaving out entries whose sources changed since the build."""
+    urls = list(urls)
+    return {name: entry['css'] for name, entry in entries.items()
+            if entry['fingerprint'] == fingerprint(entry['files'], urls)}
+
+
+def record_template(name: str):
+    names = _rendered_templates.get()
+    if names is not None:
+        names.append(name)
+
+
+@contextmanager
+def recording_templates() -> Iterator[List[str]]:
+    """Collect the names of the page templates rendered inside the block."""
+    token = _rendered_templates.set([])
+    try:
+        yield _rendered_templates.get()
+    finally:
+        _rendered_templates.reset(token)
+
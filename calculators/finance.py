@@ -0,0 +1,134 @@
+"""
+Fixed-point money arithmetic for the loan, mortgage and 401k calculators.
+
+Amounts are integer cents and rates are exact fractions of the numbers as
+entered (6.5% is 13/200, not the nearest binary float). Each period's
+interest is rounded half to even (banker's rounding) to whole cents, and the
+last payment absorbs whatever rounding leaves, so a schedule always ends at
+exactly zero and its totals add up to the cent. Compounding for the level
+payment uses integer fixed point instead of float ``**``, so results are the
+same on every platform.
+"""
+from fractions import Fraction
+from typing import List, NamedTuple, Sequence, Tuple, Union
+
+Number = Union[int, float, str, Fraction]
+
+# Fixed-point scale for compounded growth factors
+_SCALE = 10 ** 18
+# Longest schedule amortize() builds: a century of daily payments
+MAX_PERIODS = 100 * 365
+
+
+def div_half_even(numerator: int, denominator: int) -> int:
+    """numerator / denominator rounded to the nearest integer, ties to even."""
+    if denominator < 0:
+        numerator, denominator = -numerator, -denominator
+    quotient, remainder = divmod(numerator, denominator)
+    twice = 2 * remainder
+    if twice > denominator or (twice == denominator and quotient % 2):
+        quotient += 1
+    return quotient
+
+
+def ratio(value: Number) -> Fraction:
+    """The exact decimal value of a number as entered."""
+    if isinstance(value, float):
+        return Fraction(repr(value))
+    return Fraction(value)
+
+
+def to_cents(amount: Number) -> int:
+    value = ratio(amount) * 100
+    return div_half_even(value.numerator, value.denominator)
+
+
+def to_dollars(cents: int) -> float:
+    return cents / 100
+
+
+def periodic_rate(annual_percent: Number, periods_per_year: int = 1) -> Fraction:
+    """Rate per period from an annual percentage."""
+    return ratio(annual_percent) / 100 / periods_per_year
+
+
+def apply_rate(cents: int, rate: Fraction) -> int:
+    """cents * rate, rounded half to even to whole cents."""
+    return div_half_even(cents * rate.numerator, rate.denominator)
+
+
+def _growth(rate: Fraction, periods: int) -> int:
+    """(1 + rate) ** periods in fixed point, by repeated squaring."""
+    base = _SCALE + div_half_even(rate.numerator * _SCALE, rate.denominator)
+    result = _SCALE
+    while periods:
+        if periods & 1:
+            result = div_half_even(result * base, _SCALE)
+        base = div_half_even(base * base, _SCALE)
+        periods >>= 1
+    return result
+
+
+def level_payments(principals: Sequence[int], rate: Fraction, periods: int) -> List[int]:
+    """
+    Level payment in cents that pays off each principal (in cents) over
+    ``periods`` payments at ``rate`` per period. The growth factor is
+    computed once for the whole batch.
+    """
+    if periods <= 0:
+        raise ValueError("The number of payments must be positive")
+    if rate == 0:
+        return [div_half_even(principal, periods) for principal in principals]
+
+    growth = _growth(rate, periods)
+    numerator = rate.numerator * growth
+    denominator = rate.denominator * (growth - _SCALE)
+    return [div_half_even(principal * numerator, denominator) for principal in principals]
+
+
+def level_payment(principal: int, rate: Fraction, periods: int) -> int:
+    return level_payments((principal,), rate, periods)[0]
+
+
+class Schedule(NamedTuple):
+    """Amortization schedule in cents, one column entry per period."""
+    payment: Tuple[int, ...]
+    principal: Tuple[int, ...]
+    interest: Tuple[int, ...]
+    balance: Tuple[int, ...]
+
+    @property
+    def total_paid(self) -> int:
+        return sum(self.payment)
+
+    @property
+    def total_interest(self) -> int:
+        return sum(self.interest)
+
+
+def amortize(principal: int, rate: Fraction, periods: int, payment: int = None) -> Schedule:
+    """
+    Full schedule for a loan of ``principal`` cents, paying ``payment`` cents
+    (the level payment by default) each period. The final payment is
+    whatever clears the balance.
+    """
+    if periods > MAX_PERIODS:
+        raise ValueError(f"A schedule can have at most {MAX_PERIODS} payments")
+    if payment is None:
+        payment = level_payment(principal, rate, periods)
+    numerator, denominator = rate.numerator, rate.denominator
+
+    payments, principals, interests, balances = [], [], [], []
+    balance = principal
+    for period in range(1, periods + 1):
+        # div_half_even, inlined: this loop is the hot path
+        interest, remainder = divmod(balance * numerator, denominator)
+        if 2 * remainder > denominator or (2 * remainder == denominator and interest & 1):
+            interest += 1
+        amount = balance + interest if period == periods else min(payment, balance + interest)
+        balance -= amount - interest
+        payments.append(amount)
+        principals.append(amount - interest)
+        interests.append(interest)
+        balances.append(balance)
+    return Schedule(tuple(payments), tuple(principals), tuple(interests), tuple(balances))
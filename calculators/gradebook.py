@@ -0,0 +1,181 @@
+import csv
+import statistics
+from operator import mul
+from typing import Any, Dict, Iterable, List, Optional
+
+from .grading import get_grade_scale
+
+PERCENTILES = (10, 25, 50, 75, 90)
+
+
+def parse_gradebook_csv(lines: Iterable[str]) -> Dict[str, Any]:
+    """
+    Parse a wide gradebook CSV into assignments and student score rows.
+
+    The header row is ``student`` followed by one column per assignment. Rows
+    whose first cell is ``max_points`` or ``weight`` describe the assignments
+    (max points default to 100); every other row is one student's scores.
+    Blank scores count as zero.
+    """
+    reader = csv.reader(lines)
+    header = next(reader, None)
+    if not header or len(header) < 2:
+        raise ValueError("Gradebook needs a header row with at least one assignment")
+
+    names = [name.strip() for name in header[1:]]
+    max_points = None
+    weights = None
+    students = []
+
+    for row in reader:
+        if not row or not any(cell.strip() for cell in row):
+            continue
+        label = row[0].strip()
+        values = row[1:len(names) + 1]
+        values += [''] * (len(names) - len(values))
+
+        if label.lower() == 'max_points':
+            max_points = values
+        elif label.lower() == 'weight':
+            weights = values
+        else:
+            students.append({'name': label, 'scores': values})
+
+    if weights is None:
+        raise ValueError("Gradebook needs a weight row")
+
+    assignments = [
+        {
+            'name': name,
+            'max_points': max_points[i] if max_points and max_points[i].strip() else 100,
+            'weight': weights[i]
+        }
+        for i, name in enumerate(names)
+    ]
+    return {'assignments': assignments, 'students': students}
+
+
+def _score(value):
+    if value is None or value == '':
+        return 0.0
+    return float(value)
+
+
+def _histogram(values: List[float], bin_width: int = 10) -> List[Dict[str, Any]]:
+    bins = [0] * (100 // bin_width)
+    last = len(bins) - 1
+    for value in values:
+        index = int(value // bin_width)
+        bins[min(max(index, 0), last)] += 1
+    return [
+        {'range': f'{i * bin_width}-{i * bin_width + bin_width}', 'count': count}
+        for i, count in enumerate(bins)
+    ]
+
+
+def calculate_gradebook(assignments: List[Dict[str, Any]], students: List[Dict[str, Any]],
+                        scale: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Calculate weighted final grades, letters and GPAs for a whole class.
+
+    Args:
+        assignments: List of dicts with 'name', 'max_points', 'weight'
+        students: List of dicts with 'name' and 'scores' (one per assignment)
+        scale: Grade scale key for letters and grade points (default if None)
+
+    Returns:
+        Dictionary with per-student results and class-level distributions
+    """
+    try:
+        grade_scale = get_grade_scale(scale)
+        passing_grade = grade_scale.cutoffs[0]
+
+        if not assignments:
+            raise ValueError("No assignments provided")
+        if not students:
+            raise ValueError("No students provided")
+
+        column_count = len(assignments)
+        max_points = [float(a['max_points']) for a in assignments]
+        weights = [float(a['weight']) for a in assignments]
+
+        if any(points <= 0 for points in max_points):
+            raise ValueError("Max points must be greater than 0")
+        total_weight = sum(weights)
+        if total_weight == 0:
+            raise ValueError("Total weight cannot be zero")
+
+        # Each score contributes score / max_points * weight percentage points,
+        # so one coefficient per column turns a row into its final grade.
+        coefficients = [w / p for w, p in zip(weights, max_points)]
+
+        rows = []
+        for student in students:
+            scores = [_score(s) for s in student['scores']]
+            if len(scores) != column_count:
+                raise ValueError(f"Expected {column_count} scores for {student['name']}")
+            rows.append(scores)
+
+        # Validate and summarise column by column
+        assignment_stats = []
+        for assignment, points, column in zip(assignments, max_points, zip(*rows)):
+            if min(column) < 0 or max(column) > points:
+                raise ValueError(f"Scores for {assignment['name']} must be between 0 and {points:g}")
+            assignment_stats.append({
+                'name': assignment['name'],
+                'average_percentage': round(sum(column) / len(column) / points * 100, 2)
+            })
+
+        finals = [sum(map(mul, row, coefficients)) for row in rows]
+        letter_for = grade_scale.letter_for
+        grade_point = grade_scale.grade_point
+        letters = [letter_for(grade) for grade in finals]
+        gpas = [grade_point(letter) for letter in letters]
+
+        letter_counts = dict.fromkeys(reversed(grade_scale.letters), 0)
+        for letter in letters:
+            letter_counts[letter] += 1
+
+        student_results = [
+            {
+                'name': student['name'],
+                'final_grade': round(final, 2),
+                'letter_grade': letter,
+                'gpa': gpa,
+                'passing': final >= passing_grade
+            }
+            for student, final, letter, gpa in zip(students, finals, letters, gpas)
+        ]
+
+        if len(finals) > 1:
+            cut_points = statistics.quantiles(finals, n=100, method='inclusive')
+            percentiles = {f'p{p}': round(cut_points[p - 1], 2) for p in PERCENTILES}
+            stdev = statistics.stdev(finals)
+        else:
+            percentiles = {f'p{p}': round(finals[0], 2) for p in PERCENTILES}
+            stdev = 0.0
+
+        passing_count = sum(1 for final in finals if final >= passing_grade)
+
+        return {
+            'students': student_results,
+            'assignments': assignment_stats,
+            'student_count': len(finals),
+            'scale': grade_scale.key,
+            'total_weight': round(total_weight, 1),
+            'distribution': {
+                'mean': round(sum(finals) / len(finals), 2),
+                'median': round(statistics.median(finals), 2),
+                'stdev': round(stdev, 2),
+                'min': round(min(finals), 2),
+                'max': round(max(finals), 2),
+                'percentiles': percentiles,
+                'histogram': _histogram(finals),
+                'letter_grades': letter_counts,
+                'average_gpa': round(sum(gpas) / len(gpas), 2),
+                'pass_rate': round(passing_count / len(finals) * 100, 1)
+            }
+        }
+
+    except (KeyError, ValueError, TypeError) as e:
+        raise ValueError(f"Invalid gradebook: {str(e)}")
@@ -0,0 +1,145 @@
+from bisect import bisect_right
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Optional
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+DEFAULT_SCALE = '4.0'
+
+# Letter -> grade points on the common 4.0 scale. D- earns 0.7 like the other
+# minus grades; the original table had it at 0.0, the same as an F.
+_FOUR_POINT = {
+    'A+': 4.0, 'A': 4.0, 'A-': 3.7,
+    'B+': 3.3, 'B': 3.0, 'B-': 2.7,
+    'C+': 2.3, 'C': 2.0, 'C-': 1.7,
+    'D+': 1.3, 'D': 1.0, 'D-': 0.7,
+    'F': 0.0
+}
+
+# Minimum percentage for each letter, best letter first
+_PLUS_MINUS_CUTOFFS = (
+    ('A+', 97), ('A', 93), ('A-', 90),
+    ('B+', 87), ('B', 83), ('B-', 80),
+    ('C+', 77), ('C', 73), ('C-', 70),
+    ('D+', 67), ('D', 63), ('D-', 60),
+    ('F', 0)
+)
+
+BUILTIN_SCALES = {
+    '4.0': {
+        'name': 'Standard 4.0 scale',
+        'points': _FOUR_POINT,
+        'cutoffs': _PLUS_MINUS_CUTOFFS
+    },
+    '4.3': {
+        'name': '4.3 scale (A+ = 4.3)',
+        'points': {**_FOUR_POINT, 'A+': 4.3},
+        'cutoffs': _PLUS_MINUS_CUTOFFS
+    },
+    '5.0': {
+        'name': 'Weighted 5.0 scale (honors/AP)',
+        'points': {letter: points + 1.0 if points else 0.0 for letter, points in _FOUR_POINT.items()},
+        'cutoffs': _PLUS_MINUS_CUTOFFS
+    },
+    'letter': {
+        'name': 'Letter grades without plus/minus',
+        'points': {'A': 4.0, 'B': 3.0, 'C': 2.0, 'D': 1.0, 'F': 0.0},
+        'cutoffs': (('A', 90), ('B', 80), ('C', 70), ('D', 60), ('F', 0))
+    },
+    'seven_point': {
+        'name': '7-point letter scale',
+        'points': {'A': 4.0, 'B': 3.0, 'C': 2.0, 'D': 1.0, 'F': 0.0},
+        'cutoffs': (('A', 93), ('B', 85), ('C', 77), ('D', 70), ('F', 0))
+    },
+}
+
+
+class GradeScale:
+    """
+    Grade scale: letter -> grade points plus percentage -> letter.
+
+    Tables are read-only mappings and tuples built once per process, and
+    percentage lookups bisect the sorted cut-offs.
+    """
+
+    __slots__ = ('key', 'name', 'points', 'letters', 'cutoffs', 'top')
+
+    def __init__(self, key: str, name: str, points: Dict[str, float], cutoffs):
+        ordered = sorted(cutoffs, key=lambda cutoff: cutoff[1])
+        if not ordered or ordered[0][1] != 0:
+            raise ValueError(f"Grade scale {key} needs a letter starting at 0%")
+
+        self.key = key
+        self.name = name
+        self.points = MappingProxyType({letter: float(value) for letter, value in points.items()})
+        self.letters = tuple(letter for letter, _ in ordered)
+        self.cutoffs = tuple(float(minimum) for _, minimum in ordered[1:])
+        self.top = max(self.points.values())
+
+    def __repr__(self):
+        return f"<GradeScale {self.key}>"
+
+    def grade_point(self, letter: str, default: Optional[float] = 0.0) -> Optional[float]:
+        """
+        Grade points for a letter, or ``default`` if the scale lacks it. On
+        scales without plus/minus, A- and B+ count as their base letter.
+        """
+        points = self.points.get(letter)
+        if points is None and letter[1:] in ('+', '-'):
+            points = self.points.get(letter[0])
+        return default if points is None else points
+
+    def letter_for(self, percentage: float) -> str:
+        """Letter grade earned by a percentage."""
+        return self.letters[bisect_right(self.cutoffs, percentage)]
+
+    def points_for_percentage(self, percentage: float) -> float:
+        """Linear percentage -> grade points conversion (100% = top of scale)."""
+        return percentage * self.top / 100
+
+    def percentage_for_points(self, points: float) -> float:
+        """Linear grade points -> percentage conversion."""
+        return points * 100 / self.top
+
+
+@lru_cache(maxsize=None)
+def _load_scales() -> MappingProxyType:
+    definitions = dict(BUILTIN_SCALES)
+    # Projects can add or override scales in settings without code changes
+    definitions.update(getattr(settings, 'GRADE_SCALES', {}))
+    return MappingProxyType({
+        key: GradeScale(key, spec.get('name', key), spec['points'], spec['cutoffs'])
+        for key, spec in definitions.items()
+    })
+
+
+@receiver(setting_changed)
+def _reload_scales(*, setting, **kwargs):
+    if setting == 'GRADE_SCALES':
+        _load_scales.cache_clear()
+
+
+def available_scales() -> Dict[str, str]:
+    """Map of scale key -> human readable name."""
+    return {key: scale.name for key, scale in _load_scales().items()}
+
+
+def scale_tables() -> Dict[str, Dict]:
+    """Every scale's name, letter -> points table and top, for client-side GPA maths."""
+    return {
+        key: {'name': scale.name, 'points': dict(scale.points), 'top': scale.top}
+        for key, scale in _load_scales().items()
+    }
+
+
+def get_grade_scale(key: Optional[str] = None) -> GradeScale:
+    """Return the grade scale for ``key`` (the configured default if empty)."""
+    if not key:
+        key = getattr(settings, 'DEFAULT_GRADE_SCALE', DEFAULT_SCALE)
+    try:
+        return _load_scales()[key]
+    except KeyError:
+        raise ValueError(f"Unknown grade scale: {key}")
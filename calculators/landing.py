@@ -0,0 +1,66 @@
+import json
+from itertools import product
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Tuple
+
+from django.conf import settings
+from django.utils.text import slugify
+
+from .permalinks import PERMALINKS, canonical_params
+
+LANDING_PAGES_SOURCE = Path(__file__).resolve().parent / 'data' / 'landing_pages.json'
+SITEMAP_INDEX = 'sitemap-landing.xml'
+
+
+class LandingPage(NamedTuple):
+    calculator: str
+    slug: str
+    title: str
+    description: str
+    params: Tuple[Tuple[str, str], ...]
+
+    @property
+    def path(self) -> str:
+        return f"/{self.calculator}/{self.slug}/"
+
+
+def landing_root() -> Path:
+    """Directory the generated pages are written to and served from."""
+    return Path(getattr(settings, 'LANDING_PAGES_ROOT', settings.BASE_DIR / 'landing'))
+
+
+def expand_spec(spec: Dict[str, Any]) -> Iterator[LandingPage]:
+    """
+    Yield one landing page per combination of a spec's inputs.
+
+    ``inputs`` maps permalink query keys to a value or a list of values; every
+    combination of the lists becomes a page. ``slug``, ``title`` and
+    ``description`` are str.format templates over the same keys.
+    """
+    calculator = spec['calculator']
+    if calculator not in PERMALINKS:
+        raise ValueError(f"{calculator} has no result permalinks")
+
+    keys = list(spec['inputs'])
+    choices = [value if isinstance(value, list) else [value] for value in spec['inputs'].values()]
+    for values in product(*choices):
+        inputs = dict(zip(keys, values))
+        yield LandingPage(
+            calculator=calculator,
+            slug=slugify(spec['slug'].format(**inputs).replace('.', '-')),
+            title=spec['title'].format(**inputs),
+            description=spec['description'].format(**inputs),
+            params=tuple(canonical_params(calculator, inputs))
+        )
+
+
+def load_landing_pages(source: Path = LANDING_PAGES_SOURCE) -> List[LandingPage]:
+    """All landing pages described by the source file, duplicates removed."""
+    with open(source) as f:
+        specs = json.load(f)
+
+    pages = {}
+    for spec in specs:
+        for page in expand_spec(spec):
+            pages.setdefault(page.path, page)
+    return list(pages.values())
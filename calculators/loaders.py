@@ -0,0 +1,21 @@
+from django.conf import settings
+from django.template.loaders import cached
+
+from .minify import minify_template
+
+
+class MinifyingLoader(cached.Loader):
+    """
+    Cached template loader that minifies HTML templates once, at load time.
+
+    Sources are minified before compiling, so the cached compiled templates
+    render smaller responses at no per-request cost. Set TEMPLATE_MINIFY =
+    False to load templates unchanged (e.g. to get accurate line numbers
+    while debugging).
+    """
+
+    def get_contents(self, origin):
+        contents = super().get_contents(origin)
+        if getattr(settings, 'TEMPLATE_MINIFY', True) and origin.name.endswith('.html'):
+            return minify_template(contents)
+        return contents
@@ -0,0 +1,68 @@
+import os
+import tempfile
+import time
+
+from django.core.cache.backends.filebased import FileBasedCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.management.base import BaseCommand
+
+from calculators.shm_cache import SharedMemoryCache, close_segments
+
+
+def _per_op(function, keys) -> float:
+    """Microseconds per call of ``function`` over ``keys``."""
+    start = time.perf_counter()
+    for key in keys:
+        function(key)
+    return (time.perf_counter() - start) / len(keys) * 1e6
+
+
+def _shared_across_processes(cache) -> bool:
+    """Whether a value set in a forked child is visible to the parent."""
+    cache.delete('benchmark:fork')
+    pid = os.fork()
+    if pid == 0:
+        try:
+            cache.set('benchmark:fork', True)
+        finally:
+            os._exit(0)
+    os.waitpid(pid, 0)
+    return cache.get('benchmark:fork', False)
+
+
+class Command(BaseCommand):
+    help = 'Compare the shared-memory cache backend with the local-memory and file-based ones'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--keys', type=int, default=1000, help='Distinct keys per run')
+        parser.add_argument('--rounds', type=int, default=5, help='Runs per measurement; the best is reported')
+        parser.add_argument('--sizes', default='100,10000',
+                            help='Comma-separated value sizes in bytes (a result and a rendered fragment)')
+
+    def handle(self, *args, **options):
+        keys = [f'benchmark:{i}' for i in range(options['keys'])]
+        missing = [f'benchmark:missing:{i}' for i in range(options['keys'])]
+        sizes = [int(size) for size in options['sizes'].split(',')]
+
+        with tempfile.TemporaryDirectory() as directory:
+            params = {'TIMEOUT': 300, 'OPTIONS': {'MAX_ENTRIES': len(keys) * 2}}
+            backends = [
+                ('shared memory', SharedMemoryCache(os.path.join(directory, 'shm'), {
+                    'TIMEOUT': 300, 'OPTIONS': {'SLOTS': 4096, 'SLOT_SIZE': max(sizes) + 512, 'LARGE_SLOTS': 0},
+                })),
+                ('local memory', LocMemCache('benchmark', params)),
+                ('file', FileBasedCache(os.path.join(directory, 'files'), params)),
+            ]
+
+            self.stdout.write(f"{'backend':<15}{'bytes':>8}{'set us':>10}{'hit us':>10}{'miss us':>10}{'shared':>8}")
+            for name, cache in backends:
+                shared = 'yes' if hasattr(os, 'fork') and _shared_across_processes(cache) else 'no'
+                for size in sizes:
+                    value = {'html': 'x' * size}
+                    cache.clear()
+                    set_us = min(_per_op(lambda key: cache.set(key, value), keys) for _ in range(options['rounds']))
+                    hit_us = min(_per_op(cache.get, keys) for _ in range(options['rounds']))
+                    miss_us = min(_per_op(cache.get, missing) for _ in range(options['rounds']))
+                    self.stdout.write(f'{name:<15}{size:>8}{set_us:>10.1f}{hit_us:>10.1f}{miss_us:>10.1f}{shared:>8}')
+                cache.clear()
+            close_segments(directory)
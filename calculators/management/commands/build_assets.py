@@ -0,0 +1,109 @@
+import json
+from datetime import datetime
+from pathlib import Path
+from urllib.request import urlopen
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from calculators.assets import (
+    BUILD_DIR, BUILD_MANIFEST, BUILD_STATIC_PREFIX, VENDOR_ASSETS, collect_used_classes,
+    defined_classes, icon_codepoints, load_build_manifest, own_classes, parse_css, prune_unreferenced,
+    purge_rules, render_css, rewrite_font_faces, subset_font, undefined_classes, used_font_stems,
+    write_hashed
+)
+from calculators.static_export import MANIFEST_NAME, export_root, export_site
+
+
+class Command(BaseCommand):
+    help = 'Build purged Bootstrap CSS and subset Font Awesome fonts for self-hosting'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--vendor-dir', default=str(settings.ASSETS_VENDOR_DIR),
+                            help='Directory holding the unmodified vendor files (default: ASSETS_VENDOR_DIR)')
+        parser.add_argument('--offline', action='store_true',
+                            help='Fail instead of downloading vendor files that are missing')
+
+    def handle(self, *args, **options):
+        vendor_dir = Path(options['vendor_dir'])
+        sources = {name: self.vendor_file(vendor_dir, name, options['offline']) for name in VENDOR_ASSETS}
+        used = collect_used_classes()
+
+        bootstrap_source = parse_css(sources['bootstrap.css'].decode('utf-8'))
+        bootstrap = prune_unreferenced(purge_rules(bootstrap_source, used))
+        icons_source = parse_css(sources['fontawesome.css'].decode('utf-8'))
+        icons = prune_unreferenced(purge_rules(icons_source, used))
+
+        # Every used class must be defined somewhere, icons by Font Awesome
+        missing = undefined_classes(used, defined_classes(bootstrap_source) | defined_classes(icons_source)
+                                    | own_classes())
+        unknown_icons = {name for name in missing if name.startswith('fa-')}
+        if missing:
+            problems = []
+            if missing - unknown_icons:
+                problems.append(f'classes no stylesheet defines: {", ".join(sorted(missing - unknown_icons))}')
+            if unknown_icons:
+                problems.append(f'unknown Font Awesome classes: {", ".join(sorted(unknown_icons))}')
+            raise CommandError('Asset build failed; ' + '; '.join(problems))
+
+        BUILD_DIR.mkdir(parents=True, exist_ok=True)
+        previous = set(load_build_manifest().values())
+        assets = {}
+
+        codepoints = icon_codepoints(icons)
+        font_urls = {}
+        for stem in used_font_stems(used):
+            name = f'{stem}.woff2'
+            font = subset_font(sources[name], codepoints)
+            if font is None:
+                self.stderr.write(f'fontTools/brotli not installed; copying {name} without subsetting')
+                font = sources[name]
+            font_urls[stem] = write_hashed(BUILD_DIR, name, font)
+            assets[name] = BUILD_STATIC_PREFIX + font_urls[stem]
+        icons = prune_unreferenced(rewrite_font_faces(icons, font_urls))
+
+        built = {
+            'bootstrap.css': render_css(bootstrap).encode('utf-8'),
+            'bootstrap.js': sources['bootstrap.js'],
+            'fontawesome.css': render_css(icons).encode('utf-8'),
+        }
+        for name, content in built.items():
+            assets[name] = BUILD_STATIC_PREFIX + write_hashed(BUILD_DIR, name, content)
+
+        with open(BUILD_MANIFEST, 'w') as f:
+            json.dump({'generated': datetime.now().isoformat(timespec='seconds'), 'assets': assets}, f, indent=2)
+
+        for path in previous - set(assets.values()):
+            (BUILD_DIR / path[len(BUILD_STATIC_PREFIX):]).unlink(missing_ok=True)
+
+        for name, path in sorted(assets.items()):
+            size = (BUILD_DIR / path[len(BUILD_STATIC_PREFIX):]).stat().st_size
+            original = len(sources[name])
+            self.stdout.write(f'{path}: {size / 1024:.1f} KB (was {original / 1024:.1f} KB)')
+        self.stdout.write(self.style.SUCCESS(
+            f'Built {len(assets)} assets for {len(used.names)} classes and {len(codepoints)} icons'
+        ))
+
+        # Exported pages and sw.js name the old asset URLs until re-exported
+        if (export_root() / MANIFEST_NAME).exists():
+            try:
+                report = export_site()
+            except (OSError, ValueError) as e:
+                raise CommandError(f'Assets built, but the static site re-export failed: {e}')
+            self.stdout.write(f"Re-exported {len(report['written'])} static page(s)")
+
+    def vendor_file(self, vendor_dir, name, offline):
+        """Contents of a vendor file, downloading it from the CDN the first time."""
+        path = vendor_dir / name
+        if not path.exists():
+            if offline:
+                raise CommandError(f'{path} is missing')
+            self.stdout.write(f'Downloading {VENDOR_ASSETS[name]}')
+            try:
+                with urlopen(VENDOR_ASSETS[name], timeout=30) as response:
+                    content = response.read()
+            except OSError as e:
+                raise CommandError(f'Could not download {name}: {e}')
+            vendor_dir.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(content)
+        return path.read_bytes()
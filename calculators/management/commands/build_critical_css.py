@@ -0,0 +1,80 @@
+from importlib import import_module
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.messages.storage.cookie import CookieStorage
+from django.core.management.base import BaseCommand, CommandError
+from django.urls import reverse
+
+from calculators import urls
+from calculators.critical import (
+    ABOVE_THE_FOLD_CHARS, extract_critical_css, fingerprint, load_critical_css, recording_templates,
+    save_critical_css, stylesheet_files, stylesheet_urls, template_files
+)
+from calculators.static_export import site_requests
+
+
+class Command(BaseCommand):
+    help = 'Extract and cache the above-the-fold CSS of every page template'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--vendor-dir', default=str(settings.ASSETS_VENDOR_DIR),
+                            help='Vendor stylesheets to read when build_assets has not been run')
+        parser.add_argument('--fold', type=int, default=ABOVE_THE_FOLD_CHARS,
+                            help='Characters of body markup treated as above the fold')
+        parser.add_argument('--force', action='store_true',
+                            help='Rebuild entries whose templates have not changed')
+
+    def handle(self, *args, **options):
+        try:
+            files = stylesheet_files(Path(options['vendor_dir']))
+            sources = [file.read_text(encoding='utf-8') for file in files]
+        except (OSError, TypeError) as e:
+            raise CommandError(f'Could not read the stylesheets (run build_assets first?): {e}')
+
+        hrefs = stylesheet_urls()
+        previous = {} if options['force'] else load_critical_css()
+        entries = {}
+        built = unchanged = 0
+
+        with site_requests(settings.SITE_URL) as get_request:
+            for path, view, kwargs in self.page_routes():
+                request = get_request(path)
+                # Marked as a prefetch so calculator_detail counts no visit
+                request.META['HTTP_SEC_PURPOSE'] = 'prefetch'
+                request._messages = CookieStorage(request)
+                request.session = import_module(settings.SESSION_ENGINE).SessionStore()
+                with recording_templates() as rendered:
+                    try:
+                        response = view(request, **kwargs)
+                    except Exception as e:
+                        self.stderr.write(f'Skipped {path}: {e}')
+                        continue
+                if response.status_code != 200 or not rendered or rendered[0] in entries:
+                    continue
+
+                name = rendered[0]
+                template_sources = template_files(name) + [str(file) for file in files]
+                current = fingerprint(template_sources, hrefs)
+                if previous.get(name, {}).get('fingerprint') == current:
+                    entries[name] = previous[name]
+                    unchanged += 1
+                    continue
+
+                css = extract_critical_css(response.content.decode(response.charset), sources, options['fold'])
+                entries[name] = {'fingerprint': current, 'files': template_sources, 'css': css}
+                built += 1
+                self.stdout.write(f'{name}: {len(css) / 1024:.1f} KB critical CSS')
+
+        save_critical_css(entries)
+        self.stdout.write(self.style.SUCCESS(
+            f'Critical CSS for {len(entries)} templates ({built} rebuilt, {unchanged} unchanged)'
+        ))
+
+    def page_routes(self):
+        """(path, view, kwargs) for every calculators route without URL arguments."""
+        for pattern in urls.urlpatterns:
+            if pattern.pattern.converters:
+                continue
+            path = reverse(f'{urls.app_name}:{pattern.name}')
+            yield path, pattern.callback, pattern.default_args
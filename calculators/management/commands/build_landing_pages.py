@@ -0,0 +1,111 @@
+from datetime import date
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.messages.storage.cookie import CookieStorage
+from django.core.management.base import BaseCommand, CommandError
+from django.template import loader
+from django.utils.xmlutils import SimplerXMLGenerator
+
+from calculators.landing import LANDING_PAGES_SOURCE, SITEMAP_INDEX, landing_root, load_landing_pages
+from calculators.permalinks import permalink_form_data
+from calculators.static_export import site_requests
+from calculators.views import PERMALINK_VIEWS
+
+SITEMAP_LIMIT = 50000  # URLs per sitemap file allowed by the protocol
+
+
+class Command(BaseCommand):
+    help = 'Pre-render landing pages for popular calculator inputs and write their sitemaps'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--source', default=str(LANDING_PAGES_SOURCE),
+                            help='JSON file describing the input combinations')
+        parser.add_argument('--output', default=None,
+                            help='Directory to write to (default: LANDING_PAGES_ROOT)')
+        parser.add_argument('--base-url', default=getattr(settings, 'SITE_URL', ''),
+                            help='Absolute site URL used in the sitemaps (default: SITE_URL)')
+        parser.add_argument('--shard-size', type=int, default=SITEMAP_LIMIT,
+                            help='Maximum URLs per sitemap file')
+
+    def handle(self, *args, **options):
+        output = Path(options['output']) if options['output'] else landing_root()
+        base_url = options['base_url'].rstrip('/')
+        shard_size = options['shard_size']
+        if not base_url:
+            raise CommandError('Set SITE_URL or pass --base-url for the sitemap')
+        if not 0 < shard_size <= SITEMAP_LIMIT:
+            raise CommandError(f'--shard-size must be between 1 and {SITEMAP_LIMIT}')
+
+        try:
+            pages = load_landing_pages(Path(options['source']))
+        except (OSError, ValueError, KeyError) as e:
+            raise CommandError(f'Could not load landing pages: {e}')
+
+        written = []
+        with site_requests(base_url) as get_request:
+            for page in pages:
+                html = self.render_page(get_request, page, base_url)
+                if html is None:
+                    self.stderr.write(f'Skipped {page.path}: inputs did not produce a result')
+                    continue
+
+                target = output / page.calculator / page.slug / 'index.html'
+                target.parent.mkdir(parents=True, exist_ok=True)
+                target.write_bytes(html)
+                written.append(page)
+
+        shards = self.write_sitemaps(output, base_url, written, shard_size)
+        self.stdout.write(self.style.SUCCESS(
+            f'Wrote {len(written)} landing pages and {shards} sitemap file(s) to {output}'
+        ))
+
+    def render_page(self, get_request, page, base_url):
+        """Render one page through its calculator view; None if it errored."""
+        request = get_request(page.path)
+        request._messages = CookieStorage(request)
+        view = PERMALINK_VIEWS[page.calculator]
+
+        response = view(
+            request,
+            permalink=permalink_form_data(page.calculator, list(page.params)),
+            extra_context={
+                'landing_page': page,
+                'meta_description': page.description,
+                'canonical_url': f'{base_url}{page.path}',
+            }
+        )
+        if response.status_code != 200 or list(request._messages):
+            return None
+        return response.content
+
+    def write_sitemaps(self, output, base_url, pages, shard_size):
+        """Write sitemap shards plus an index pointing at them."""
+        today = date.today().isoformat()
+        template = loader.get_template('calculators/sitemap.xml')
+        output.mkdir(parents=True, exist_ok=True)
+
+        shard_names = []
+        for start in range(0, len(pages), shard_size):
+            name = f'sitemap-landing-{len(shard_names) + 1}.xml'
+            entries = [
+                {'loc': f'{base_url}{page.path}', 'lastmod': today,
+                 'changefreq': 'monthly', 'priority': '0.6'}
+                for page in pages[start:start + shard_size]
+            ]
+            (output / name).write_text(template.render({'pages': entries}), encoding='utf-8')
+            shard_names.append(name)
+
+        with open(output / SITEMAP_INDEX, 'w', encoding='utf-8') as f:
+            xml = SimplerXMLGenerator(f, 'utf-8')
+            xml.startDocument()
+            xml.startElement('sitemapindex', {'xmlns': 'http://www.sitemaps.org/schemas/sitemap/0.9'})
+            for name in shard_names:
+                xml.startElement('sitemap', {})
+                xml.addQuickElement('loc', f'{base_url}/{name}')
+                xml.addQuickElement('lastmod', today)
+                xml.endElement('sitemap')
+            xml.endElement('sitemapindex')
+            xml.endDocument()
+
+        return len(shard_names)
@@ -0,0 +1,37 @@
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from calculators.static_export import MANIFEST_NAME, export_root, export_site
+
+
+class Command(BaseCommand):
+    help = 'Render every GET-only page to static files and write a manifest for the web server'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--output', default=None,
+                            help='Directory to write to (default: STATIC_EXPORT_ROOT)')
+        parser.add_argument('--base-url', default=getattr(settings, 'SITE_URL', ''),
+                            help='Absolute site URL the pages are rendered for (default: SITE_URL)')
+        parser.add_argument('--force', action='store_true',
+                            help='Rewrite every file, even if unchanged')
+
+    def handle(self, *args, **options):
+        output = Path(options['output']) if options['output'] else export_root()
+        if not options['base_url']:
+            raise CommandError('Set SITE_URL or pass --base-url')
+
+        try:
+            report = export_site(output, options['base_url'], force=options['force'])
+        except (OSError, ValueError) as e:
+            raise CommandError(f'Export failed: {e}')
+
+        for path in report['written']:
+            self.stdout.write(f'Wrote {path}')
+        for path in report['removed']:
+            self.stdout.write(f'Removed {path}')
+        self.stdout.write(self.style.SUCCESS(
+            f"{len(report['written'])} written, {len(report['unchanged'])} unchanged, "
+            f"{len(report['removed'])} removed; manifest at {output / MANIFEST_NAME}"
+        ))
@@ -0,0 +1,158 @@
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from .results import ActivityLevel
+
+LBS_TO_KG = 0.453592
+INCHES_TO_CM = 2.54
+
+# (key, name, description, multiplier)
+ACTIVITY_LEVELS = (
+    ('sedentary', 'Sedentary', 'Little to no exercise, desk job', 1.2),
+    ('lightly_active', 'Lightly Active', 'Light exercise 1-3 days/week', 1.375),
+    ('moderately_active', 'Moderately Active', 'Moderate exercise 3-5 days/week', 1.55),
+    ('very_active', 'Very Active', 'Hard exercise 6-7 days/week', 1.725),
+    ('extra_active', 'Extra Active', 'Very hard exercise, physical job', 1.9),
+)
+ACTIVITY_MULTIPLIERS = {key: multiplier for key, _, _, multiplier in ACTIVITY_LEVELS}
+
+def _mifflin_st_jeor(weight, height, age, is_male, lean_mass):
+    return 10 * weight + 6.25 * height - 5 * age + (5 if is_male else -161)
+
+
+def _harris_benedict(weight, height, age, is_male, lean_mass):
+    # Revised equation (Roza & Shizgal, 1984)
+    if is_male:
+        return 88.362 + 13.397 * weight + 4.799 * height - 5.677 * age
+    return 447.593 + 9.247 * weight + 3.098 * height - 4.330 * age
+
+
+def _katch_mcardle(weight, height, age, is_male, lean_mass):
+    return None if lean_mass is None else 370 + 21.6 * lean_mass
+
+
+def _cunningham(weight, height, age, is_male, lean_mass):
+    return None if lean_mass is None else 500 + 22 * lean_mass
+
+
+# key -> (name, needs body fat, equation)
+FORMULAS = {
+    'mifflin_st_jeor': ('Mifflin-St Jeor', False, _mifflin_st_jeor),
+    'harris_benedict': ('Harris-Benedict (revised)', False, _harris_benedict),
+    'katch_mcardle': ('Katch-McArdle', True, _katch_mcardle),
+    'cunningham': ('Cunningham', True, _cunningham),
+}
+DEFAULT_FORMULA = 'mifflin_st_jeor'
+
+
+def to_metric(height: float, height_unit: str, weight: float, weight_unit: str):
+    """Convert height to cm and weight to kg."""
+    if height_unit == 'inches':
+        height = height * INCHES_TO_CM
+    if weight_unit == 'lbs':
+        weight = weight * LBS_TO_KG
+    return height, weight
+
+
+def basal_metabolic_rate(formula: str, weight_kg: float, height_cm: float, age: int,
+                         gender: str, body_fat: Optional[float] = None) -> float:
+    """Unrounded BMR for one person with the given formula."""
+    try:
+        name, needs_body_fat, equation = FORMULAS[formula]
+    except KeyError:
+        raise ValueError(f"Unknown formula: {formula}")
+    if needs_body_fat and body_fat in (None, ''):
+        raise ValueError(f"{name} needs a body fat percentage")
+
+    lean_mass = weight_kg * (1 - float(body_fat) / 100) if needs_body_fat else None
+    return equation(weight_kg, height_cm, age, gender == 'male', lean_mass)
+
+
+def person_columns(people: Iterable[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """
+    Turn a list of person dicts into the columns evaluate_batch expects.
+
+    Each person has 'age', 'gender', 'height', 'weight' and optionally
+    'height_unit' ('cm' or 'inches'), 'weight_unit' ('kg' or 'lbs') and
+    'body_fat' (percent).
+    """
+    columns = {'age': [], 'gender': [], 'height_cm': [], 'weight_kg': [], 'body_fat': []}
+    for person in people:
+        height, weight = to_metric(
+            float(person['height']), person.get('height_unit', 'cm'),
+            float(person['weight']), person.get('weight_unit', 'kg')
+        )
+        gender = person['gender']
+        if gender not in ('male', 'female'):
+            raise ValueError("Gender must be 'male' or 'female'")
+        body_fat = person.get('body_fat')
+        body_fat = float(body_fat) if body_fat not in (None, '') else None
+        if body_fat is not None and not 0 <= body_fat < 100:
+            raise ValueError("Body fat must be between 0 and 100 percent")
+
+        columns['age'].append(int(person['age']))
+        columns['gender'].append(gender)
+        columns['height_cm'].append(height)
+        columns['weight_kg'].append(weight)
+        columns['body_fat'].append(body_fat)
+    return columns
+
+
+def evaluate_batch(age: Sequence[int], gender: Sequence[str], height_cm: Sequence[float],
+                   weight_kg: Sequence[float], body_fat: Optional[Sequence[Optional[float]]] = None,
+                   formulas: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+    """
+    Evaluate every formula x activity level for many people in one call.
+
+    Inputs are parallel columns (one entry per person) and so are the
+    outputs. Formulas that need body fat give None for people without it.
+
+    Returns:
+        Dictionary with 'count', 'activity_levels' and, per formula,
+        'bmr' and 'tdee' (activity key -> calories) columns
+    """
+    count = len(age)
+    if not (len(gender) == len(height_cm) == len(weight_kg) == count):
+        raise ValueError("All input columns must have the same length")
+    if body_fat is None:
+        body_fat = [None] * count
+
+    formula_keys = list(formulas) if formulas else list(FORMULAS)
+    unknown = [key for key in formula_keys if key not in FORMULAS]
+    if unknown:
+        raise ValueError(f"Unknown formula: {', '.join(unknown)}")
+
+    is_male = [g == 'male' for g in gender]
+    lean_mass = [None if fat is None else w * (1 - fat / 100) for w, fat in zip(weight_kg, body_fat)]
+    rows = list(zip(weight_kg, height_cm, age, is_male, lean_mass))
+
+    results = {}
+    for key in formula_keys:
+        name, needs_body_fat, equation = FORMULAS[key]
+        bmr = [equation(*row) for row in rows]
+        results[key] = {
+            'name': name,
+            'needs_body_fat': needs_body_fat,
+            'bmr': [None if value is None else round(value, 1) for value in bmr],
+            'tdee': {
+                level: [None if value is None else round(value * multiplier) for value in bmr]
+                for level, multiplier in ACTIVITY_MULTIPLIERS.items()
+            }
+        }
+
+    return {
+        'count': count,
+        'activity_levels': [
+            {'key': key, 'name': name, 'description': description, 'multiplier': multiplier}
+            for key, name, description, multiplier in ACTIVITY_LEVELS
+        ],
+        'formulas': results
+    }
+
+
+def activity_breakdown(bmr: float) -> List[ActivityLevel]:
+    """Daily calories at each activity level for a single BMR."""
+    return [
+        ActivityLevel(name, description, multiplier, round(bmr * multiplier, 0))
+        for _, name, description, multiplier in ACTIVITY_LEVELS
+    ]
+
@@ -0,0 +1,20 @@
+from django.utils.cache import patch_cache_control
+
+
+def private_flash_messages(get_response):
+    """
+    Mark responses that displayed flash messages as private.
+
+    Such a page is meant for one visit of one user, so neither shared caches
+    nor the service worker's page cache (which skips private responses) may
+    keep it.
+    """
+    def middleware(request):
+        response = get_response(request)
+        storage = getattr(request, '_messages', None)
+        # Iterating the messages (as base.html does) marks the storage used
+        if storage is not None and storage.used and len(storage):
+            patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+    return middleware
@@ -0,0 +1,20 @@
+# Generated by Django 5.2 on 2026-10-19 10:30
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('calculators', '0002_seocontent_testimonial_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='seocontent',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+    ]
@@ -0,0 +1,122 @@
+"""
+Conservative whitespace/comment minifier for Django template sources.
+
+Template syntax ({% %}, {{ }}, {# #} and whole {% verbatim %} blocks) and the
+contents of <pre> and <textarea> are swapped out for placeholders first and
+restored untouched. Comments that contain template syntax are kept, since
+removing them could drop half of a block tag.
+"""
+import re
+
+_PLACEHOLDER = '\x00{}\x00'
+_PLACEHOLDER_RE = re.compile('\x00(\\d+)\x00')
+
+_TEMPLATE_SYNTAX_RE = re.compile(
+    r'{%\s*verbatim\b.*?%}.*?{%\s*endverbatim\s*%}|{%.*?%}|{{.*?}}|{#.*?#}',
+    re.DOTALL
+)
+_RAW_ELEMENT_RE = re.compile(r'<(pre|textarea)\b.*?</\1\s*>', re.DOTALL | re.IGNORECASE)
+_SCRIPT_RE = re.compile(r'(<script\b[^>]*>)(.*?)(</script\s*>)', re.DOTALL | re.IGNORECASE)
+_STYLE_RE = re.compile(r'(<style\b[^>]*>)(.*?)(</style\s*>)', re.DOTALL | re.IGNORECASE)
+_SCRIPT_TYPE_RE = re.compile(r'\btype\s*=\s*["\']?([^"\'\s>]+)', re.IGNORECASE)
+_JS_TYPES = ('', 'text/javascript', 'application/javascript', 'module')
+
+_HTML_COMMENT_RE = re.compile(r'<!--(?!\[if)(.*?)-->', re.DOTALL)
+_CSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+_CSS_PUNCTUATION_RE = re.compile(r'\s*([{};,>])\s*')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+class _Protector:
+    """Swaps matched text for numbered placeholders and restores it later."""
+
+    def __init__(self):
+        self.chunks = []
+
+    def protect(self, pattern, text):
+        return pattern.sub(self._store, text)
+
+    def _store(self, match):
+        self.chunks.append(match.group(0))
+        return _PLACEHOLDER.format(len(self.chunks) - 1)
+
+    def restore(self, text):
+        # Chunks may contain earlier placeholders, so restore until none are left
+        while _PLACEHOLDER_RE.search(text):
+            text = _PLACEHOLDER_RE.sub(lambda match: self.chunks[int(match.group(1))], text)
+        return text
+
+
+def _drop_comments(pattern, text):
+    return pattern.sub(lambda match: match.group(0) if '\x00' in match.group(0) else '', text)
+
+
+def minify_css(css: str) -> str:
+    """Strip comments and collapse whitespace around CSS punctuation."""
+    css = _drop_comments(_CSS_COMMENT_RE, css)
+    css = _WHITESPACE_RE.sub(' ', css)
+    css = _CSS_PUNCTUATION_RE.sub(r'\1', css)
+    return css.replace(';}', '}').strip()
+
+
+def minify_js(js: str) -> str:
+    """
+    Line-based JS clean-up: trims indentation, blank lines and whole-line
+    comments. Line breaks are kept so automatic semicolon insertion still works.
+    """
+    lines = []
+    in_comment = False
+    in_template_literal = False
+    for line in js.splitlines():
+        line = line.strip()
+        if in_template_literal:
+            # Keep every line of a multi-line `template literal`
+            in_template_literal = line.count('`') % 2 == 0
+            lines.append(line)
+            continue
+        if in_comment:
+            in_comment = '*/' not in line
+            continue
+        if not line or (line.startswith('//') and '\x00' not in line):
+            continue
+        if line.startswith('/*') and '\x00' not in line:
+            in_comment = '*/' not in line
+            if in_comment or line.endswith('*/'):
+                continue
+        in_template_literal = line.count('`') % 2 == 1
+        lines.append(line)
+    return '\n'.join(lines)
+
+
+def _minify_script(match):
+    opening, body, closing = match.groups()
+    type_match = _SCRIPT_TYPE_RE.search(opening)
+    script_type = type_match.group(1).lower() if type_match else ''
+    if script_type in _JS_TYPES:
+        body = minify_js(body)
+    else:
+        # JSON-LD, speculation rules and the like: only trim line indentation
+        body = '\n'.join(line.strip() for line in body.splitlines() if line.strip())
+    return f'{opening}{body}{closing}'
+
+
+def _minify_style(match):
+    opening, body, closing = match.groups()
+    return f'{opening}{minify_css(body)}{closing}'
+
+
+def minify_template(source: str) -> str:
+    """Minify an HTML template source without changing what it renders to."""
+    protector = _Protector()
+    text = protector.protect(_TEMPLATE_SYNTAX_RE, source)
+    text = protector.protect(_RAW_ELEMENT_RE, text)
+
+    text = _SCRIPT_RE.sub(_minify_script, text)
+    text = _STYLE_RE.sub(_minify_style, text)
+    # Keep script and style bodies out of the HTML whitespace pass
+    text = protector.protect(_SCRIPT_RE, text)
+    text = protector.protect(_STYLE_RE, text)
+
+    text = _drop_comments(_HTML_COMMENT_RE, text)
+    text = _WHITESPACE_RE.sub(' ', text)
+    return protector.restore(text).strip()
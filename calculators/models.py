@@ -1,6 +1,7 @@
 from django.db import models
-from django.urls import reverse
+from django.urls import NoReverseMatch, reverse
 from django.utils.text import slugify
+from .grading import get_grade_scale
 
 class Calculator(models.Model):
     name = models.CharField(max_length=100)
@@ -27,6 +28,13 @@ class Calculator(models.Model):
     def get_absolute_url(self):
         return reverse('calculators:calculator_detail', kwargs={'slug': self.slug})
 
+    def get_page_url(self):
+        """URL of the calculator's own page, or the generic detail page if it has none."""
+        try:
+            return reverse(f"calculators:{self.slug.replace('-', '_')}")
+        except NoReverseMatch:
+            return self.get_absolute_url()
+
     def save(self, *args, **kwargs):
         if not self.slug:
             self.slug = slugify(self.name)
@@ -93,6 +101,7 @@ class SEOContent(models.Model):
     additional_content = models.TextField(blank=True, help_text="Additional SEO content")
     schema_markup = models.JSONField(blank=True, null=True)
     is_active = models.BooleanField(default=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return f"SEO for {self.page_name}"
@@ -119,11 +128,5 @@ class GPAEntry(models.Model):
     session_id = models.CharField(max_length=200)
     created_at = models.DateTimeField(auto_now_add=True)
 
-    def get_grade_point(self):
-        grade_points = {
-            'A+': 4.0, 'A': 4.0, 'A-': 3.7,
-            'B+': 3.3, 'B': 3.0, 'B-': 2.7,
-            'C+': 2.3, 'C': 2.0, 'C-': 1.7,
-            'D+': 1.3, 'D': 1.0, 'F': 0.0
-        }
-        return grade_points.get(self.grade, 0.0)
\ No newline at end of file
+    def get_grade_point(self, scale=None):
+        return get_grade_scale(scale).grade_point(self.grade)
\ No newline at end of file
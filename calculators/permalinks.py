@@ -0,0 +1,113 @@
+from decimal import Decimal, InvalidOperation
+from typing import Dict, List, Mapping, Tuple
+
+from django.urls import reverse
+from django.utils.http import urlencode
+
+from .metabolic import DEFAULT_FORMULA
+
+# Calculator slug -> (URL name, fields). Each field is (query key, form field,
+# default); a default of None marks the field as required. Optional fields
+# equal to their default are left out of the URL so each result has exactly
+# one canonical address.
+PERMALINKS = {
+    'mortgage-calculator': ('mortgage_permalink', (
+        ('price', 'home_price', None),
+        ('down', 'down_payment', None),
+        ('rate', 'interest_rate', None),
+        ('term', 'loan_term', None),
+        ('tax', 'property_tax', '0'),
+        ('insurance', 'home_insurance', '0'),
+        ('hoa', 'hoa_fees', '0'),
+    )),
+    'loan-calculator': ('loan_permalink', (
+        ('amount', 'loan_amount', None),
+        ('rate', 'interest_rate', None),
+        ('term', 'loan_term', None),
+        ('frequency', 'payment_frequency', '12'),
+    )),
+    '401k-calculator': ('401k_permalink', (
+        ('age', 'current_age', None),
+        ('retire', 'retirement_age', None),
+        ('balance', 'current_balance', '0'),
+        ('salary', 'annual_salary', None),
+        ('contribution', 'contribution_rate', None),
+        ('match', 'employer_match', '0'),
+        ('return', 'return_rate', None),
+        ('filing', 'filing_status', ''),
+        ('state', 'state', ''),
+        ('growth', 'salary_growth', '3'),
+    )),
+    'bmi-calculator': ('bmi_permalink', (
+        ('weight', 'weight', None),
+        ('height', 'height', None),
+        ('units', 'unit_system', 'metric'),
+    )),
+    'bmr-calculator': ('bmr_permalink', (
+        ('age', 'age', None),
+        ('gender', 'gender', None),
+        ('height', 'height', None),
+        ('height_unit', 'height_unit', 'cm'),
+        ('weight', 'weight', None),
+        ('weight_unit', 'weight_unit', 'kg'),
+        ('formula', 'formula', DEFAULT_FORMULA),
+        ('body_fat', 'body_fat', ''),
+    )),
+}
+
+
+def normalize_value(value) -> str:
+    """Canonical text for one input: plain decimals for numbers, lowercase otherwise."""
+    value = str(value).strip()
+    try:
+        number = Decimal(value.replace(',', ''))
+    except InvalidOperation:
+        return value.lower()
+    if not number.is_finite():
+        raise ValueError(f"Invalid number: {value}")
+    number = number.normalize()
+    # normalize() turns 100 into 1E+2; quantize back to a plain integer
+    if number == number.to_integral_value():
+        try:
+            number = number.quantize(Decimal(1))
+        except InvalidOperation:
+            # More digits than the decimal context holds (from about 1e28)
+            raise ValueError(f"Number too large: {value}")
+    return format(number, 'f')
+
+
+def canonical_params(slug: str, data: Mapping[str, str]) -> List[Tuple[str, str]]:
+    """
+    Normalized (query key, value) pairs for a calculator's inputs.
+
+    ``data`` may use either the short query keys or the form field names.
+    Raises ValueError when a required input is missing.
+    """
+    _, fields = PERMALINKS[slug]
+    params = []
+    for key, field, default in fields:
+        value = data.get(key)
+        if value in (None, ''):
+            value = data.get(field)
+        if value in (None, ''):
+            if default is None:
+                raise ValueError(f"Missing value for {field}")
+            continue
+
+        value = normalize_value(value)
+        if default is None or value != normalize_value(default):
+            params.append((key, value))
+    return params
+
+
+def permalink_url(slug: str, data: Mapping[str, str]) -> str:
+    """Canonical GET URL for a calculator result."""
+    url_name, _ = PERMALINKS[slug]
+    return f"{reverse(f'calculators:{url_name}')}?{urlencode(canonical_params(slug, data))}"
+
+
+def permalink_form_data(slug: str, params: List[Tuple[str, str]]) -> Dict[str, str]:
+    """Form field -> value for canonical params, with defaults filled in."""
+    _, fields = PERMALINKS[slug]
+    values = dict(params)
+    return {field: values.get(key, default) for key, field, default in fields}
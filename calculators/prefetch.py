@@ -0,0 +1,33 @@
+"""
+Speculative prefetching of the pages users are likely to open next.
+
+Pages emit speculation rules for their related or featured calculators.
+The rules only match links present on the page and fire when the user
+shows intent (hovering or pressing a link), so nothing is fetched that
+cannot be navigated to. Browsers mark the resulting requests with
+``Sec-Purpose: prefetch`` (older ones with ``Purpose`` or ``X-Moz``); views
+that count visits skip those.
+"""
+from typing import Dict, Iterable, List
+
+PREFETCH_HEADERS = ('Sec-Purpose', 'Purpose', 'X-Purpose', 'X-Moz')
+PREFETCH_PURPOSES = ('prefetch', 'preview')
+
+
+def is_prefetch(request) -> bool:
+    """True if the browser fetched the page speculatively rather than for display."""
+    for header in PREFETCH_HEADERS:
+        value = request.headers.get(header, '')
+        tokens = value.replace(',', ';').split(';')
+        if any(token.strip().lower() in PREFETCH_PURPOSES for token in tokens):
+            return True
+    return False
+
+
+def speculation_rules(urls: Iterable[str]) -> Dict[str, List[Dict]]:
+    """Speculation rules prefetching links on the page to the given same-origin URLs, on intent."""
+    return {'prefetch': [{
+        'source': 'document',
+        'where': {'href_matches': list(urls)},
+        'eagerness': 'moderate',
+    }]}
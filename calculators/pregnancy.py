@@ -0,0 +1,159 @@
+from calendar import month_abbr, month_name
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+from .results import Milestone, TimelineWeek
+
+GESTATION_DAYS = 280        # LMP to due date for a 28-day cycle
+CONCEPTION_TO_DUE_DAYS = 266
+OVULATION_BEFORE_PERIOD = 14  # Luteal phase length, roughly constant
+STANDARD_CYCLE = 28
+MIN_CYCLE, MAX_CYCLE = 20, 45
+TOTAL_WEEKS = 40
+
+CALC_METHODS = ('lmp', 'conception', 'due_date')
+
+# Week -> milestone description
+MILESTONES = {
+    8: 'First ultrasound and heartbeat detection',
+    12: 'End of first trimester - morning sickness often improves',
+    20: 'Anatomy scan - you can usually find out the sex',
+    24: 'Viability milestone - baby could survive with medical help',
+    28: 'Third trimester begins',
+    37: 'Full term - baby is considered ready for birth',
+}
+
+# (last week, number, name, info) for each trimester
+TRIMESTERS = (
+    (13, 1, "First Trimester", "Your baby's organs and body systems are forming. You might experience morning sickness, fatigue, and tender breasts. This is a critical time for development."),
+    (27, 2, "Second Trimester", "You'll likely feel better now. Your baby is growing fast, and you'll probably start to feel movements. Your bump will become more noticeable."),
+    (TOTAL_WEEKS, 3, "Third Trimester", "Your baby is gaining weight and getting ready for birth. You might feel more uncomfortable as your due date approaches. Start preparing for your baby's arrival."),
+)
+
+# Offsets from the start of gestation, computed once
+WEEK_OFFSETS = tuple(timedelta(weeks=week) for week in range(TOTAL_WEEKS + 1))
+_SIX_DAYS = timedelta(days=6)
+_WEEK_TRIMESTER = tuple(
+    next(t for t in TRIMESTERS if week <= t[0]) for week in range(TOTAL_WEEKS + 1)
+)
+
+
+def _short_date(day: date) -> str:
+    return f"{month_abbr[day.month]} {day.day:02d}, {day.year}"
+
+
+def _long_date(day: date) -> str:
+    return f"{month_name[day.month]} {day.day:02d}, {day.year}"
+
+
+def pregnancy_dates(calc_method: str, input_date: date, cycle_length: int = STANDARD_CYCLE) -> Tuple[date, date, date]:
+    """
+    Resolve the key pregnancy dates from the entered date.
+
+    Ovulation is assumed to happen 14 days before the next period, so longer
+    or shorter cycles shift conception and the due date when calculating from
+    the last menstrual period.
+
+    Returns:
+        (gestation_start, conception_date, due_date), where gestation_start is
+        the cycle-adjusted LMP that gestational age is counted from.
+    """
+    cycle_length = int(cycle_length)
+    if cycle_length < MIN_CYCLE or cycle_length > MAX_CYCLE:
+        raise ValueError(f"Cycle length must be between {MIN_CYCLE} and {MAX_CYCLE} days")
+
+    if calc_method == 'lmp':
+        conception_date = input_date + timedelta(days=cycle_length - OVULATION_BEFORE_PERIOD)
+        due_date = conception_date + timedelta(days=CONCEPTION_TO_DUE_DAYS)
+    elif calc_method == 'conception':
+        conception_date = input_date
+        due_date = input_date + timedelta(days=CONCEPTION_TO_DUE_DAYS)
+    elif calc_method == 'due_date':
+        due_date = input_date
+        conception_date = input_date - timedelta(days=CONCEPTION_TO_DUE_DAYS)
+    else:
+        raise ValueError("Invalid calculation method")
+
+    return due_date - timedelta(days=GESTATION_DAYS), conception_date, due_date
+
+
+@lru_cache(maxsize=4096)
+def pregnancy_summary(calc_method: str, input_date: date, cycle_length: int, today: date) -> Dict[str, Any]:
+    """
+    Cached pregnancy summary keyed by (method, date, cycle_length, today).
+
+    The returned dict and its milestones are shared between callers and must
+    not be mutated; calculate_pregnancy hands out a copy of the dict.
+    """
+    start, conception_date, due_date = pregnancy_dates(calc_method, input_date, cycle_length)
+
+    days_pregnant = max(0, (today - start).days)
+    current_week = min(days_pregnant // 7, TOTAL_WEEKS)
+    _, trimester, trimester_name, trimester_info = _WEEK_TRIMESTER[current_week]
+
+    upcoming_milestones = tuple(
+        Milestone(week, description, _short_date(start + WEEK_OFFSETS[week]))
+        for week, description in MILESTONES.items() if week > current_week
+    )[:4]
+
+    return {
+        'due_date': due_date,
+        'due_date_formatted': _long_date(due_date),
+        'conception_date': _long_date(conception_date),
+        'days_pregnant': days_pregnant,
+        'current_week': current_week,
+        # Clamped once the due date has passed, as the original calculator did
+        'days_until_due': max(0, (due_date - today).days),
+        'trimester': trimester,
+        'trimester_name': trimester_name,
+        'trimester_info': trimester_info,
+        'milestones': upcoming_milestones,
+        'weeks_remaining': TOTAL_WEEKS - current_week,
+        'percent_complete': min(100, round((current_week / TOTAL_WEEKS) * 100, 1)),
+        'cycle_length': cycle_length
+    }
+
+
+def pregnancy_timeline(calc_method: str, input_date: date, cycle_length: int = STANDARD_CYCLE,
+                       today: Optional[date] = None) -> Dict[str, Any]:
+    """
+    Full week-by-week timeline (weeks 0-40) computed in a single pass.
+
+    Like the rest of the calculator, week N is the week starting when the
+    pregnancy reaches N completed weeks, so milestone dates line up with the
+    start of their week and the page's "Week 0" (the first seven days) has
+    an entry too. Results are cached per (method, date, cycle_length, today); treat the
+    returned dict as read-only.
+    """
+    return _pregnancy_timeline(calc_method, input_date, int(cycle_length), today or date.today())
+
+
+@lru_cache(maxsize=1024)
+def _pregnancy_timeline(calc_method: str, input_date: date, cycle_length: int, today: date) -> Dict[str, Any]:
+    start, conception_date, due_date = pregnancy_dates(calc_method, input_date, cycle_length)
+    current_week = min(max(0, (today - start).days) // 7, TOTAL_WEEKS)
+
+    weeks = []
+    for week in range(TOTAL_WEEKS + 1):
+        week_start = start + WEEK_OFFSETS[week]
+        _, trimester, trimester_name, _ = _WEEK_TRIMESTER[week]
+        weeks.append(TimelineWeek(
+            week=week,
+            start_date=week_start.isoformat(),
+            end_date=(week_start + _SIX_DAYS).isoformat(),
+            trimester=trimester,
+            trimester_name=trimester_name,
+            milestone=MILESTONES.get(week),
+            is_current=week == current_week
+        ))
+
+    return {
+        'calc_method': calc_method,
+        'cycle_length': cycle_length,
+        'gestation_start': start.isoformat(),
+        'conception_date': conception_date.isoformat(),
+        'due_date': due_date.isoformat(),
+        'current_week': current_week,
+        'weeks': tuple(weeks)
+    }
@@ -0,0 +1,311 @@
+"""
+Declarative registry of the calculators on the site.
+
+Each entry ties a slug to its view, template, SEO defaults, related
+calculators and, where the calculation takes flat named inputs, the compute
+function and input schema behind the JSON API. Dispatch, the sitemap, robots.txt,
+related links and the API all read from this table, which is built once at
+import time.
+"""
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, NamedTuple, Optional, Tuple
+
+from django.urls import reverse
+
+from .bmi import body_mass_index
+from .schemas import BMI, BMR, K401, LOAN, MORTGAGE, PREGNANCY, Schema
+from .utils import (
+    calculate_401k, calculate_bmr, calculate_loan_payment, calculate_mortgage, calculate_pregnancy,
+    get_bmi_category_info
+)
+
+
+class CalculatorSpec(NamedTuple):
+    slug: str
+    view: str  # name of the view function in calculators.views
+    name: str
+    description: str
+    template: str
+    keywords: str
+    title: str = ''  # default page title: "<name> - Calculator Hub"
+    meta_description: str = ''  # default: the calculator description
+    related: Tuple[str, ...] = ()
+    compute: Optional[Callable[..., Dict[str, Any]]] = None
+    schema: Optional[Schema] = None  # inputs of compute, for the JSON API
+    changefreq: str = 'weekly'
+    priority: str = '0.9'
+
+    @property
+    def url_name(self) -> str:
+        return f"calculators:{self.slug.replace('-', '_')}"
+
+    def get_page_url(self) -> str:
+        return page_path(self.slug)
+
+    def fallback(self):
+        """Unsaved Calculator standing in when the database has no row for the slug."""
+        from .models import Calculator
+
+        return Calculator(name=self.name, description=self.description, slug=self.slug)
+
+    def seo_context(self, calculator) -> Dict[str, str]:
+        """Page title, description and keywords; values set on the Calculator row win."""
+        return {
+            'page_title': calculator.meta_title or self.title or f"{calculator.name} - Calculator Hub",
+            'meta_description': calculator.meta_description or self.meta_description or calculator.description,
+            'meta_keywords': calculator.meta_keywords or self.keywords,
+        }
+
+
+def _bmi_result(weight: float, height: float, unit_system: str = 'metric') -> Dict[str, Any]:
+    bmi = body_mass_index(weight, height, unit_system)
+    return {'bmi': round(bmi, 1), **get_bmi_category_info(bmi)}
+
+
+CALCULATORS = (
+    CalculatorSpec(
+        slug='age-calculator',
+        view='age_calculator',
+        name='Age Calculator',
+        description='Calculate your exact age in years, months, and days',
+        template='calculators/age_calculator.html',
+        keywords='age calculator, calculate age, birth date',
+        related=('date-of-birth-calculator', 'pregnancy-calculator', 'bmi-calculator'),
+    ),
+    CalculatorSpec(
+        slug='bmi-calculator',
+        view='bmi_calculator',
+        name='BMI Calculator',
+        description='Calculate your Body Mass Index and health category',
+        template='calculators/bmi_calculator.html',
+        keywords='BMI calculator, body mass index, health calculator',
+        related=('bmr-calculator', 'calorie-calculator', 'age-calculator'),
+        compute=_bmi_result,
+        schema=BMI,
+    ),
+    CalculatorSpec(
+        slug='bmr-calculator',
+        view='bmr_calculator',
+        name='BMR Calculator',
+        description='Calculate your Basal Metabolic Rate and daily calorie needs',
+        template='calculators/bmr_calculator.html',
+        title='BMR Calculator - Calculate Your Basal Metabolic Rate | Free Tool',
+        meta_description=(
+            'Free BMR calculator - calculate your Basal Metabolic Rate and find out how many '
+            'calories your body burns at rest. Get your TDEE for different activity levels.'
+        ),
+        keywords=(
+            'BMR calculator, basal metabolic rate, metabolism calculator, calories burned at rest, '
+            'TDEE calculator, daily calorie needs, metabolic rate calculator, resting energy '
+            'expenditure'
+        ),
+        related=('calorie-calculator', 'bmi-calculator', 'age-calculator'),
+        compute=calculate_bmr,
+        schema=BMR,
+    ),
+    CalculatorSpec(
+        slug='gpa-calculator',
+        view='gpa_calculator',
+        name='GPA Calculator',
+        description='Calculate your Grade Point Average from your grades and credit hours',
+        template='calculators/gpa_calculator.html',
+        keywords='GPA calculator, grade point average, academic calculator',
+        related=('grade-calculator', 'percentage-calculator', 'citation-generator'),
+    ),
+    CalculatorSpec(
+        slug='grade-calculator',
+        view='grade_calculator',
+        name='Grade Calculator',
+        description='Calculate final grades, test grades, semester averages, and weighted grades',
+        template='calculators/grade_calculator.html',
+        title='Grade Calculator - Final Grade, Test Grade & Semester Average Calculator | Free Tool',
+        meta_description=(
+            'Free grade calculator to calculate final grades, test grades, semester averages, and '
+            'weighted grades. Find out what you need on your final exam. Calculate GPA and track '
+            'your academic progress with our grade average calculator.'
+        ),
+        keywords=(
+            'grade calculator, final grade calculator, test grade calculator, semester grade '
+            'calculator, grade average calculator, weighted grade calculator, what grade do I need '
+            'calculator, calculate my grade, final exam grade calculator, college grade calculator'
+        ),
+        related=('gpa-calculator', 'percentage-calculator', 'citation-generator'),
+    ),
+    CalculatorSpec(
+        slug='loan-calculator',
+        view='loan_calculator',
+        name='Loan Calculator',
+        description='Calculate monthly payments, total interest, and amortization schedule for any loan',
+        template='calculators/loan_calculator.html',
+        title='Loan Calculator - Calculate Monthly Payments & Interest | Free Online Tool',
+        meta_description=(
+            'Free loan calculator to calculate monthly payments, total interest, and amortization '
+            'schedule. Compare loan terms, rates, and payment frequencies. Get instant results for '
+            'personal loans, mortgages, auto loans, and more.'
+        ),
+        keywords=(
+            'loan calculator, monthly payment calculator, mortgage calculator, auto loan calculator, '
+            'personal loan calculator, loan payment, interest calculator, amortization schedule, '
+            'loan comparison, debt calculator'
+        ),
+        related=('mortgage-calculator', '401k-calculator', 'percentage-calculator'),
+        compute=calculate_loan_payment,
+        schema=LOAN,
+    ),
+    CalculatorSpec(
+        slug='mortgage-calculator',
+        view='mortgage_calculator',
+        name='Mortgage Calculator',
+        description='Calculate monthly mortgage payments with taxes, insurance, and PMI',
+        template='calculators/mortgage_calculator.html',
+        title='Mortgage Calculator - Calculate Monthly Payments & Payoff Schedule | Free Tool',
+        meta_description=(
+            'Free mortgage calculator and mortgage payment calculator. Calculate your monthly '
+            'mortgage payment including property taxes, insurance, PMI, and HOA fees. See your '
+            'mortgage payoff schedule and total interest. Simple mortgage rate calculator for home '
+            'buyers.'
+        ),
+        keywords=(
+            'mortgage calculator, mortgage payment calculator, mortgage loan calculator, mortgage '
+            'payoff calculator, mortgage rate calculator, simple mortgage calculator, home loan '
+            'calculator, monthly mortgage payment, calculate mortgage, mortgage estimator'
+        ),
+        related=('loan-calculator', '401k-calculator', 'percentage-calculator'),
+        compute=calculate_mortgage,
+        schema=MORTGAGE,
+    ),
+    CalculatorSpec(
+        slug='percentage-calculator',
+        view='percentage_calculator',
+        name='Percentage Calculator',
+        description='Calculate percentages, percentage changes, discounts, tips, and more',
+        template='calculators/percentage_calculator.html',
+        title='Percentage Calculator - Calculate Percentages, Discounts, Tips & More | Free Online Tool',
+        meta_description=(
+            'Free percentage calculator to calculate percentages, percentage changes, discounts, '
+            'markups, tips, and more. Instant results with detailed breakdowns. Works on all '
+            'devices.'
+        ),
+        keywords=(
+            'percentage calculator, calculate percentage, percentage change calculator, discount '
+            'calculator, tip calculator, markup calculator, percentage of a number, how to calculate '
+            'percentage, percentage increase calculator, percentage decrease calculator, online '
+            'percentage calculator, free percentage calculator'
+        ),
+        related=('grade-calculator', 'loan-calculator', 'gpa-calculator'),
+    ),
+    CalculatorSpec(
+        slug='calorie-calculator',
+        view='calorie_calculator',
+        name='Calorie Calculator',
+        description='Calculate your daily calorie needs for healthy weight management',
+        template='calculators/calorie_calculator.html',
+        title='Calorie Calculator - Calculate Daily Calorie Needs for Weight Management | Free Tool',
+        meta_description=(
+            'Free calorie calculator to determine your daily calorie requirements based on age, '
+            'gender, height, weight, and activity level. Get personalized recommendations for '
+            'healthy weight management, weight loss, and weight gain goals.'
+        ),
+        keywords=(
+            'calorie calculator, daily calorie needs, BMR calculator, TDEE calculator, weight loss '
+            'calculator, weight management, calories per day, metabolic rate calculator, calorie '
+            'requirements, healthy weight loss, calorie deficit calculator, maintenance calories'
+        ),
+        related=('bmr-calculator', 'bmi-calculator', 'pregnancy-calculator'),
+    ),
+    CalculatorSpec(
+        slug='date-of-birth-calculator',
+        view='date_of_birth_calculator',
+        name='Date of Birth Calculator',
+        description='Calculate your exact age from date of birth instantly',
+        template='calculators/date_of_birth_calculator.html',
+        title='Date of Birth Calculator - Calculate Age from Date of Birth | Free Age Calculator Online',
+        meta_description=(
+            'Free date of birth calculator to calculate age from date of birth instantly. Age '
+            'calculator online by date of birth shows your exact age in years, months, days, hours, '
+            'and seconds. Calculate age based on date of birth accurately.'
+        ),
+        keywords=(
+            'date of birth calculator, calculate age from date of birth, age calculator online by '
+            'date of birth, calculate age based on date of birth, age from dob, birth date age '
+            'calculator, exact age calculator, age calculator by date of birth, how to calculate age '
+            'from date of birth, find age from date of birth'
+        ),
+        related=('age-calculator', 'pregnancy-calculator', 'bmi-calculator'),
+    ),
+    CalculatorSpec(
+        slug='pregnancy-calculator',
+        view='pregnancy_calculator',
+        name='Pregnancy Calculator',
+        description='Calculate your pregnancy due date and track your pregnancy week by week',
+        template='calculators/pregnancy_calculator.html',
+        title='Pregnancy Calculator - Due Date & Week Calculator | Free Pregnancy Tool',
+        meta_description=(
+            "Free pregnancy calculator and pregnancy due date calculator. Calculate your baby's due "
+            'date, track pregnancy week by week, understand calculation of pregnancy, and learn '
+            'about early signs of pregnancy. Accurate and easy to use.'
+        ),
+        keywords=(
+            'pregnancy calculator, pregnancy due date calculator, due date calculator, calculation '
+            'of pregnancy, early signs of pregnancy, pregnancy week calculator, how to calculate '
+            'pregnancy, pregnancy tracker, conception calculator, trimester calculator, pregnancy '
+            'symptoms'
+        ),
+        related=('calorie-calculator', 'bmi-calculator', 'age-calculator'),
+        compute=calculate_pregnancy,
+        schema=PREGNANCY,
+    ),
+    CalculatorSpec(
+        slug='401k-calculator',
+        view='k401_calculator',
+        name='401k Calculator',
+        description='Calculate your retirement savings with compound interest and employer matching',
+        template='calculators/401k_calculator.html',
+        title='401k Calculator - Plan Your Retirement Savings | Free Retirement Tool',
+        meta_description=(
+            'Free 401k retirement calculator. See how much you could save by retirement with '
+            'contributions, employer matching, and compound interest. Plan your financial future '
+            'today.'
+        ),
+        keywords=(
+            '401k calculator, retirement calculator, retirement savings calculator, 401k planner, '
+            'retirement planning tool, compound interest calculator, employer match calculator, '
+            'retirement nest egg, 401k projection, retirement fund calculator'
+        ),
+        related=('mortgage-calculator', 'loan-calculator', 'percentage-calculator'),
+        compute=calculate_401k,
+        schema=K401,
+    ),
+    CalculatorSpec(
+        slug='citation-generator',
+        view='citation_generator',
+        name='Citation Generator',
+        description='Generate citations in APA, MLA, or Chicago format',
+        template='calculators/citation_generator.html',
+        title='Citation Generator - Create APA, MLA, Chicago Citations | Free Tool',
+        meta_description=(
+            'Free citation generator for APA, MLA, and Chicago styles. Create properly formatted '
+            'citations for books, websites, journals, magazines, and videos. Copy and paste ready '
+            'citations for your academic papers.'
+        ),
+        keywords=(
+            'citation generator, APA citation, MLA citation, Chicago citation, bibliography '
+            'generator, reference generator, cite sources, academic citation tool, format citations, '
+            'works cited generator'
+        ),
+        related=('grade-calculator', 'gpa-calculator', 'percentage-calculator'),
+    ),
+)
+
+REGISTRY: Mapping[str, CalculatorSpec] = MappingProxyType({spec.slug: spec for spec in CALCULATORS})
+
+RELATED: Mapping[str, Tuple[CalculatorSpec, ...]] = MappingProxyType({
+    spec.slug: tuple(REGISTRY[slug] for slug in spec.related) for spec in CALCULATORS
+})
+
+
+@lru_cache(maxsize=None)
+def page_path(slug: str) -> str:
+    """Path of a registered calculator's own page."""
+    return reverse(REGISTRY[slug].url_name)
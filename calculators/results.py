@@ -0,0 +1,65 @@
+"""
+Row types for calculator results.
+
+Results stay dicts at the top level (views add keys such as ``mode`` and
+``recommendations``), but their repeated rows are slotted dataclasses: about
+a third of the memory of the equivalent dict, read by attribute in templates
+and serialized natively by ``calculators.serialization``. Rows that come out
+of a cache are shared between callers, so they are frozen: build a changed
+copy with ``dataclasses.replace``.
+"""
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(slots=True, frozen=True)
+class ActivityLevel:
+    name: str
+    description: str
+    multiplier: float
+    calories: float
+
+
+@dataclass(slots=True, frozen=True)
+class LoanPayment:
+    payment_number: int
+    payment_amount: float
+    principal_payment: float
+    interest_payment: float
+    remaining_balance: float
+
+
+@dataclass(slots=True, frozen=True)
+class MortgagePayment:
+    month: int
+    payment: float
+    principal: float
+    interest: float
+    balance: float
+
+
+@dataclass(slots=True, frozen=True)
+class RetirementYear:
+    age: int
+    contribution: float
+    employer: float
+    interest: float
+    balance: float
+
+
+@dataclass(slots=True, frozen=True)
+class Milestone:
+    week: int
+    description: str
+    date: str
+
+
+@dataclass(slots=True, frozen=True)
+class TimelineWeek:
+    week: int
+    start_date: str
+    end_date: str
+    trimester: int
+    trimester_name: str
+    milestone: Optional[str]
+    is_current: bool
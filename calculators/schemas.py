@@ -0,0 +1,508 @@
+"""
+Compiled input schemas for the calculator views and the JSON API.
+
+Each schema lists its fields once. Field constructors return converter
+closures with their bounds and choices already bound, and ``Schema`` keeps a
+flat tuple of them, so parsing a submission is a single pass over the fields
+with no per-request setup. Form-encoded and JSON bodies are read the same
+way; values come out typed (``int``, ``float``, ``str``, ``date``) and every
+problem is collected into one ``SchemaError`` keyed by field name.
+"""
+import json
+import math
+from datetime import date
+from typing import Any, Callable, Dict, Iterable, List, Mapping, NamedTuple, Optional, Sequence
+
+from django.conf import settings
+
+from .business_days import DEFAULT_REGION, REGIONS
+from .metabolic import DEFAULT_FORMULA, FORMULAS
+from .pregnancy import MAX_CYCLE, MIN_CYCLE
+from .taxes import FILING_STATUSES, STATES
+
+NON_FIELD_ERRORS = '__all__'
+
+# Defaults for the CALCULATOR_MAX_BODY_SIZE and CALCULATOR_MAX_ROWS settings
+MAX_BODY_SIZE = 256 * 1024
+MAX_ROWS = 500
+# Longest loan term the loan and mortgage forms accept, in years
+MAX_LOAN_YEARS = 50
+
+
+def max_body_size() -> int:
+    return getattr(settings, 'CALCULATOR_MAX_BODY_SIZE', MAX_BODY_SIZE)
+
+
+def max_rows() -> int:
+    """Most rows a repeated group (assignments, courses) may submit."""
+    return getattr(settings, 'CALCULATOR_MAX_ROWS', MAX_ROWS)
+
+
+class SchemaError(ValueError):
+    """Invalid input; ``errors`` maps field names to messages."""
+
+    def __init__(self, errors: Dict[str, str]):
+        self.errors = errors
+        super().__init__('; '.join(
+            message if field == NON_FIELD_ERRORS else f'{field} {message}' for field, message in errors.items()
+        ))
+
+
+class Field(NamedTuple):
+    name: str
+    convert: Callable[[Any], Any]
+    required: bool = True
+    default: Any = None
+    argument: Optional[str] = None  # compute function argument, when it differs from the name
+
+
+def _bounded(value, minimum, maximum):
+    if minimum is not None and value < minimum:
+        raise ValueError(f'must be at least {minimum}')
+    if maximum is not None and value > maximum:
+        raise ValueError(f'must be at most {maximum}')
+    return value
+
+
+def number(name: str, minimum: Optional[float] = None, maximum: Optional[float] = None,
+           default: Optional[float] = None, required: bool = True, argument: Optional[str] = None) -> Field:
+    """A finite float. Giving a default makes the field optional."""
+    def convert(value):
+        if isinstance(value, bool):
+            raise ValueError('must be a number')
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            raise ValueError('must be a number')
+        if not math.isfinite(value):
+            raise ValueError('must be a number')
+        return _bounded(value, minimum, maximum)
+    return Field(name, convert, required and default is None, default, argument)
+
+
+def integer(name: str, minimum: Optional[int] = None, maximum: Optional[int] = None,
+            default: Optional[int] = None, required: bool = True, argument: Optional[str] = None) -> Field:
+    """A whole number; "12" and "12.0" are both accepted."""
+    def convert(value):
+        if isinstance(value, bool):
+            raise ValueError('must be a whole number')
+        if not isinstance(value, int):
+            try:
+                value = int(value)
+            except (TypeError, ValueError):
+                try:
+                    value = float(value)
+                except (TypeError, ValueError):
+                    raise ValueError('must be a whole number')
+                if not value.is_integer():
+                    raise ValueError('must be a whole number')
+                value = int(value)
+        return _bounded(value, minimum, maximum)
+    return Field(name, convert, required and default is None, default, argument)
+
+
+def choice(name: str, choices: Iterable[str], default: Optional[str] = None,
+           argument: Optional[str] = None) -> Field:
+    """One of a fixed set of strings."""
+    allowed = frozenset(choices)
+    message = f'must be one of {", ".join(sorted(allowed))}'
+
+    def convert(value):
+        if value not in allowed:
+            raise ValueError(message)
+        return value
+    return Field(name, convert, default is None, default, argument)
+
+
+def text(name: str, max_length: Optional[int] = None, default: Optional[str] = None,
+         required: bool = True, argument: Optional[str] = None) -> Field:
+    def convert(value):
+        if not isinstance(value, str):
+            raise ValueError('must be text')
+        if max_length is not None and len(value) > max_length:
+            raise ValueError(f'must be at most {max_length} characters')
+        return value
+    return Field(name, convert, required and default is None, default, argument)
+
+
+def grade(name: str) -> Field:
+    """A percentage (as a float) or a letter grade (as text)."""
+    def convert(value):
+        if isinstance(value, str):
+            try:
+                value = float(value)
+            except ValueError:
+                if len(value) > 3:
+                    raise ValueError('must be a letter grade or a percentage')
+                return value
+        elif isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError('must be a letter grade or a percentage')
+        if not math.isfinite(value):
+            raise ValueError('must be a letter grade or a percentage')
+        return float(value)
+    return Field(name, convert)
+
+
+def date_parts(prefix: str) -> List[Field]:
+    """Month, day and year fields named ``<prefix>month`` and so on."""
+    return [
+        integer(f'{prefix}month', 1, 12),
+        integer(f'{prefix}day', 1, 31),
+        integer(f'{prefix}year', 1, 9999),
+    ]
+
+
+def combine_date(prefix: str, target: str) -> Callable[[Dict[str, Any]], None]:
+    """Check storing the date from :func:`date_parts` fields under ``target``."""
+    def check(values):
+        try:
+            values[target] = date(values[f'{prefix}year'], values[f'{prefix}month'], values[f'{prefix}day'])
+        except ValueError:
+            raise SchemaError({f'{prefix}day': 'is not a valid day of that month'})
+    return check
+
+
+class Schema:
+    """
+    Ordered fields plus checks that run once every field has parsed.
+
+    A check receives the typed values, may add derived values to them, and
+    raises SchemaError (or ValueError for an error not tied to a field).
+    """
+    __slots__ = ('fields', 'checks', '_plan')
+
+    def __init__(self, *fields: Field, checks: Sequence[Callable[[Dict[str, Any]], None]] = ()):
+        self.fields = fields
+        self.checks = tuple(checks)
+        self._plan = tuple((field.name, field.convert, field.required, field.default) for field in fields)
+
+    def parse(self, data: Mapping[str, Any], prefix: str = '') -> Dict[str, Any]:
+        """
+        Typed values from submitted data.
+
+        ``data`` is a QueryDict or a decoded JSON object; blank strings count
+        as missing. Field names are looked up with ``prefix`` prepended, and
+        errors are keyed the same way.
+        """
+        get = data.get
+        values = {}
+        errors = {}
+        for name, convert, required, default in self._plan:
+            value = get(prefix + name)
+            if value.__class__ is str:
+                value = value.strip()
+            if value is None or value == '':
+                if required:
+                    errors[prefix + name] = 'is required'
+                else:
+                    values[name] = default
+                continue
+            try:
+                values[name] = convert(value)
+            except ValueError as e:
+                errors[prefix + name] = str(e)
+
+        if not errors:
+            for check in self.checks:
+                try:
+                    check(values)
+                except SchemaError as e:
+                    errors.update({prefix + name: message for name, message in e.errors.items()})
+                    break
+                except ValueError as e:
+                    errors[NON_FIELD_ERRORS] = str(e)
+                    break
+        if errors:
+            raise SchemaError(errors)
+        return values
+
+    def arguments(self, data: Mapping[str, Any]) -> Dict[str, Any]:
+        """Parsed values keyed by compute function argument."""
+        values = self.parse(data)
+        return {field.argument or field.name: values[field.name] for field in self.fields}
+
+    def submitted(self, data: Mapping[str, Any]) -> Dict[str, str]:
+        """The submitted text of each field, for redisplaying the form and building permalinks."""
+        echo = {}
+        for name, _, _, default in self._plan:
+            value = data.get(name)
+            if value is None or value == '':
+                value = '' if default is None else default
+            echo[name] = str(value).strip()
+        return echo
+
+    def is_blank(self, data: Mapping[str, Any], prefix: str = '') -> bool:
+        """Whether none of the fields were filled in."""
+        return all(data.get(prefix + name) in (None, '') for name, _, _, _ in self._plan)
+
+    def is_complete(self, data: Mapping[str, Any], prefix: str = '') -> bool:
+        """Whether every required field was filled in."""
+        return all(data.get(prefix + name) not in (None, '') for name, _, required, _ in self._plan if required)
+
+
+def request_data(request) -> Mapping[str, Any]:
+    """
+    The submitted fields: the decoded JSON object for JSON requests, else
+    request.POST. Bodies over ``max_body_size()`` bytes are refused before
+    they are read.
+    """
+    try:
+        length = int(request.META.get('CONTENT_LENGTH') or 0)
+    except ValueError:
+        length = 0
+    limit = max_body_size()
+    if length > limit:
+        raise SchemaError({NON_FIELD_ERRORS: f'Request body is larger than {limit} bytes'})
+    if request.content_type != 'application/json':
+        return request.POST
+    try:
+        data = json.loads(request.body)
+    except ValueError:
+        raise SchemaError({NON_FIELD_ERRORS: 'Request body is not valid JSON'})
+    if not isinstance(data, dict):
+        raise SchemaError({NON_FIELD_ERRORS: 'Expected a JSON object'})
+    return data
+
+
+def parse_formset(schema: Schema, data: Mapping[str, Any], prefix: str = 'form',
+                  max_rows: int = 20) -> List[Dict[str, Any]]:
+    """
+    Rows submitted in Django formset layout (``<prefix>-TOTAL_FORMS`` and
+    ``<prefix>-<i>-<field>``). Rows left completely blank are skipped.
+    """
+    total = integer(f'{prefix}-TOTAL_FORMS', 0, max_rows)
+    count = Schema(total).parse(data)[total.name]
+    rows = []
+    errors = {}
+    for index in range(count):
+        row_prefix = f'{prefix}-{index}-'
+        if schema.is_blank(data, row_prefix):
+            continue
+        try:
+            rows.append(schema.parse(data, row_prefix))
+        except SchemaError as e:
+            errors.update(e.errors)
+    if errors:
+        raise SchemaError(errors)
+    return rows
+
+
+def submitted_rows(data: Mapping[str, Any], key: str, prefix: str, columns: Mapping[str, str],
+                   limit: Optional[int] = None) -> List[Mapping[str, Any]]:
+    """
+    Raw rows of a repeated group, in order.
+
+    Rows come from a JSON array of objects under ``key``, or from fields
+    named ``<prefix>_<column>_<index>`` (``assignment_score_0``), where
+    ``columns`` maps each column to the row key it fills. The fields are
+    scanned once whatever indexes they claim, and more than ``limit`` rows
+    (default ``max_rows()``) is an error rather than work.
+    """
+    limit = max_rows() if limit is None else limit
+    too_many = SchemaError({NON_FIELD_ERRORS: f'At most {limit} rows can be submitted'})
+
+    array = data.get(key)
+    if isinstance(array, list):
+        if len(array) > limit:
+            raise too_many
+        if not all(isinstance(row, dict) for row in array):
+            raise SchemaError({key: 'must be a list of objects'})
+        return array
+
+    prefix += '_'
+    rows = {}
+    for name in data:
+        if not name.startswith(prefix):
+            continue
+        column, _, index = name[len(prefix):].rpartition('_')
+        if column not in columns or not index.isdigit():
+            continue
+        row = rows.get(int(index))
+        if row is None:
+            if len(rows) >= limit:
+                raise too_many
+            row = rows[int(index)] = {}
+        row[columns[column]] = data.get(name)
+    return [rows[index] for index in sorted(rows)]
+
+
+def parse_rows(schema: Schema, rows: Iterable[Mapping[str, Any]], key: str) -> List[Dict[str, Any]]:
+    """
+    Parse raw rows, skipping any that lack a required field. Errors are
+    keyed ``<key>.<row>.<field>``.
+    """
+    parsed = []
+    errors = {}
+    for index, row in enumerate(rows):
+        if not schema.is_complete(row):
+            continue
+        try:
+            parsed.append(schema.parse(row))
+        except SchemaError as e:
+            errors.update({f'{key}.{index}.{name}': message for name, message in e.errors.items()})
+    if errors:
+        raise SchemaError(errors)
+    return parsed
+
+
+# Calculator schemas
+
+def _bmi_limits(values):
+    # Plausibility limits per unit system, on top of the field bounds
+    weight_limit, height_limit = (500, 250) if values['unit_system'] == 'metric' else (1000, 120)
+    if values['weight'] > weight_limit:
+        raise ValueError(f"Weight seems unrealistic for {values['unit_system']} system")
+    if values['height'] > height_limit:
+        raise ValueError(f"Height seems unrealistic for {values['unit_system']} system")
+
+
+BMI = Schema(
+    number('weight', 1, 1000),
+    number('height', 1, 300),
+    choice('unit_system', ('metric', 'imperial'), default='metric'),
+    checks=(_bmi_limits,),
+)
+
+BMR = Schema(
+    integer('age', 0),
+    choice('gender', ('male', 'female')),
+    number('height', 0),
+    choice('height_unit', ('cm', 'inches'), default='cm'),
+    number('weight', 0),
+    choice('weight_unit', ('kg', 'lbs'), default='kg'),
+    choice('formula', FORMULAS, default=DEFAULT_FORMULA),
+    number('body_fat', 0, 100, required=False),
+)
+
+LOAN = Schema(
+    number('loan_amount', 0, argument='principal'),
+    number('interest_rate', 0, argument='annual_rate'),
+    number('loan_term', 0, MAX_LOAN_YEARS, argument='years'),
+    integer('payment_frequency', 1, 365, default=12),
+)
+
+MORTGAGE = Schema(
+    number('home_price', 0),
+    number('down_payment', 0),
+    number('interest_rate', 0),
+    integer('loan_term', 1, MAX_LOAN_YEARS),
+    number('property_tax', 0, default=0),
+    number('home_insurance', 0, default=0),
+    number('hoa_fees', 0, default=0),
+)
+
+K401 = Schema(
+    integer('current_age'),
+    integer('retirement_age'),
+    number('current_balance', 0, default=0),
+    number('annual_salary', 0),
+    number('contribution_rate', 0, 100),
+    number('employer_match', 0, 100, default=0),
+    number('return_rate'),
+)
+
+# Optional tax comparison on the 401k page; no filing status means it is off
+K401_TAX = Schema(
+    choice('filing_status', FILING_STATUSES, default=''),
+    choice('state', STATES, default=''),
+    number('salary_growth', -10, 20, default=3),
+)
+
+AGE = Schema(
+    *date_parts('birth_'),
+    *date_parts('target_'),
+    checks=(combine_date('birth_', 'birth_date'), combine_date('target_', 'target_date')),
+)
+
+# Optional working-day options of the age and date of birth calculators
+BUSINESS_DAYS = Schema(
+    choice('region', REGIONS, default=DEFAULT_REGION),
+    integer('business_days', -36500, 36500, default=0),
+)
+
+PREGNANCY_METHODS = ('lmp', 'conception', 'due_date')
+
+_pregnancy_options = (
+    choice('calc_method', PREGNANCY_METHODS, default='lmp'),
+    integer('cycle_length', MIN_CYCLE, MAX_CYCLE, default=28),
+)
+
+# JSON API: the date as month/day/year whatever the method
+PREGNANCY = Schema(*_pregnancy_options, *date_parts(''), checks=(combine_date('', 'date'),))
+
+# The page form names the date fields after the method
+PREGNANCY_FORMS = {
+    method: Schema(*_pregnancy_options, *date_parts(prefix), checks=(combine_date(prefix, 'date'),))
+    for method, prefix in zip(PREGNANCY_METHODS, ('lmp_', 'con_', 'due_'))
+}
+
+GPA_ROW = Schema(
+    text('subject_name', 200),
+    choice('grade', ('A+', 'A', 'A-', 'B+', 'B', 'B-', 'C+', 'C', 'C-', 'D+', 'D', 'F')),
+    number('credit_hours', 0.5, 10),
+)
+
+GRADE_OPTIONS = Schema(
+    choice('calc_mode', ('final', 'needed', 'semester'), default='final'),
+    text('grade_scale', required=False),
+)
+
+ASSIGNMENT_ROW = Schema(
+    text('name', 200),
+    number('score'),
+    number('max_points'),
+    number('weight'),
+    text('category', 100, default='Assignment'),
+)
+ASSIGNMENT_COLUMNS = {'name': 'name', 'score': 'score', 'max': 'max_points', 'weight': 'weight',
+                      'category': 'category'}
+
+COURSE_ROW = Schema(
+    text('course_name', 200),
+    grade('grade'),
+    number('credits'),
+)
+COURSE_COLUMNS = {'name': 'course_name', 'grade': 'grade', 'credits': 'credits'}
+
+GRADE_NEEDED = Schema(
+    number('current_grade'),
+    number('desired_grade'),
+    number('final_weight', 0, 100),
+)
+
+# Goal seeking (calculators.solvers)
+
+SOLVE_APR = Schema(
+    number('loan_amount', 0, argument='principal'),
+    number('payment', 0),
+    number('loan_term', 0, MAX_LOAN_YEARS, argument='years'),
+    integer('payment_frequency', 1, 365, default=12),
+    number('fees', 0, default=0),
+)
+
+SOLVE_TERM = Schema(
+    number('loan_amount', 0, argument='principal'),
+    number('interest_rate', 0, argument='annual_rate'),
+    number('payment', 0),
+    integer('payment_frequency', 1, 365, default=12),
+)
+
+SOLVE_HOME_PRICE = Schema(
+    number('monthly_budget', 0),
+    number('down_payment', 0),
+    number('interest_rate', 0),
+    integer('loan_term', 1, MAX_LOAN_YEARS),
+    number('property_tax', 0, default=0),
+    number('home_insurance', 0, default=0),
+    number('hoa_fees', 0, default=0),
+)
+
+SOLVE_CONTRIBUTION = Schema(
+    number('target', 0),
+    integer('current_age'),
+    integer('retirement_age'),
+    number('current_balance', 0, default=0),
+    number('annual_salary', 0),
+    number('employer_match', 0, 100, default=0),
+    number('return_rate'),
+)
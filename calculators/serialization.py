@@ -0,0 +1,50 @@
+"""
+JSON responses for calculator results.
+
+orjson is used when it is installed: it serializes the result row
+dataclasses, dates and floats natively and is several times faster than the
+stdlib encoder. Without it, DjangoJSONEncoder is taught the row types.
+"""
+import json
+from dataclasses import fields, is_dataclass
+from decimal import Decimal
+from typing import Any
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse
+from django.utils.functional import Promise
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _orjson_default(value):
+    # Types orjson leaves to us, handled as DjangoJSONEncoder does
+    if isinstance(value, (Decimal, Promise)):
+        return str(value)
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+
+class ResultEncoder(DjangoJSONEncoder):
+    def default(self, o):
+        if is_dataclass(o) and not isinstance(o, type):
+            return {field.name: getattr(o, field.name) for field in fields(o)}
+        return super().default(o)
+
+
+def dumps(data: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, cls=ResultEncoder).encode()
+
+
+class JsonResponse(HttpResponse):
+    """django.http.JsonResponse, serialized with :func:`dumps`."""
+
+    def __init__(self, data, safe=True, **kwargs):
+        if safe and not isinstance(data, dict):
+            raise TypeError('In order to allow non-dict objects to be serialized set the safe parameter to False.')
+        kwargs.setdefault('content_type', 'application/json')
+        super().__init__(content=dumps(data), **kwargs)
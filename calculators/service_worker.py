@@ -0,0 +1,63 @@
+"""
+Inputs for the generated service worker (``/sw.js``).
+
+The worker precaches the page shell: the built vendor assets from
+``assets.json`` plus our own stylesheet and scripts. Its cache names carry a
+version derived from those files, so a new build or an edited script makes
+browsers install a fresh worker and drop the old caches.
+"""
+import hashlib
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Tuple
+
+from django.contrib.staticfiles import finders
+from django.template import loader
+from django.templatetags.static import static
+
+from .assets import load_build_manifest
+
+SERVICE_WORKER_TEMPLATE = 'calculators/sw.js'
+
+# Unhashed static files every page loads
+SHELL_STATIC = ('css/style.css', 'js/csrf.js', 'js/sw-register.js')
+
+# Same-origin paths the worker never caches or serves from cache
+UNCACHED_PREFIXES = ('/admin/', '/api/', '/ajax/')
+
+
+def precache_urls() -> List[str]:
+    """URLs of the static shell, fetched when the worker installs."""
+    built = load_build_manifest()
+    return [static(path) for _, path in sorted(built.items())] + [static(path) for path in SHELL_STATIC]
+
+
+@lru_cache(maxsize=64)
+def _file_digest(path: str, mtime: int) -> str:
+    return hashlib.md5(Path(path).read_bytes()).hexdigest()
+
+
+def _versioned_files() -> List[Tuple[str, int]]:
+    paths = [finders.find(path) for path in SHELL_STATIC]
+    paths.append(loader.get_template(SERVICE_WORKER_TEMPLATE).origin.name)
+    return [(path, Path(path).stat().st_mtime_ns) for path in paths if path]
+
+
+def cache_version() -> str:
+    """
+    Fingerprint of everything the worker caches and of the worker itself.
+
+    Built assets already have content hashes in their names; the unhashed
+    shell files and the worker template are hashed by content.
+    """
+    parts = precache_urls() + [_file_digest(path, mtime) for path, mtime in _versioned_files()]
+    return hashlib.md5('|'.join(parts).encode()).hexdigest()[:12]
+
+
+def service_worker_etag(request) -> str:
+    """
+    ETag of ``/sw.js``. It is the cache version rather than the page ETag,
+    so an edited stylesheet or script (which the page ETag does not track)
+    still makes browsers fetch and install a new worker.
+    """
+    return cache_version()
@@ -0,0 +1,370 @@
+"""
+Cache backend shared by every worker process on a host, with no server.
+
+Entries live in a memory-mapped file (under /dev/shm where it exists, so it
+never touches disk) laid out as two fixed tables of equal-sized slots
+grouped into small sets: many small slots for results and tokens, and a few
+large ones for rendered pages and other big values. A value goes to the
+smallest table it fits; within a table a key hashes to one set, and
+eviction replaces the least recently used slot of that set.
+
+Reads take no lock. Each slot starts with a sequence number that writers
+make odd before changing the slot and even again afterwards; a reader
+copies the slot and retries if the number was odd or moved meanwhile.
+Writers serialize on an ``flock`` of the file (and a thread lock within the
+process). Each process maps the file once, however many per-thread backend
+instances Django creates, and a forked child maps it afresh. Values are
+pickled, as with Django's own backends; one that fits in no slot is simply
+not cached.
+
+Configure it like any other backend::
+
+    CACHES = {
+        'default': {
+            'BACKEND': 'calculators.shm_cache.SharedMemoryCache',
+            'LOCATION': 'calculator-website',
+            'OPTIONS': {'SLOTS': 2048, 'SLOT_SIZE': 16384, 'LARGE_SLOTS': 64, 'LARGE_SLOT_SIZE': 262144},
+        }
+    }
+
+A LOCATION without a directory is placed in /dev/shm (or the temp
+directory), so give each checkout its own name. The file name carries the
+table geometry: changing SLOTS, SLOT_SIZE, LARGE_SLOTS, LARGE_SLOT_SIZE or
+WAYS starts a new file instead of resizing one that running workers still
+have mapped. Remove the old file once they are gone.
+"""
+import fcntl
+import hashlib
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+import threading
+import time
+from typing import Dict, List, NamedTuple, Tuple
+
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+
+MAGIC = b'CALCSHM2'
+# magic, slots, slot size, large slots, large slot size, ways
+HEADER = struct.Struct('<8sIIIII')
+HEADER_SIZE = 64
+# sequence, key length, key hash, expiry, last use, value length
+SLOT = struct.Struct('<IIQddI4x')
+SEQUENCE = struct.Struct('<I')
+LAST_USED = struct.Struct('<d')
+LAST_USED_OFFSET = 24
+
+DEFAULT_SLOTS = 2048
+DEFAULT_SLOT_SIZE = 16 * 1024
+# Rendered pages run to about 130 KB
+DEFAULT_LARGE_SLOTS = 64
+DEFAULT_LARGE_SLOT_SIZE = 256 * 1024
+DEFAULT_WAYS = 8
+# Reads of a slot that keeps changing give up and count as a miss
+READ_RETRIES = 8
+NEVER = float('inf')
+
+
+def _key_hash(key: bytes) -> int:
+    # Stable across processes, unlike hash(); 0 marks an empty slot
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), 'little') or 1
+
+
+def _default_directory() -> str:
+    return '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir()
+
+
+class _Table(NamedTuple):
+    """One table of equal-sized slots within the file."""
+    start: int
+    slots: int
+    slot_size: int
+    sets: int
+
+    @property
+    def end(self) -> int:
+        return self.start + self.slots * self.slot_size
+
+
+class _Segment:
+    """A process's mapping of a cache file, and the locks its writers take."""
+    __slots__ = ('map', 'fd', 'thread_lock')
+
+    def __init__(self, path: str, size: int, header: bytes):
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                current = os.fstat(fd).st_size
+                if current == 0:
+                    os.ftruncate(fd, size)
+                    os.pwrite(fd, header, 0)
+                elif current != size or os.pread(fd, len(header), 0) != header:
+                    # Never resize a file other processes may have mapped
+                    raise ValueError(f"{path} is not a cache file of this geometry")
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            self.map = mmap.mmap(fd, size)
+        except BaseException:
+            os.close(fd)
+            raise
+        # Kept open for flock, which belongs to this open file
+        self.fd = fd
+        self.thread_lock = threading.Lock()
+
+    def lock(self) -> '_SegmentLock':
+        return _SegmentLock(self.thread_lock, self.fd)
+
+    def close(self):
+        self.map.close()
+        os.close(self.fd)
+
+
+# Open segments by (path, pid), shared by the per-thread backend instances
+# like LocMemCache's _caches
+_segments: Dict[Tuple[str, int], _Segment] = {}
+_segments_lock = threading.Lock()
+
+
+def _segment_for(path: str, size: int, header: bytes) -> _Segment:
+    key = (path, os.getpid())
+    segment = _segments.get(key)
+    if segment is None:
+        with _segments_lock:
+            segment = _segments.get(key)
+            if segment is None:
+                segment = _segments[key] = _Segment(path, size, header)
+    return segment
+
+
+def close_segments(directory: str):
+    """Unmap this process's cache files under ``directory`` (temporary caches)."""
+    with _segments_lock:
+        for key in [key for key in _segments if key[0].startswith(os.path.join(directory, ''))]:
+            _segments.pop(key).close()
+
+
+def _forget_segments():
+    """In a forked child: drop the parent's mappings and lock files."""
+    global _segments_lock
+    _segments_lock = threading.Lock()
+    for segment in _segments.values():
+        segment.close()
+    _segments.clear()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_forget_segments)
+
+
+class SharedMemoryCache(BaseCache):
+    pickle_protocol = pickle.HIGHEST_PROTOCOL
+
+    def __init__(self, location, params):
+        super().__init__(params)
+        options = params.get('OPTIONS', {})
+        slots = int(options.get('SLOTS', DEFAULT_SLOTS))
+        slot_size = int(options.get('SLOT_SIZE', DEFAULT_SLOT_SIZE))
+        large_slots = int(options.get('LARGE_SLOTS', DEFAULT_LARGE_SLOTS))
+        large_slot_size = int(options.get('LARGE_SLOT_SIZE', DEFAULT_LARGE_SLOT_SIZE))
+        self._ways = int(options.get('WAYS', DEFAULT_WAYS))
+        if slots % self._ways or large_slots % self._ways:
+            raise ValueError('SLOTS and LARGE_SLOTS must be multiples of WAYS')
+        if slot_size <= SLOT.size or (large_slots and large_slot_size <= slot_size):
+            raise ValueError('SLOT_SIZE must exceed the slot header and LARGE_SLOT_SIZE must exceed SLOT_SIZE')
+
+        small = _Table(HEADER_SIZE, slots, slot_size, slots // self._ways)
+        self._tables: List[_Table] = [small]
+        if large_slots:
+            self._tables.append(_Table(small.end, large_slots, large_slot_size, large_slots // self._ways))
+        self._size = self._tables[-1].end
+        self._header = HEADER.pack(MAGIC, slots, slot_size, large_slots, large_slot_size, self._ways)
+
+        location = location or 'calculators-cache'
+        if not os.path.dirname(location):
+            location = os.path.join(_default_directory(), location)
+        # One file per geometry, so a configuration change never resizes a live one
+        self.path = f'{location}.{slots}x{slot_size}+{large_slots}x{large_slot_size}w{self._ways}'
+
+    def _open(self) -> _Segment:
+        # Looked up on every call rather than kept, since a fork replaces it
+        return _segment_for(self.path, self._size, self._header)
+
+    # Slot access
+
+    def _set_offsets(self, table: _Table, key_hash: int):
+        first = table.start + (key_hash % table.sets) * self._ways * table.slot_size
+        return range(first, first + self._ways * table.slot_size, table.slot_size)
+
+    def _read(self, segment, offset, key: bytes, key_hash: int):
+        """(expiry, value bytes) of the slot if it holds ``key``, else None."""
+        for _ in range(READ_RETRIES):
+            sequence, key_length, slot_hash, expires, _, value_length = SLOT.unpack_from(segment, offset)
+            if sequence & 1:
+                continue
+            if slot_hash != key_hash or key_length != len(key):
+                return None
+            start = offset + SLOT.size
+            data = segment[start:start + key_length + value_length]
+            if SEQUENCE.unpack_from(segment, offset)[0] != sequence:
+                continue
+            if data[:key_length] != key:
+                return None
+            return expires, data[key_length:]
+        return None
+
+    def _find(self, segment, key: bytes, key_hash: int):
+        """(table, offset) of the slot holding ``key`` (writers only), else None."""
+        for table in self._tables:
+            for offset in self._set_offsets(table, key_hash):
+                _, key_length, slot_hash, _, _, _ = SLOT.unpack_from(segment, offset)
+                if slot_hash == key_hash and key_length == len(key):
+                    start = offset + SLOT.size
+                    if segment[start:start + key_length] == key:
+                        return table, offset
+        return None
+
+    def _victim(self, segment, table: _Table, key_hash: int, now: float) -> int:
+        """An empty or expired slot of the key's set, else its least recently used."""
+        oldest = None
+        for offset in self._set_offsets(table, key_hash):
+            _, _, slot_hash, expires, used, _ = SLOT.unpack_from(segment, offset)
+            if slot_hash == 0 or expires <= now:
+                return offset
+            if oldest is None or used < oldest[0]:
+                oldest = (used, offset)
+        return oldest[1]
+
+    @staticmethod
+    def _update(segment, offset, key_length, key_hash, expires, used, value_length, data=b''):
+        """
+        Rewrite a slot under the seqlock: the sequence goes odd, then the
+        data and header change, and only then does it go even again.
+        """
+        sequence = SEQUENCE.unpack_from(segment, offset)[0] | 1
+        SEQUENCE.pack_into(segment, offset, sequence)
+        if data:
+            start = offset + SLOT.size
+            segment[start:start + len(data)] = data
+        SLOT.pack_into(segment, offset, sequence, key_length, key_hash, expires, used, value_length)
+        SEQUENCE.pack_into(segment, offset, (sequence + 1) & 0xFFFFFFFF)
+
+    def _write(self, segment, offset, key: bytes, key_hash: int, expires: float, value: bytes):
+        self._update(segment, offset, len(key), key_hash, expires, time.time(), len(value), key + value)
+
+    def _clear_slot(self, segment, offset):
+        self._update(segment, offset, 0, 0, 0.0, 0.0, 0)
+
+    def _encode(self, key, version):
+        key = self.make_and_validate_key(key, version=version).encode()
+        return key, _key_hash(key)
+
+    def _expiry(self, timeout) -> float:
+        expires = self.get_backend_timeout(timeout)
+        return NEVER if expires is None else expires
+
+    # Cache API
+
+    def get(self, key, default=None, version=None):
+        key, key_hash = self._encode(key, version)
+        segment = self._open().map
+        now = time.time()
+        for table in self._tables:
+            for offset in self._set_offsets(table, key_hash):
+                found = self._read(segment, offset, key, key_hash)
+                if found is None:
+                    continue
+                expires, value = found
+                if expires <= now:
+                    return default
+                # Unlocked recency hint; a lost update only skews eviction
+                LAST_USED.pack_into(segment, offset + LAST_USED_OFFSET, now)
+                return pickle.loads(value)
+        return default
+
+    def _store(self, key, value, timeout, version, only_if_missing):
+        key, key_hash = self._encode(key, version)
+        value = pickle.dumps(value, self.pickle_protocol)
+        shared = self._open()
+        segment = shared.map
+        needed = SLOT.size + len(key) + len(value)
+        table = next((table for table in self._tables if needed <= table.slot_size), None)
+        with shared.lock():
+            now = time.time()
+            found = self._find(segment, key, key_hash)
+            if found is not None and only_if_missing:
+                if SLOT.unpack_from(segment, found[1])[3] > now:
+                    return False
+            if found is not None and found[0] is not table:
+                # Moving tables (or not fitting at all): drop the old copy
+                self._clear_slot(segment, found[1])
+                found = None
+            if table is None:
+                return False
+            offset = found[1] if found is not None else self._victim(segment, table, key_hash, now)
+            self._write(segment, offset, key, key_hash, self._expiry(timeout), value)
+            return True
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self._store(key, value, timeout, version, only_if_missing=False)
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        return self._store(key, value, timeout, version, only_if_missing=True)
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        key, key_hash = self._encode(key, version)
+        shared = self._open()
+        segment = shared.map
+        with shared.lock():
+            found = self._find(segment, key, key_hash)
+            if found is None or SLOT.unpack_from(segment, found[1])[3] <= time.time():
+                return False
+            offset = found[1]
+            _, key_length, _, _, used, value_length = SLOT.unpack_from(segment, offset)
+            self._update(segment, offset, key_length, key_hash, self._expiry(timeout), used, value_length)
+            return True
+
+    def delete(self, key, version=None):
+        key, key_hash = self._encode(key, version)
+        shared = self._open()
+        segment = shared.map
+        with shared.lock():
+            found = self._find(segment, key, key_hash)
+            if found is None:
+                return False
+            self._clear_slot(segment, found[1])
+            return True
+
+    def has_key(self, key, version=None):
+        return self.get(key, self._missing_key, version=version) is not self._missing_key
+
+    def clear(self):
+        shared = self._open()
+        segment = shared.map
+        with shared.lock():
+            for table in self._tables:
+                for offset in range(table.start, table.end, table.slot_size):
+                    self._clear_slot(segment, offset)
+
+
+class _SegmentLock:
+    """Exclusive write access: the thread lock, then the file lock."""
+    __slots__ = ('thread_lock', 'fd')
+
+    def __init__(self, thread_lock, fd):
+        self.thread_lock = thread_lock
+        self.fd = fd
+
+    def __enter__(self):
+        self.thread_lock.acquire()
+        try:
+            fcntl.flock(self.fd, fcntl.LOCK_EX)
+        except BaseException:
+            self.thread_lock.release()
+            raise
+
+    def __exit__(self, *exc_info):
+        fcntl.flock(self.fd, fcntl.LOCK_UN)
+        self.thread_lock.release()
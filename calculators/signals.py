@@ -0,0 +1,49 @@
+import logging
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .conditional import bump_content_version
+from .models import Calculator, Feature, HomepageContent, SEOContent, Testimonial
+from .static_export import MANIFEST_NAME, export_root, export_site
+
+logger = logging.getLogger(__name__)
+
+PAGE_CONTENT_MODELS = (Calculator, SEOContent, HomepageContent, Feature, Testimonial)
+
+
+def _usage_only(update_fields):
+    return bool(update_fields) and set(update_fields) <= {'usage_count'}
+
+
+@receiver([post_save, post_delete])
+def bump_page_versions(sender, update_fields=None, **kwargs):
+    """Give every page a new ETag when content they render changes."""
+    if sender in PAGE_CONTENT_MODELS and not _usage_only(update_fields):
+        bump_content_version()
+
+
+@receiver([post_save, post_delete])
+def refresh_static_export(sender, update_fields=None, **kwargs):
+    """
+    Re-export static pages after content they render changes.
+
+    Usage counter bumps are ignored, and nothing happens until the site has
+    been exported once with ``manage.py export_static_site``.
+    """
+    if sender not in PAGE_CONTENT_MODELS or _usage_only(update_fields):
+        return
+    if not (export_root() / MANIFEST_NAME).exists():
+        return
+    transaction.on_commit(_export)
+
+
+def _export():
+    try:
+        report = export_site()
+    except (OSError, ValueError):
+        logger.exception("Static site re-export failed")
+        return
+    if report['written'] or report['removed']:
+        logger.info("Re-exported %s, removed %s", report['written'], report['removed'])
@@ -0,0 +1,285 @@
+"""
+Goal seeking for the finance calculators: the inputs that produce a result.
+
+The forward calculators answer "what will this cost"; these answer "what
+rate is this offer really charging", "how long until this is paid off",
+"how much house can I afford" and "how much do I need to save". Where the
+forward formula can be inverted algebraically (term, contribution) it is;
+the APR has no closed form and is found with a bracketed Newton iteration,
+and the affordable price, whose monthly cost jumps where PMI starts, with
+Brent's method. Every solve takes a few microseconds to tens of
+microseconds.
+"""
+import math
+from types import MappingProxyType
+from typing import Any, Callable, Dict, NamedTuple
+
+from . import schemas
+from .finance import amortize, periodic_rate, to_cents, to_dollars
+
+# Loan, price and rate tolerances, in dollars and per-period rate
+PRICE_TOLERANCE = 0.01
+RATE_TOLERANCE = 1e-12
+MAX_ITERATIONS = 100
+# Longest payoff solve_term reports; anything longer is not a realistic loan
+MAX_TERM_YEARS = 100
+
+# Annual PMI as a fraction of the loan, charged under 20% down (as calculate_mortgage)
+PMI_RATE = 0.01
+PMI_DOWN_PERCENT = 20
+
+
+def brent(f: Callable[[float], float], lo: float, hi: float,
+          tolerance: float = PRICE_TOLERANCE, max_iterations: int = MAX_ITERATIONS) -> float:
+    """
+    A root of ``f`` between ``lo`` and ``hi``, by Brent's method.
+
+    ``f(lo)`` and ``f(hi)`` must differ in sign. ``f`` need not be smooth or
+    even continuous: for a monotonic step it converges on the step.
+    """
+    a, b = lo, hi
+    fa, fb = f(a), f(b)
+    if fa == 0:
+        return a
+    if fb == 0:
+        return b
+    if (fa > 0) == (fb > 0):
+        raise ValueError("The target is outside the range that can be reached")
+
+    c, fc = a, fa
+    d = e = b - a
+    for _ in range(max_iterations):
+        if (fb > 0) == (fc > 0):
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+
+        tol = 2 * 2.2e-16 * abs(b) + tolerance / 2
+        m = (c - b) / 2
+        if abs(m) <= tol or fb == 0:
+            return b
+
+        if abs(e) >= tol and abs(fa) > abs(fb):
+            # Secant when only two points are distinct, else inverse quadratic
+            s = fb / fa
+            if a == c:
+                p, q = 2 * m * s, 1 - s
+            else:
+                q, r = fa / fc, fb / fc
+                p = s * (2 * m * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+            if p > 0:
+                q = -q
+            else:
+                p = -p
+            if 2 * p < min(3 * m * q - abs(tol * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = m
+        else:
+            d = e = m
+
+        a, fa = b, fb
+        b += d if abs(d) > tol else math.copysign(tol, m)
+        fb = f(b)
+    return b
+
+
+def _annuity(rate: float, periods: int) -> float:
+    """Present value of 1 paid at the end of each of ``periods`` periods."""
+    if rate == 0:
+        return float(periods)
+    return (1 - (1 + rate) ** -periods) / rate
+
+
+def _periods(years: float, payment_frequency: int) -> int:
+    periods = round(years * payment_frequency)
+    if periods <= 0:
+        raise ValueError("The loan term must be at least one payment")
+    return periods
+
+
+def solve_apr(principal: float, payment: float, years: float, payment_frequency: int = 12,
+              fees: float = 0) -> Dict[str, Any]:
+    """
+    The annual percentage rate of a loan from its payment.
+
+    Fees are taken out of the amount received, so the APR is the rate at
+    which the payments repay ``principal - fees``. Newton's method runs on
+    the annuity formula, falling back to bisection whenever a step would
+    leave the bracket around the root.
+    """
+    periods = _periods(years, payment_frequency)
+    received = principal - fees
+    if received <= 0:
+        raise ValueError("Fees must be less than the loan amount")
+    if payment * periods < received:
+        raise ValueError("The payments do not repay the loan")
+
+    def excess(rate):
+        # Present value of the payments above what was received, and its derivative
+        if rate == 0:
+            return payment * periods - received, -payment * periods * (periods + 1) / 2
+        discount = (1 + rate) ** -periods
+        value = payment * (1 - discount) / rate
+        slope = payment * (periods * discount / (1 + rate) - (1 - discount) / rate) / rate
+        return value - received, slope
+
+    lo, hi = 0.0, 1.0
+    rate = 2 * (payment * periods - received) / (received * (periods + 1))
+    for _ in range(MAX_ITERATIONS):
+        value, slope = excess(rate)
+        if value > 0:
+            lo = rate
+        else:
+            hi = rate
+        step = value / slope if slope else 0
+        candidate = rate - step
+        if not lo < candidate < hi:
+            candidate = (lo + hi) / 2
+        if abs(candidate - rate) <= RATE_TOLERANCE:
+            rate = candidate
+            break
+        rate = candidate
+    else:
+        raise ValueError("The rate did not converge")
+
+    apr = rate * payment_frequency * 100
+    return {
+        'apr': round(apr, 3),
+        'periodic_rate': round(rate * 100, 5),
+        'total_payments': periods,
+        'total_amount': round(payment * periods, 2),
+        'total_cost': round(payment * periods - received, 2),
+        'payment_amount': round(payment, 2),
+        'principal': round(principal, 2),
+        'fees': round(fees, 2),
+    }
+
+
+def solve_term(principal: float, annual_rate: float, payment: float,
+               payment_frequency: int = 12) -> Dict[str, Any]:
+    """
+    How many payments of ``payment`` pay off a loan. The last payment is
+    usually smaller; the schedule is run in cents to find it exactly.
+    """
+    rate = annual_rate / 100 / payment_frequency
+    if principal <= 0 or payment <= 0:
+        raise ValueError("Loan amount and payment must be positive")
+    if rate == 0:
+        periods = math.ceil(principal / payment)
+    else:
+        coverage = 1 - principal * rate / payment
+        if coverage <= 0:
+            raise ValueError("The payment does not cover the interest")
+        periods = math.ceil(-math.log(coverage) / math.log1p(rate) - 1e-9)
+    if periods > MAX_TERM_YEARS * payment_frequency:
+        raise ValueError(f"The loan would take more than {MAX_TERM_YEARS} years to pay off")
+
+    payment_cents = to_cents(payment)
+    exact_rate = periodic_rate(annual_rate, payment_frequency)
+    ledger = amortize(to_cents(principal), exact_rate, periods, payment_cents)
+    if ledger.payment[-1] > payment_cents:
+        # Cent rounding left a little more than one payment for the end
+        periods += 1
+        ledger = amortize(to_cents(principal), exact_rate, periods, payment_cents)
+
+    return {
+        'total_payments': periods,
+        'years': round(periods / payment_frequency, 2),
+        'payment_amount': round(payment, 2),
+        'final_payment': to_dollars(ledger.payment[-1]),
+        'total_amount': to_dollars(ledger.total_paid),
+        'total_interest': to_dollars(ledger.total_interest),
+        'principal': round(principal, 2),
+    }
+
+
+def max_home_price(monthly_budget: float, down_payment: float, interest_rate: float, loan_term: int,
+                   property_tax: float = 0, home_insurance: float = 0, hoa_fees: float = 0) -> Dict[str, Any]:
+    """
+    The highest home price whose total monthly payment, as
+    ``calculate_mortgage`` computes it, fits ``monthly_budget``.
+    """
+    rate = interest_rate / 100 / 12
+    factor = 1 / _annuity(rate, loan_term * 12)
+    fixed = property_tax / 12 + home_insurance / 12 + hoa_fees
+
+    def monthly(price):
+        loan = price - down_payment
+        pmi = loan * PMI_RATE / 12 if down_payment / price * 100 < PMI_DOWN_PERCENT else 0
+        return loan * factor + pmi + fixed
+
+    if fixed >= monthly_budget:
+        raise ValueError("Taxes, insurance and HOA fees already use the whole budget")
+
+    lo = max(down_payment, PRICE_TOLERANCE)
+    hi = down_payment + (monthly_budget - fixed) / factor + 1
+    price = brent(lambda price: monthly(price) - monthly_budget, lo, hi)
+    # Just under the budget: Brent may land on either side of it
+    price = math.floor(price)
+    while price > lo and monthly(price) > monthly_budget:
+        price -= 1
+
+    loan = max(price - down_payment, 0)
+    return {
+        'home_price': float(price),
+        'loan_amount': float(loan),
+        'principal_interest': round(loan * factor, 2),
+        'total_monthly': round(monthly(price), 2),
+        'has_pmi': down_payment / price * 100 < PMI_DOWN_PERCENT if price else False,
+        'down_payment_percent': round(down_payment / price * 100, 1) if price else 0,
+    }
+
+
+def required_contribution(target: float, current_age: int, retirement_age: int, current_balance: float,
+                          annual_salary: float, employer_match: float, return_rate: float) -> Dict[str, Any]:
+    """
+    The share of salary to contribute to reach ``target`` at retirement.
+
+    ``calculate_401k`` grows the balance by a year's return and each year's
+    contributions by half of one, so the final balance is linear in the
+    contribution rate and inverts directly. The rate is rounded up to a
+    hundredth of a percent.
+    """
+    years = retirement_age - current_age
+    if years <= 0:
+        raise ValueError("Retirement age must be greater than current age")
+    if annual_salary <= 0:
+        raise ValueError("Annual salary must be positive")
+
+    rate = return_rate / 100
+    growth = (1 + rate) ** years
+    # Final value of 1 contributed every year
+    per_dollar = (1 + rate / 2) * ((growth - 1) / rate if rate else years)
+    needed = (target - current_balance * growth) / per_dollar - annual_salary * employer_match / 100
+    percent = max(math.ceil(needed / annual_salary * 10000 - 1e-6) / 100, 0)
+    if percent > 100:
+        raise ValueError("The target needs more than the whole salary each year")
+
+    projected = current_balance * growth + annual_salary * (percent + employer_match) / 100 * per_dollar
+    return {
+        'contribution_rate': percent,
+        'annual_contribution': round(annual_salary * percent / 100, 2),
+        'monthly_contribution': round(annual_salary * percent / 1200, 2),
+        'projected_balance': round(projected, 2),
+        'target': round(target, 2),
+        'years_to_retirement': years,
+        'on_track': needed <= 0,
+    }
+
+
+class Goal(NamedTuple):
+    schema: schemas.Schema
+    solve: Callable[..., Dict[str, Any]]
+
+
+# Goals served by /api/solve/<goal>/
+GOALS = MappingProxyType({
+    'apr': Goal(schemas.SOLVE_APR, solve_apr),
+    'loan-term': Goal(schemas.SOLVE_TERM, solve_term),
+    'home-price': Goal(schemas.SOLVE_HOME_PRICE, max_home_price),
+    '401k-contribution': Goal(schemas.SOLVE_CONTRIBUTION, required_contribution),
+})
@@ -0,0 +1,16 @@
+// CSRF token for JSON POSTs. Pages may be served as static files without a
+// token of their own, so use the cookie when Django has already set it and
+// otherwise ask the server for one (which also sets the cookie).
+(function () {
+    const tokenUrl = document.currentScript.dataset.csrfUrl;
+
+    window.getCsrfToken = function () {
+        const match = document.cookie.match(/(?:^|;\s*)csrftoken=([^;]+)/);
+        if (match) {
+            return Promise.resolve(decodeURIComponent(match[1]));
+        }
+        return fetch(tokenUrl, {credentials: 'same-origin'})
+            .then(response => response.json())
+            .then(data => data.csrfToken);
+    };
+})();
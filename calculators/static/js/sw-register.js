@@ -0,0 +1,62 @@
+// Register the service worker and report calculations it queued while the
+// browser was offline once they have been sent. Pages can also listen for
+// the 'calculation-replayed' event to show results that arrive late.
+(function () {
+    if (!('serviceWorker' in navigator)) {
+        return;
+    }
+    const workerUrl = document.currentScript.dataset.workerUrl;
+
+    window.addEventListener('load', function () {
+        navigator.serviceWorker.register(workerUrl, {scope: '/'});
+    });
+
+    window.addEventListener('online', function () {
+        navigator.serviceWorker.ready.then(function (registration) {
+            registration.active.postMessage({type: 'replay-calculations'});
+        });
+    });
+
+    navigator.serviceWorker.addEventListener('message', function (event) {
+        if (event.data && event.data.type === 'calculation-replayed') {
+            const replayed = new CustomEvent('calculation-replayed', {detail: event.data, cancelable: true});
+            // A page that shows the result itself calls preventDefault()
+            if (window.dispatchEvent(replayed)) {
+                showReplayNotice(event.data);
+            }
+        }
+    });
+
+    function replayError(data) {
+        if (data.status < 400) {
+            return null;
+        }
+        try {
+            return JSON.parse(data.body).error || 'The calculation was rejected.';
+        } catch (error) {
+            return 'The calculation was rejected.';
+        }
+    }
+
+    // Same markup as the flash messages in base.html
+    function showReplayNotice(data) {
+        const main = document.querySelector('main');
+        if (!main) {
+            return;
+        }
+        const error = replayError(data);
+        const notice = document.createElement('div');
+        notice.className = 'alert alert-dismissible fade show m-3 ' + (error ? 'alert-danger' : 'alert-success');
+        notice.setAttribute('role', 'alert');
+        notice.textContent = error
+            ? 'A calculation queued while you were offline failed: ' + error
+            : 'A calculation queued while you were offline has been sent. Submit the form again to see its result.';
+        const close = document.createElement('button');
+        close.type = 'button';
+        close.className = 'btn-close';
+        close.setAttribute('data-bs-dismiss', 'alert');
+        close.setAttribute('aria-label', 'Close');
+        notice.appendChild(close);
+        main.prepend(notice);
+    }
+})();
@@ -0,0 +1,122 @@
+import hashlib
+import json
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Tuple
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.http import HttpRequest
+from django.test import RequestFactory
+from django.test.utils import override_settings
+from django.urls import reverse
+
+MANIFEST_NAME = 'manifest.json'
+
+
+def static_export(view):
+    """
+    Mark a view as exportable to a static file.
+
+    Only use it on views that answer GET the same way for every visitor and
+    render no CSRF token; pages that POST fetch their token client-side.
+    """
+    view.static_export = True
+    return view
+
+
+def export_root() -> Path:
+    """Directory the static site is written to and served from."""
+    return Path(getattr(settings, 'STATIC_EXPORT_ROOT', settings.BASE_DIR / 'static_site'))
+
+
+@contextmanager
+def site_requests(base_url: str) -> Iterator[Callable[[str], HttpRequest]]:
+    """
+    Yield a function that builds GET requests as if made to the public site,
+    so absolute URLs built from the request point there.
+    """
+    site = urlsplit(base_url)
+    factory = RequestFactory(HTTP_HOST=site.netloc)
+    secure = site.scheme == 'https'
+    with override_settings(ALLOWED_HOSTS=[site.hostname]):
+        yield lambda path: factory.get(path, secure=secure)
+
+
+def exportable_routes() -> List[Tuple[str, object]]:
+    """(path, view) for every argument-free calculators route marked with @static_export."""
+    from . import urls
+
+    routes = []
+    for pattern in urls.urlpatterns:
+        view = getattr(pattern, 'callback', None)
+        if getattr(view, 'static_export', False) and not pattern.pattern.converters and not pattern.default_args:
+            routes.append((reverse(f'{urls.app_name}:{pattern.name}'), view))
+    return routes
+
+
+def _file_for(path: str) -> str:
+    relative = path.lstrip('/')
+    return f'{relative}index.html' if not relative or relative.endswith('/') else relative
+
+
+def load_manifest(root: Path) -> Dict[str, Dict]:
+    try:
+        with open(root / MANIFEST_NAME) as f:
+            return json.load(f)['pages']
+    except (OSError, ValueError, KeyError):
+        return {}
+
+
+def export_site(root: Path = None, base_url: str = None, force: bool = False) -> Dict[str, List[str]]:
+    """
+    Render every exportable route to files under ``root`` and write a manifest.
+
+    Files are only rewritten when their content changed (unless ``force``),
+    and files for routes that are no longer exported are removed.
+
+    Returns:
+        Dictionary with 'written', 'unchanged' and 'removed' URL paths
+    """
+    root = Path(root) if root else export_root()
+    base_url = (base_url or settings.SITE_URL).rstrip('/')
+    previous = load_manifest(root)
+    pages = {}
+    report = {'written': [], 'unchanged': [], 'removed': []}
+
+    with site_requests(base_url) as get_request:
+        for path, view in exportable_routes():
+            response = view(get_request(path))
+            if response.status_code != 200:
+                raise ValueError(f"{path} returned {response.status_code}")
+            content = response.content
+            if b'csrfmiddlewaretoken' in content:
+                raise ValueError(f"{path} renders a CSRF token and cannot be exported")
+
+            digest = hashlib.sha256(content).hexdigest()
+            target = root / _file_for(path)
+            pages[path] = {
+                'file': _file_for(path),
+                'content_type': response['Content-Type'],
+                'etag': f'"{digest[:32]}"',
+                'size': len(content)
+            }
+
+            if not force and previous.get(path, {}).get('etag') == pages[path]['etag'] and target.exists():
+                report['unchanged'].append(path)
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(content)
+            report['written'].append(path)
+
+    for path, entry in previous.items():
+        if path not in pages:
+            (root / entry['file']).unlink(missing_ok=True)
+            report['removed'].append(path)
+
+    root.mkdir(parents=True, exist_ok=True)
+    with open(root / MANIFEST_NAME, 'w') as f:
+        json.dump({'generated': datetime.now().isoformat(timespec='seconds'), 'pages': pages}, f, indent=2)
+
+    return report
@@ -0,0 +1,117 @@
+"""
+Federal and state income tax tables for the 401k tax comparison.
+
+Brackets and deductions come from the CSV files in ``data/``, loaded once
+per process into sorted threshold tuples with the tax owed at each threshold
+precomputed, so a lookup is one bisect and one multiply.
+"""
+import csv
+from bisect import bisect_right
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional, Tuple
+
+DATA_DIR = Path(__file__).resolve().parent / 'data'
+BRACKETS_PATH = DATA_DIR / 'tax_brackets.csv'
+DEDUCTIONS_PATH = DATA_DIR / 'tax_deductions.csv'
+
+FEDERAL = 'federal'
+FILING_STATUSES = {
+    'single': 'Single',
+    'married_joint': 'Married filing jointly',
+}
+STATES = {
+    'ca': 'California',
+    'fl': 'Florida',
+    'il': 'Illinois',
+    'ma': 'Massachusetts',
+    'nc': 'North Carolina',
+    'nv': 'Nevada',
+    'ny': 'New York',
+    'tn': 'Tennessee',
+    'tx': 'Texas',
+    'wa': 'Washington',
+}
+
+
+class TaxTable(NamedTuple):
+    """One jurisdiction's brackets for one filing status."""
+    thresholds: Tuple[float, ...]
+    rates: Tuple[float, ...]  # fractions, not percentages
+    base: Tuple[float, ...]  # tax owed on income up to each threshold
+    deduction: float
+
+    def tax(self, income: float) -> float:
+        taxable = income - self.deduction
+        if taxable <= 0:
+            return 0.0
+        index = bisect_right(self.thresholds, taxable) - 1
+        return self.base[index] + (taxable - self.thresholds[index]) * self.rates[index]
+
+    def marginal_rate(self, income: float) -> float:
+        taxable = income - self.deduction
+        if taxable <= 0:
+            return 0.0
+        return self.rates[bisect_right(self.thresholds, taxable) - 1]
+
+
+def _read(path: Path):
+    with open(path, newline='') as table:
+        yield from csv.DictReader(line for line in table if not line.startswith('#'))
+
+
+@lru_cache(maxsize=None)
+def _tables() -> Dict[Tuple[str, str], TaxTable]:
+    brackets: Dict[Tuple[str, str], list] = {}
+    for row in _read(BRACKETS_PATH):
+        brackets.setdefault((row['Jurisdiction'], row['Status']), []).append(
+            (float(row['Threshold']), float(row['Rate']) / 100)
+        )
+    deductions = {(row['Jurisdiction'], row['Status']): float(row['Deduction']) for row in _read(DEDUCTIONS_PATH)}
+
+    tables = {}
+    for key, rows in brackets.items():
+        rows.sort()
+        thresholds, rates = zip(*rows)
+        base = [0.0]
+        for i in range(1, len(rows)):
+            base.append(base[-1] + (thresholds[i] - thresholds[i - 1]) * rates[i - 1])
+        tables[key] = TaxTable(thresholds, rates, tuple(base), deductions.get(key, 0.0))
+    return tables
+
+
+def tax_table(jurisdiction: str, filing_status: str) -> TaxTable:
+    try:
+        return _tables()[jurisdiction, filing_status]
+    except KeyError:
+        raise ValueError(f"No tax table for {jurisdiction} ({filing_status})")
+
+
+class IncomeTax(NamedTuple):
+    """Federal plus (optionally) state income tax on wages."""
+    federal: TaxTable
+    state: Optional[TaxTable] = None
+
+    def tax(self, income: float) -> float:
+        owed = self.federal.tax(income)
+        if self.state is not None:
+            owed += self.state.tax(income)
+        return owed
+
+    def marginal_rate(self, income: float) -> float:
+        rate = self.federal.marginal_rate(income)
+        if self.state is not None:
+            rate += self.state.marginal_rate(income)
+        return rate
+
+    def effective_rate(self, income: float) -> float:
+        return self.tax(income) / income if income > 0 else 0.0
+
+
+@lru_cache(maxsize=64)
+def income_tax(filing_status: str, state: str = '') -> IncomeTax:
+    """Combined tables for a filing status and a state code ('' for none)."""
+    return IncomeTax(
+        tax_table(FEDERAL, filing_status),
+        tax_table(state, filing_status) if state else None,
+    )
@@ -0,0 +1,171 @@
+// Generated by calculators.views.service_worker; edit the template, not the output.
+const VERSION = '{{ version }}';
+const SHELL_CACHE = `shell-${VERSION}`;
+const PAGE_CACHE = `pages-${VERSION}`;
+const PRECACHE = {{ precache|safe }};
+const UNCACHED_PREFIXES = {{ uncached_prefixes|safe }};
+const OFFLINE_PAGE = '{{ offline_page }}';
+const QUEUE_DB = 'calculator-queue';
+const QUEUE_STORE = 'requests';
+const SYNC_TAG = 'replay-calculations';
+
+self.addEventListener('install', event => {
+    event.waitUntil(
+        caches.open(SHELL_CACHE)
+            .then(cache => cache.addAll([...PRECACHE, OFFLINE_PAGE].map(url => new Request(url, {cache: 'reload'}))))
+            .then(() => self.skipWaiting())
+    );
+});
+
+self.addEventListener('activate', event => {
+    // Caches from other versions belong to an older build
+    event.waitUntil(
+        caches.keys()
+            .then(keys => Promise.all(
+                keys.filter(key => key !== SHELL_CACHE && key !== PAGE_CACHE).map(key => caches.delete(key))
+            ))
+            .then(() => self.clients.claim())
+            .then(replayQueue)
+    );
+});
+
+self.addEventListener('fetch', event => {
+    const request = event.request;
+    const url = new URL(request.url);
+    if (url.origin !== self.location.origin) {
+        return;
+    }
+
+    if (request.method === 'POST' && isCalculationRequest(request, url)) {
+        event.respondWith(sendOrQueue(request));
+        return;
+    }
+    if (request.method !== 'GET' || UNCACHED_PREFIXES.some(prefix => url.pathname.startsWith(prefix))) {
+        return;
+    }
+
+    if (PRECACHE.includes(url.pathname)) {
+        event.respondWith(caches.match(request).then(cached => cached || fetch(request)));
+    } else if (request.mode === 'navigate') {
+        event.respondWith(staleWhileRevalidate(event, request));
+    }
+});
+
+self.addEventListener('sync', event => {
+    if (event.tag === SYNC_TAG) {
+        event.waitUntil(replayQueue());
+    }
+});
+
+self.addEventListener('message', event => {
+    if (event.data && event.data.type === 'replay-calculations') {
+        event.waitUntil(replayQueue());
+    }
+});
+
+// Pages: answer from the cache at once and refresh it in the background
+
+function cacheable(response) {
+    const cacheControl = response.headers.get('Cache-Control') || '';
+    return response.ok && response.type === 'basic' && !/no-store|private/.test(cacheControl);
+}
+
+function staleWhileRevalidate(event, request) {
+    return caches.open(PAGE_CACHE).then(cache => cache.match(request).then(cached => {
+        const network = fetch(request).then(response => {
+            if (cacheable(response)) {
+                cache.put(request, response.clone());
+            }
+            return response;
+        });
+
+        if (cached) {
+            event.waitUntil(network.catch(() => undefined));
+            return cached;
+        }
+        return network.catch(() => caches.match(OFFLINE_PAGE).then(
+            offline => offline || new Response('You are offline.', {status: 503, headers: {'Content-Type': 'text/plain'}})
+        ));
+    }));
+}
+
+// Calculation POSTs: queue them while offline and replay once back online
+
+function isCalculationRequest(request, url) {
+    return request.headers.get('X-Requested-With') === 'XMLHttpRequest'
+        || url.pathname.startsWith('/api/') || url.pathname.startsWith('/ajax/');
+}
+
+function openQueue() {
+    return new Promise((resolve, reject) => {
+        const open = indexedDB.open(QUEUE_DB, 1);
+        open.onupgradeneeded = () => open.result.createObjectStore(QUEUE_STORE, {autoIncrement: true});
+        open.onsuccess = () => resolve(open.result);
+        open.onerror = () => reject(open.error);
+    });
+}
+
+function queueTransaction(mode, action) {
+    return openQueue().then(db => new Promise((resolve, reject) => {
+        const transaction = db.transaction(QUEUE_STORE, mode);
+        const result = action(transaction.objectStore(QUEUE_STORE));
+        transaction.oncomplete = () => resolve(result.result);
+        transaction.onerror = () => reject(transaction.error);
+    }));
+}
+
+function sendOrQueue(request) {
+    const copy = request.clone();
+    // Raw bytes, so multipart uploads replay intact
+    return fetch(request).catch(() => copy.arrayBuffer().then(body => {
+        const entry = {
+            url: copy.url,
+            headers: [...copy.headers.entries()],
+            body: body,
+            queued: Date.now()
+        };
+        return queueTransaction('readwrite', store => store.add(entry))
+            .then(() => self.registration.sync && self.registration.sync.register(SYNC_TAG))
+            .catch(() => undefined)
+            .then(() => new Response(JSON.stringify({
+                success: false,
+                queued: true,
+                error: "You're offline. Your calculation will be sent when the connection returns."
+            }), {status: 202, headers: {'Content-Type': 'application/json'}}));
+    }));
+}
+
+function replayQueue() {
+    return queueTransaction('readonly', store => store.getAllKeys()).then(keys => keys.reduce(
+        (previous, key) => previous.then(() => replayOne(key)),
+        Promise.resolve()
+    )).catch(() => undefined);
+}
+
+function replayOne(key) {
+    return queueTransaction('readonly', store => store.get(key)).then(entry => {
+        if (!entry) {
+            return undefined;
+        }
+        return fetch(entry.url, {
+            method: 'POST',
+            headers: entry.headers,
+            body: entry.body,
+            credentials: 'same-origin'
+        }).then(response => response.text().then(body => {
+            // Delivered (even if rejected); only network failures stay queued
+            return queueTransaction('readwrite', store => store.delete(key)).then(() => notifyClients({
+                type: 'calculation-replayed',
+                url: entry.url,
+                status: response.status,
+                body: body
+            }));
+        }));
+    });
+}
+
+function notifyClients(message) {
+    return self.clients.matchAll({type: 'window'}).then(clients => {
+        clients.forEach(client => client.postMessage(message));
+    });
+}
@@ -0,0 +1,82 @@
+from functools import lru_cache
+
+from django import template
+from django.conf import settings
+from django.templatetags.static import static
+from django.urls import reverse
+from django.utils.html import format_html, format_html_join
+from django.utils.safestring import mark_safe
+
+from calculators.assets import BUILD_MANIFEST, VENDOR_ASSETS, load_build_manifest
+from calculators.critical import (
+    CRITICAL_CSS_FILE, current_critical_css, load_critical_css, record_template, stylesheet_urls
+)
+
+register = template.Library()
+
+
+def _mtime(path):
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=1)
+def _built_assets(mtime):
+    return load_build_manifest()
+
+
+@lru_cache(maxsize=1)
+def _critical_css(mtime, urls):
+    # Fingerprints are checked here, once per build of the file, not per page view
+    return current_critical_css(load_critical_css(), urls)
+
+
+@register.simple_tag
+def asset_url(name):
+    """URL of a self-hosted vendor asset, or its CDN copy when it hasn't been built."""
+    assets = _built_assets(_mtime(BUILD_MANIFEST))
+    if name in assets:
+        return static(assets[name])
+    return VENDOR_ASSETS[name]
+
+
+@register.simple_tag(takes_context=True)
+def stylesheets(context):
+    """
+    Stylesheet links for the page. With critical CSS built for the page
+    template, that CSS is inlined and the full stylesheets are preloaded and
+    applied once they arrive instead of blocking first paint.
+    """
+    urls = stylesheet_urls()
+    name = context.template.name
+    record_template(name)
+
+    if settings.DEBUG:
+        # Templates are edited in place during development
+        _critical_css.cache_clear()
+    css = _critical_css(_mtime(CRITICAL_CSS_FILE), tuple(urls)).get(name)
+    if css is None:
+        return format_html_join('\n', '<link rel="stylesheet" href="{}">', ((url,) for url in urls))
+
+    preload = format_html_join(
+        '\n',
+        '<link rel="preload" href="{}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">',
+        ((url,) for url in urls)
+    )
+    fallback = format_html_join('', '<link rel="stylesheet" href="{}">', ((url,) for url in urls))
+    # Stylesheet text can't contain markup; only guard against closing the element
+    inline = mark_safe(css.replace('</', '<\\/'))
+    return format_html('<style>{}</style>\n{}\n<noscript>{}</noscript>', inline, preload, fallback)
+
+
+@register.simple_tag
+def service_worker_script():
+    """Script tag registering the service worker, when SERVICE_WORKER is on."""
+    if not getattr(settings, 'SERVICE_WORKER', False):
+        return ''
+    return format_html(
+        '<script src="{}" data-worker-url="{}"></script>',
+        static('js/sw-register.js'), reverse('calculators:service_worker')
+    )
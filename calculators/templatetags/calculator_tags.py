@@ -1,7 +1,21 @@
+import json
+
 from django import template
+from django.utils.html import format_html
+from django.utils.safestring import mark_safe
+
+from calculators.prefetch import speculation_rules
 
 register = template.Library()
 
+# Characters that could end a <script> element early, escaped as JSON allows
+_SCRIPT_JSON_ESCAPES = {ord('<'): '\\u003C', ord('>'): '\\u003E', ord('&'): '\\u0026'}
+
+
+def _script_json(value):
+    return mark_safe(json.dumps(value).translate(_SCRIPT_JSON_ESCAPES))
+
+
 @register.filter
 def mul(value, arg):
     """Multiplies the value by the argument."""
@@ -24,4 +38,33 @@ def multiply(value, multiplier):
     try:
         return int(float(value)) * int(float(multiplier))
     except (ValueError, TypeError):
-        return 0
\ No newline at end of file
+        return 0
+
+@register.simple_tag(takes_context=True)
+def prefetch_hints(context, *calculator_lists):
+    """
+    Speculation rules prefetching the pages of the given calculators where
+    the page links to them, with a <link rel="prefetch"> on hover as the
+    fallback for browsers without speculation rules.
+    """
+    current = context['request'].path if 'request' in context else None
+    urls = []
+    for calculators in calculator_lists:
+        for calculator in calculators or ():
+            url = calculator.get_page_url()
+            if url != current and url not in urls:
+                urls.append(url)
+    if not urls:
+        return ''
+
+    return format_html(
+        '<script type="speculationrules">{}</script>\n'
+        '<script>if (!(HTMLScriptElement.supports && HTMLScriptElement.supports("speculationrules"))) {{'
+        ' var urls = {}; document.addEventListener("pointerover", function (event) {{'
+        ' var anchor = event.target.closest && event.target.closest("a[href]");'
+        ' var index = anchor ? urls.indexOf(anchor.getAttribute("href")) : -1; if (index < 0) return;'
+        ' urls.splice(index, 1); var link = document.createElement("link");'
+        ' link.rel = "prefetch"; link.href = anchor.href; document.head.appendChild(link); }}); }}</script>',
+        _script_json(speculation_rules(urls)),
+        _script_json(urls)
+    )
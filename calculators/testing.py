@@ -0,0 +1,36 @@
+"""
+Test runner that keeps test runs off the live shared-memory cache.
+"""
+import copy
+import tempfile
+
+from django.conf import settings
+from django.test.runner import DiscoverRunner
+from django.test.utils import override_settings
+
+from .shm_cache import close_segments
+
+
+def temporary_caches(directory: str) -> dict:
+    """settings.CACHES with every shared-memory cache file moved into ``directory``."""
+    caches = copy.deepcopy(settings.CACHES)
+    for alias, config in caches.items():
+        if config['BACKEND'] == 'calculators.shm_cache.SharedMemoryCache':
+            config['LOCATION'] = f'{directory}/{alias}'
+    return caches
+
+
+class TemporaryCacheRunner(DiscoverRunner):
+    """Runs the tests against cache files in a temporary directory."""
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self._cache_directory = tempfile.TemporaryDirectory()
+        self._cache_settings = override_settings(CACHES=temporary_caches(self._cache_directory.name))
+        self._cache_settings.enable()
+
+    def teardown_test_environment(self, **kwargs):
+        self._cache_settings.disable()
+        close_segments(self._cache_directory.name)
+        self._cache_directory.cleanup()
+        super().teardown_test_environment(**kwargs)
@@ -0,0 +1,87 @@
+import tempfile
+from pathlib import Path
+
+from django.test import SimpleTestCase
+
+from calculators.assets import (
+    SAFELIST, UsedClasses, collect_used_classes, defined_classes, hashed_name, own_classes, parse_css,
+    prune_unreferenced, purge_rules, render_css, scan_source, selector_classes, undefined_classes
+)
+
+CSS = """
+.btn{padding:1rem}
+.btn-primary,.btn-danger{color:blue}
+.row>.col-6:not(.d-none){width:50%}
+@media (min-width:768px){.col-md-4{width:33%}.table{border:0}}
+@keyframes spin{to{transform:rotate(1turn)}}
+@keyframes unused{to{opacity:0}}
+.fa-spin{animation:spin 2s infinite}
+"""
+
+
+def used(*names, prefixes=()):
+    return UsedClasses(set(names), set(prefixes))
+
+
+class ClassScanningTests(SimpleTestCase):
+    def scan(self, text):
+        found = used()
+        scan_source(text, found)
+        return found
+
+    def test_class_attributes_with_template_syntax(self):
+        found = self.scan('<div class="card {% if big %}card-lg{% else %}card-sm{% endif %} text-{{ tone }}">')
+        self.assertTrue({'card', 'card-lg', 'card-sm'} <= found.names)
+        self.assertIn('text-', found.prefixes)
+        self.assertTrue(found.matches('text-danger'))
+
+    def test_script_class_names(self):
+        found = self.scan("el.classList.add('active', 'shown'); badge.className = 'badge bmi-' + category;")
+        self.assertTrue({'active', 'shown', 'badge'} <= found.names)
+        self.assertIn('bmi-', found.prefixes)
+
+    def test_collect_includes_safelist(self):
+        with tempfile.TemporaryDirectory() as directory:
+            page = Path(directory) / 'page.html'
+            page.write_text('<p class="lead">x</p>')
+            found = collect_used_classes([page])
+        self.assertIn('lead', found.names)
+        self.assertTrue(SAFELIST <= found.names)
+
+
+class PurgeTests(SimpleTestCase):
+    def test_selector_classes(self):
+        self.assertEqual(selector_classes('.row > .col-6:not(.d-none)'), {'row', 'col-6'})
+        self.assertEqual(selector_classes('a[href=".x"].link'), {'link'})
+
+    def test_purge_keeps_only_matching_selectors(self):
+        rules = parse_css(CSS)
+        css = render_css(prune_unreferenced(purge_rules(rules, used('btn', 'btn-primary', 'col-md-4'))))
+        self.assertIn('.btn{padding:1rem}', css)
+        self.assertIn('.btn-primary{color:blue}', css)
+        self.assertNotIn('btn-danger', css)
+        self.assertIn('@media (min-width:768px){.col-md-4{width:33%}}', css)
+        self.assertNotIn('.table', css)
+        self.assertNotIn('@keyframes', css)
+
+    def test_keyframes_kept_while_referenced(self):
+        css = render_css(prune_unreferenced(purge_rules(parse_css(CSS), used('fa-spin'))))
+        self.assertIn('@keyframes spin', css)
+        self.assertNotIn('@keyframes unused', css)
+
+    def test_undefined_classes(self):
+        defined = defined_classes(parse_css(CSS))
+        self.assertEqual(undefined_classes(used('btn', 'btn-primry', 'show', 'assignment-row'), defined),
+                         {'btn-primry'})
+
+    def test_own_classes_include_template_style_blocks(self):
+        with tempfile.TemporaryDirectory() as directory:
+            page = Path(directory) / 'page.html'
+            page.write_text('<style>\n.page-only > .inner { color: red; }\n</style><p class="page-only">x</p>')
+            own = own_classes([page])
+        self.assertTrue({'page-only', 'inner'} <= own)
+        self.assertIn('result-card', own_classes())
+
+    def test_hashed_name(self):
+        self.assertRegex(hashed_name('bootstrap.css', b'x'), r'^bootstrap\.[0-9a-f]{12}\.css$')
+        self.assertNotEqual(hashed_name('a.css', b'x'), hashed_name('a.css', b'y'))
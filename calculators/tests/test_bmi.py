@@ -0,0 +1,74 @@
+import json
+
+from django.contrib.messages import get_messages
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+
+from calculators.bmi import bmi_for_age, body_mass_index, evaluate_batch, roster_columns
+
+ROSTER = [
+    {'weight': 70, 'height': 175},
+    {'weight': 160, 'height': 66, 'unit_system': 'imperial'},
+    {'weight': 30, 'height': 135, 'sex': 'female', 'age': 10},
+    {'weight': 12, 'height': 85, 'sex': 'male', 'age_months': 18},
+    {'weight': 0, 'height': 170},
+]
+
+
+class BMIBatchTests(SimpleTestCase):
+    def test_body_mass_index(self):
+        self.assertAlmostEqual(body_mass_index(70, 175), 22.857, places=3)
+        self.assertAlmostEqual(body_mass_index(160, 66, 'imperial'), 25.82, places=2)
+        with self.assertRaises(ValueError):
+            body_mass_index(70, 175, 'stone')
+
+    def test_bmi_for_age(self):
+        child = bmi_for_age(16.5, 'female', 120)
+        self.assertEqual(child['category'], 'Healthy weight')
+        self.assertTrue(5 < child['percentile'] < 85)
+        with self.assertRaises(ValueError):
+            bmi_for_age(16.5, 'female', 18)
+
+    def test_batch_scores_each_row(self):
+        result = evaluate_batch(**roster_columns(ROSTER))
+        self.assertEqual(result['count'], 5)
+        self.assertEqual(result['bmi'][:3], [22.9, 25.8, 16.5])
+        self.assertEqual(result['category'][:3], ['Normal weight', 'Overweight', 'Healthy weight'])
+        self.assertIsNone(result['percentile'][0])
+        self.assertIsNotNone(result['percentile'][2])
+        self.assertEqual(result['categories'], {'Normal weight': 1, 'Overweight': 1, 'Healthy weight': 1})
+
+    def test_unscorable_rows_get_their_own_error(self):
+        result = evaluate_batch(**roster_columns(ROSTER))
+        self.assertEqual(result['error'][:3], [None, None, None])
+        self.assertIn('24', result['error'][3])
+        self.assertIsNone(result['bmi'][3])
+        self.assertIn('greater than 0', result['error'][4])
+        self.assertIsNone(result['category'][4])
+
+    def test_mismatched_columns(self):
+        with self.assertRaises(ValueError):
+            evaluate_batch([70, 80], [175])
+
+    def test_api(self):
+        url = reverse('calculators:bmi_roster_api')
+        response = self.client.post(url, json.dumps({'people': ROSTER}), content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['result']['category'][2], 'Healthy weight')
+        response = self.client.post(url, json.dumps({'people': []}), content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+
+
+class BMICalculatorViewTests(TestCase):
+    url = reverse('calculators:bmi_calculator')
+
+    def test_invalid_form_post_shows_a_message(self):
+        response = self.client.post(self.url, {'weight': 'heavy', 'height': '175'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([str(m) for m in get_messages(response.wsgi_request)],
+                         ['Invalid input values. Please check your entries.'])
+
+    def test_valid_form_post_redirects_to_permalink(self):
+        response = self.client.post(self.url, {'weight': '70', 'height': '175'})
+        self.assertEqual(response.status_code, 302)
+        self.assertContains(self.client.get(response['Location']), '22.9')
@@ -0,0 +1,82 @@
+import json
+
+from django.http import QueryDict
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from calculators import schemas
+from calculators.schemas import NON_FIELD_ERRORS, SchemaError, parse_rows, request_data, submitted_rows
+
+
+class SubmittedRowsTests(SimpleTestCase):
+    columns = schemas.ASSIGNMENT_COLUMNS
+
+    def test_rows_from_indexed_fields_in_order(self):
+        data = QueryDict(
+            'assignment_name_10=Final&assignment_score_10=90'
+            '&assignment_name_2=Quiz&assignment_score_2=8&assignment_unknown_3=x&assignment_name_x=y'
+        )
+        rows = submitted_rows(data, 'assignments', 'assignment', self.columns)
+        self.assertEqual(rows, [{'name': 'Quiz', 'score': '8'}, {'name': 'Final', 'score': '90'}])
+
+    def test_sparse_indexes_do_not_cost_work(self):
+        data = QueryDict('assignment_name_999999999=Quiz')
+        self.assertEqual(submitted_rows(data, 'assignments', 'assignment', self.columns), [{'name': 'Quiz'}])
+
+    def test_too_many_field_rows(self):
+        data = QueryDict('&'.join(f'assignment_name_{i}=A' for i in range(4)))
+        with self.assertRaises(SchemaError) as raised:
+            submitted_rows(data, 'assignments', 'assignment', self.columns, limit=3)
+        self.assertIn(NON_FIELD_ERRORS, raised.exception.errors)
+
+    @override_settings(CALCULATOR_MAX_ROWS=2)
+    def test_too_many_json_rows(self):
+        with self.assertRaises(SchemaError):
+            submitted_rows({'assignments': [{}, {}, {}]}, 'assignments', 'assignment', self.columns)
+
+    def test_json_rows_must_be_objects(self):
+        with self.assertRaises(SchemaError) as raised:
+            submitted_rows({'assignments': [1]}, 'assignments', 'assignment', self.columns)
+        self.assertEqual(raised.exception.errors, {'assignments': 'must be a list of objects'})
+
+    def test_parse_rows_skips_incomplete_and_keys_errors(self):
+        rows = [
+            {'name': 'Quiz', 'score': '8', 'max_points': '10', 'weight': '20'},
+            {'name': 'Draft'},
+            {'name': 'Exam', 'score': 'x', 'max_points': '100', 'weight': '80'},
+        ]
+        with self.assertRaises(SchemaError) as raised:
+            parse_rows(schemas.ASSIGNMENT_ROW, rows, 'assignments')
+        self.assertEqual(raised.exception.errors, {'assignments.2.score': 'must be a number'})
+        self.assertEqual(len(parse_rows(schemas.ASSIGNMENT_ROW, rows[:2], 'assignments')), 1)
+
+
+class RequestBodyTests(SimpleTestCase):
+    factory = RequestFactory()
+
+    @override_settings(CALCULATOR_MAX_BODY_SIZE=100)
+    def test_large_bodies_are_refused(self):
+        request = self.factory.post('/', json.dumps({'x': 'y' * 200}), content_type='application/json')
+        with self.assertRaises(SchemaError) as raised:
+            request_data(request)
+        self.assertIn('larger than 100 bytes', raised.exception.errors[NON_FIELD_ERRORS])
+
+    def test_json_must_be_an_object(self):
+        for body in ('[1]', '{'):
+            with self.assertRaises(SchemaError):
+                request_data(self.factory.post('/', body, content_type='application/json'))
+
+
+class GradeRowLimitTests(TestCase):
+    url = reverse('calculators:grade_calculator')
+
+    @override_settings(CALCULATOR_MAX_ROWS=2)
+    def test_grade_calculator_rejects_too_many_rows(self):
+        assignments = [{'name': f'A{i}', 'score': 9, 'max_points': 10, 'weight': 10} for i in range(3)]
+        response = self.client.post(
+            self.url, json.dumps({'calc_mode': 'final', 'assignments': assignments}),
+            content_type='application/json', headers={'X-Requested-With': 'XMLHttpRequest'}
+        )
+        body = response.json()
+        self.assertIn('At most 2 rows', body['error'])
+        self.assertNotIn('result', body)
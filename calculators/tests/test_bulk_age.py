@@ -0,0 +1,48 @@
+from datetime import date
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase
+from django.urls import reverse
+
+
+class BulkAgeCalculatorTests(SimpleTestCase):
+    def post(self, content):
+        upload = SimpleUploadedFile('roster.csv', content, content_type='text/csv')
+        return self.client.post(reverse('calculators:bulk_age_calculator'), {'file': upload})
+
+    def rows(self, response):
+        body = b''.join(response.streaming_content).decode()
+        return [line.split(',') for line in body.splitlines()]
+
+    def test_rows_are_annotated_in_order(self):
+        response = self.post(
+            b'name,birth_date,target_date\n'
+            b'A,2000-01-15,2020-03-20\n'
+            b'B,not a date,2020-01-01\n'
+            b'C,2021-01-01,2020-01-01\n'
+            b'D,1990-06-30,2000-06-30\n'
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        rows = self.rows(response)
+        self.assertEqual(rows[0], ['name', 'birth_date', 'target_date',
+                                   'age_years', 'age_months', 'age_days', 'total_days', 'error'])
+        self.assertEqual(rows[1], ['A', '2000-01-15', '2020-03-20', '20', '2', '5', '7370', ''])
+        self.assertEqual(rows[2][0], 'B')
+        self.assertEqual(rows[2][-1], 'Invalid date')
+        self.assertEqual(rows[3][-1], 'Birth date cannot be after target date')
+        self.assertEqual(rows[4], ['D', '1990-06-30', '2000-06-30', '10', '0', '0', '3653', ''])
+
+    def test_short_rows_are_padded(self):
+        rows = self.rows(self.post(b'id,name,birth_date,target_date\nE\nF,x,2000-01-01\n'))
+        self.assertEqual(rows[1], ['E', '', '', '', '', '', '', '', 'Invalid date'])
+        self.assertEqual(len(rows[2]), 9)
+        self.assertEqual(rows[2][:4], ['F', 'x', '2000-01-01', ''])
+        self.assertEqual(rows[2][7], str((date.today() - date(2000, 1, 1)).days))
+
+    def test_bad_uploads_are_rejected(self):
+        self.assertEqual(self.client.post(reverse('calculators:bulk_age_calculator')).status_code, 400)
+        self.assertEqual(self.post(b'name,born\nA,2000-01-01\n').status_code, 400)
+        response = self.post(b'name,birth_date\n' + b'A,2000-01-01\n' * 10000 + b'\xff\xfe,2000-01-01\n')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('UTF-8', response.json()['error'])
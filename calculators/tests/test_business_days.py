@@ -0,0 +1,84 @@
+import random
+from datetime import date, timedelta
+
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+
+from calculators.business_days import business_calendar, us_federal_holidays
+from calculators.utils import calculate_business_days
+
+
+class BusinessDayTests(SimpleTestCase):
+    def test_known_year(self):
+        calendar = business_calendar('us')
+        self.assertEqual(calendar.count(date(2024, 1, 1), date(2025, 1, 1)), 251)
+
+    def test_observed_holidays(self):
+        holidays = dict(us_federal_holidays(2026))
+        # July 4, 2026 is a Saturday
+        self.assertEqual(holidays[date(2026, 7, 3)], "Independence Day")
+        # New Year's Day 2022 was a Saturday, observed the year before
+        self.assertEqual(dict(us_federal_holidays(2021))[date(2021, 12, 31)], "New Year's Day")
+        self.assertFalse(business_calendar('us').is_business_day(date(2026, 7, 3)))
+
+    def test_count_and_add_match_day_by_day(self):
+        calendar = business_calendar('us')
+        rng = random.Random(48)
+        for _ in range(200):
+            start = date(1950, 1, 1) + timedelta(days=rng.randrange(60000))
+            end = start + timedelta(days=rng.randrange(400))
+            days = [start + timedelta(days=i) for i in range((end - start).days)]
+            self.assertEqual(calendar.count(start, end), sum(map(calendar.is_business_day, days)))
+
+            steps = rng.randrange(1, 60)
+            day = start
+            for _ in range(steps):
+                day += timedelta(days=1)
+                while not calendar.is_business_day(day):
+                    day += timedelta(days=1)
+            self.assertEqual(calendar.add(start, steps), day)
+            back = calendar.add(day, -steps)
+            if calendar.is_business_day(start):
+                self.assertEqual(back, start)
+            else:
+                self.assertLess(back, start)
+
+    def test_weekdays_region(self):
+        calendar = business_calendar('weekdays')
+        self.assertEqual(calendar.count(date(2024, 1, 1), date(2025, 1, 1)), 262)
+
+    def test_out_of_range(self):
+        with self.assertRaises(ValueError):
+            business_calendar('us').count(date(1850, 1, 1), date(2000, 1, 1))
+        with self.assertRaises(ValueError):
+            business_calendar('mars')
+
+
+    def test_offset_out_of_range_keeps_counts(self):
+        result = calculate_business_days(date(2000, 1, 1), date(2150, 12, 1), 'us', 1000)
+        self.assertIsNone(result['offset_date'])
+        self.assertIn('past the end', result['offset_error'])
+        self.assertGreater(result['business_days'], 0)
+
+        result = calculate_business_days(date(2000, 1, 1), date(2000, 1, 10), 'us', 5)
+        # Skips Martin Luther King, Jr. Day on the 17th
+        self.assertEqual(result['offset_date'], date(2000, 1, 18))
+        self.assertIsNone(result['offset_error'])
+
+
+class BusinessDayPageTests(TestCase):
+    url = reverse('calculators:date_of_birth_calculator')
+
+    def post(self, **fields):
+        data = {'birth_month': 1, 'birth_day': 1, 'birth_year': 2000,
+                'target_month': 12, 'target_day': 1, 'target_year': 2150, **fields}
+        return self.client.post(self.url, data, headers={'X-Requested-With': 'XMLHttpRequest'}).json()
+
+    def test_offset_error_is_reported_separately(self):
+        business = self.post(business_days=1000)['result']['business']
+        self.assertIsNotNone(business['business_days'])
+        self.assertIsNone(business['offset_date'])
+        self.assertIn('supported range', business['offset_error'])
+
+    def test_dates_out_of_range_drop_the_figures(self):
+        self.assertIsNone(self.post(birth_year=1850)['result']['business'])
@@ -0,0 +1,65 @@
+from datetime import date
+from unittest import mock
+
+from django.test import RequestFactory, TestCase
+from django.urls import reverse
+
+from calculators.conditional import bump_content_version, dated_page_etag, page_etag
+from calculators.models import Calculator
+
+
+class PageETagTests(TestCase):
+    def test_unchanged_page_answers_304(self):
+        url = reverse('calculators:percentage_calculator')
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+        self.assertEqual(self.client.get(url, headers={'If-None-Match': etag}).status_code, 304)
+
+        bump_content_version()
+        response = self.client.get(url, headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_no_etag_for_posts_or_pending_messages(self):
+        factory = RequestFactory()
+        self.assertIsNone(page_etag(factory.post('/')))
+        request = factory.get('/')
+        request.COOKIES['messages'] = 'pending'
+        self.assertIsNone(page_etag(request))
+        self.assertIsNotNone(page_etag(factory.get('/')))
+
+    def test_dated_pages_change_tag_at_midnight(self):
+        request = RequestFactory().get('/age-calculator/')
+        with mock.patch('calculators.conditional.date') as today:
+            today.today.return_value = date(2026, 10, 19)
+            first = dated_page_etag(request)
+            self.assertEqual(dated_page_etag(request), first)
+            today.today.return_value = date(2026, 10, 20)
+            self.assertNotEqual(dated_page_etag(request), first)
+
+    def test_date_views_use_dated_tags(self):
+        for name in ('calculators:age_calculator', 'calculators:date_of_birth_calculator'):
+            response = self.client.get(reverse(name))
+            self.assertEqual(response['ETag'].strip('W/"'), dated_page_etag(response.wsgi_request))
+
+
+class CalculatorDetailTests(TestCase):
+    def setUp(self):
+        self.calculator = Calculator.objects.create(
+            name='Percentage Calculator', slug='percentage-calculator', description='Percentages', icon='%'
+        )
+        self.url = reverse('calculators:calculator_detail', args=['percentage-calculator'])
+
+    def usage(self):
+        self.calculator.refresh_from_db()
+        return self.calculator.usage_count
+
+    def test_revalidated_visits_are_counted(self):
+        etag = self.client.get(self.url)['ETag']
+        self.assertEqual(self.client.get(self.url, headers={'If-None-Match': etag}).status_code, 304)
+        self.assertEqual(self.usage(), 2)
+
+    def test_prefetches_are_not_counted(self):
+        self.client.get(self.url, headers={'Sec-Purpose': 'prefetch'})
+        self.assertEqual(self.usage(), 0)
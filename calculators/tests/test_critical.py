@@ -0,0 +1,60 @@
+import tempfile
+from pathlib import Path
+
+from django.test import SimpleTestCase, TestCase
+
+from calculators.critical import (
+    above_the_fold, current_critical_css, extract_critical_css, fingerprint, recording_templates, template_files
+)
+
+STYLESHEET = """
+.navbar{display:flex}
+.navbar a:hover{color:red}
+.footer{margin:0}
+[data-bs-theme] .navbar{color:white}
+@media print{.navbar{display:none}}
+@media (min-width:768px){.navbar{gap:1rem}}
+"""
+
+
+class CriticalCSSTests(SimpleTestCase):
+    def test_above_the_fold_skips_head_scripts_and_comments(self):
+        html = ('<html><head><style>.x{}</style></head><body><nav class="navbar">'
+                '<script>var y;</script><!-- note --><a href="/">Home</a></nav></body></html>')
+        self.assertEqual(above_the_fold(html), '<body><nav class="navbar"><a href="/">Home</a></nav></body></html>')
+        self.assertEqual(above_the_fold('<body>' + 'x' * 100, limit=10), '<body>xxxx')
+
+    def test_only_first_paint_rules_are_kept(self):
+        css = extract_critical_css('<body><nav class="navbar"><a href="/">Home</a></nav>', [STYLESHEET])
+        self.assertIn('.navbar{display:flex}', css)
+        self.assertIn('@media (min-width:768px){.navbar{gap:1rem}}', css)
+        for left_out in (':hover', '.footer', 'data-bs-theme', '@media print'):
+            self.assertNotIn(left_out, css)
+
+    def test_markup_past_the_fold_is_ignored(self):
+        html = '<body><nav class="navbar"></nav>' + ' ' * 100 + '<footer class="footer"></footer>'
+        self.assertNotIn('.footer', extract_critical_css(html, [STYLESHEET], limit=50))
+        self.assertIn('.footer', extract_critical_css(html, [STYLESHEET]))
+
+    def test_stale_entries_are_left_out(self):
+        with tempfile.TemporaryDirectory() as directory:
+            template = Path(directory) / 'page.html'
+            template.write_text('<p>')
+            urls = ['/static/a.css']
+            entries = {'page.html': {'fingerprint': fingerprint([str(template)], urls),
+                                     'files': [str(template)], 'css': '.a{}'}}
+            self.assertEqual(current_critical_css(entries, urls), {'page.html': '.a{}'})
+            self.assertEqual(current_critical_css(entries, ['/static/b.css']), {})
+
+    def test_template_files_follow_extends(self):
+        files = template_files('calculators/bmi_calculator.html')
+        self.assertTrue(files[0].endswith('bmi_calculator.html'))
+        self.assertTrue(files[-1].endswith('base.html'))
+
+
+
+class RecordingTemplatesTests(TestCase):
+    def test_rendered_page_templates_are_recorded(self):
+        with recording_templates() as rendered:
+            self.client.get('/sitemap/')
+        self.assertEqual(rendered[:1], ['calculators/sitemap.html'])
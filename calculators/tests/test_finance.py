@@ -0,0 +1,57 @@
+from fractions import Fraction
+
+from django.test import SimpleTestCase
+
+from calculators.finance import MAX_PERIODS, amortize, level_payment, periodic_rate, to_cents
+from calculators.utils import calculate_loan_payment, calculate_mortgage
+
+
+def _float_payment(principal, annual_rate, periods, periods_per_year=12):
+    """The level payment by the float formula the calculators used before cents."""
+    rate = annual_rate / 100 / periods_per_year
+    return principal * rate / (1 - (1 + rate) ** -periods)
+
+
+class AmortizationTests(SimpleTestCase):
+    LOANS = [
+        (10000, 5, 36, 12),
+        (320000, 6.5, 360, 12),
+        (250000, 3.875, 180, 12),
+        (15000, 12.99, 260, 52),
+        (5000, 0.1, 12, 12),
+    ]
+
+    def test_schedule_ends_at_zero(self):
+        for principal, annual_rate, periods, frequency in self.LOANS:
+            schedule = amortize(to_cents(principal), periodic_rate(annual_rate, frequency), periods)
+            self.assertEqual(schedule.balance[-1], 0)
+            self.assertTrue(all(balance >= 0 for balance in schedule.balance))
+
+    def test_totals_equal_row_sums(self):
+        for principal, annual_rate, periods, frequency in self.LOANS:
+            schedule = amortize(to_cents(principal), periodic_rate(annual_rate, frequency), periods)
+            self.assertEqual(sum(schedule.principal), to_cents(principal))
+            self.assertEqual(schedule.total_paid, sum(schedule.payment))
+            self.assertEqual(schedule.total_paid, to_cents(principal) + schedule.total_interest)
+            for payment, principal_part, interest in zip(schedule.payment, schedule.principal, schedule.interest):
+                self.assertEqual(payment, principal_part + interest)
+
+    def test_level_payment_matches_float_formula(self):
+        for principal, annual_rate, periods, frequency in self.LOANS:
+            cents = level_payment(to_cents(principal), periodic_rate(annual_rate, frequency), periods)
+            expected = round(_float_payment(principal, annual_rate, periods, frequency), 2)
+            self.assertEqual(cents, round(expected * 100))
+
+    def test_calculators_match_previous_payments(self):
+        self.assertEqual(calculate_loan_payment(10000, 5, 3)['payment_amount'], 299.71)
+        self.assertEqual(calculate_mortgage(400000, 80000, 6.5, 30)['principal_interest'],
+                         round(_float_payment(320000, 6.5, 360), 2))
+
+    def test_zero_rate(self):
+        schedule = amortize(to_cents(1000), Fraction(0), 3)
+        self.assertEqual(schedule.payment, (33333, 33333, 33334))
+        self.assertEqual(schedule.total_interest, 0)
+
+    def test_schedule_length_is_bounded(self):
+        with self.assertRaises(ValueError):
+            amortize(to_cents(10000), periodic_rate(5, 365), MAX_PERIODS + 1)
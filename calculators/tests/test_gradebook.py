@@ -0,0 +1,88 @@
+import json
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase
+from django.urls import reverse
+
+from calculators.gradebook import calculate_gradebook, parse_gradebook_csv
+
+GRADEBOOK_CSV = """student,Homework,Midterm,Final
+max_points,50,100,200
+weight,20,30,50
+Ada,50,90,180
+Ben,25,70,
+Cy,40,80,150
+"""
+
+
+class GradebookTests(SimpleTestCase):
+    def test_parse_csv(self):
+        gradebook = parse_gradebook_csv(GRADEBOOK_CSV.splitlines())
+        self.assertEqual([a['name'] for a in gradebook['assignments']], ['Homework', 'Midterm', 'Final'])
+        self.assertEqual(gradebook['assignments'][2], {'name': 'Final', 'max_points': '200', 'weight': '50'})
+        self.assertEqual(gradebook['students'][1], {'name': 'Ben', 'scores': ['25', '70', '']})
+
+    def test_parse_csv_needs_weights(self):
+        with self.assertRaises(ValueError):
+            parse_gradebook_csv(['student,Quiz', 'Ada,10'])
+
+    def test_final_grades_and_distribution(self):
+        result = calculate_gradebook(**parse_gradebook_csv(GRADEBOOK_CSV.splitlines()))
+        students = {student['name']: student for student in result['students']}
+        # 20 * 50/50 + 30 * 90/100 + 50 * 180/200
+        self.assertEqual(students['Ada']['final_grade'], 92.0)
+        self.assertEqual(students['Ada']['letter_grade'], 'A-')
+        self.assertEqual(students['Ada']['gpa'], 3.7)
+        # A blank score counts as zero
+        self.assertEqual(students['Ben']['final_grade'], 31.0)
+        self.assertFalse(students['Ben']['passing'])
+        self.assertEqual(students['Cy']['final_grade'], 77.5)
+
+        distribution = result['distribution']
+        self.assertEqual(result['student_count'], 3)
+        self.assertEqual(distribution['median'], 77.5)
+        self.assertEqual(distribution['min'], 31.0)
+        self.assertEqual(distribution['max'], 92.0)
+        self.assertEqual(distribution['pass_rate'], 66.7)
+        self.assertEqual(sum(bin['count'] for bin in distribution['histogram']), 3)
+        self.assertEqual(distribution['letter_grades']['A-'], 1)
+        self.assertEqual(result['assignments'][0]['average_percentage'], 76.67)
+
+    def test_scale_changes_letters(self):
+        result = calculate_gradebook(**parse_gradebook_csv(GRADEBOOK_CSV.splitlines()), scale='letter')
+        self.assertEqual(result['scale'], 'letter')
+        self.assertEqual([student['letter_grade'] for student in result['students']], ['A', 'F', 'C'])
+
+    def test_invalid_gradebooks(self):
+        assignments = [{'name': 'Quiz', 'max_points': 10, 'weight': 100}]
+        for students in ([], [{'name': 'Ada', 'scores': [11]}], [{'name': 'Ada', 'scores': [1, 2]}]):
+            with self.assertRaises(ValueError):
+                calculate_gradebook(assignments, students)
+        with self.assertRaises(ValueError):
+            calculate_gradebook(assignments, [{'name': 'Ada', 'scores': [5]}], scale='9.9')
+
+
+class GradebookViewTests(SimpleTestCase):
+    url = reverse('calculators:gradebook_calculator')
+
+    def test_csv_upload(self):
+        upload = SimpleUploadedFile('grades.csv', GRADEBOOK_CSV.encode(), content_type='text/csv')
+        response = self.client.post(self.url, {'file': upload, 'grade_scale': '4.3'})
+        self.assertEqual(response.status_code, 200)
+        result = response.json()['result']
+        self.assertEqual(result['scale'], '4.3')
+        self.assertEqual(result['student_count'], 3)
+
+    def test_json_body(self):
+        body = {
+            'assignments': [{'name': 'Quiz', 'max_points': 10, 'weight': 100}],
+            'students': [{'name': 'Ada', 'scores': [9]}],
+        }
+        response = self.client.post(self.url, json.dumps(body), content_type='application/json')
+        self.assertEqual(response.json()['result']['students'][0]['final_grade'], 90.0)
+
+    def test_errors(self):
+        self.assertEqual(self.client.post(self.url).status_code, 400)
+        response = self.client.post(self.url, '[]', content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('error', response.json())
@@ -0,0 +1,65 @@
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from calculators.grading import available_scales, get_grade_scale
+from calculators.utils import calculate_gpa
+
+CUSTOM_SCALES = {
+    'pass_fail': {'name': 'Pass/fail', 'points': {'P': 4.0, 'F': 0.0}, 'cutoffs': (('P', 50), ('F', 0))},
+}
+
+
+class GradeScaleTests(SimpleTestCase):
+    def test_letters_from_percentages(self):
+        scale = get_grade_scale('4.0')
+        self.assertEqual(scale.letter_for(97), 'A+')
+        self.assertEqual(scale.letter_for(92.99), 'A-')
+        self.assertEqual(scale.letter_for(60), 'D-')
+        self.assertEqual(scale.letter_for(59.9), 'F')
+        self.assertEqual(get_grade_scale('seven_point').letter_for(92), 'B')
+
+    def test_grade_points(self):
+        self.assertEqual(get_grade_scale('4.0').grade_point('D-'), 0.7)
+        self.assertEqual(get_grade_scale('4.3').grade_point('A+'), 4.3)
+        self.assertEqual(get_grade_scale('5.0').grade_point('B'), 4.0)
+        self.assertEqual(get_grade_scale('5.0').grade_point('F'), 0.0)
+        # Plus/minus grades count as the base letter on letter-only scales
+        self.assertEqual(get_grade_scale('letter').grade_point('B+'), 3.0)
+        self.assertIsNone(get_grade_scale('letter').grade_point('E', None))
+
+    def test_unknown_scale(self):
+        with self.assertRaises(ValueError):
+            get_grade_scale('9.9')
+
+    @override_settings(DEFAULT_GRADE_SCALE='4.3')
+    def test_default_scale_setting(self):
+        self.assertEqual(get_grade_scale().key, '4.3')
+
+    def test_scales_follow_settings(self):
+        self.assertNotIn('pass_fail', available_scales())
+        with override_settings(GRADE_SCALES=CUSTOM_SCALES):
+            self.assertEqual(get_grade_scale('pass_fail').letter_for(55), 'P')
+        self.assertNotIn('pass_fail', available_scales())
+
+    def test_gpa_on_each_scale(self):
+        entries = [{'subject': 'Math', 'grade': 'A-', 'credit_hours': 3}, {'subject': 'Art', 'grade': 'B+', 'credit_hours': 3}]
+        self.assertEqual(calculate_gpa(entries, scale='4.0')['gpa'], 3.5)
+        self.assertEqual(calculate_gpa(entries, scale='letter')['gpa'], 3.5)
+        with self.assertRaises(ValueError):
+            calculate_gpa([{'subject': 'Math', 'grade': 'E', 'credit_hours': 3}])
+
+
+class GradeScaleSelectorTests(TestCase):
+    def test_grade_and_gpa_pages_offer_scales(self):
+        for name in ('calculators:grade_calculator', 'calculators:gpa_calculator'):
+            response = self.client.get(reverse(name))
+            self.assertContains(response, 'name="grade_scale"')
+            self.assertContains(response, 'value="5.0"')
+
+    def test_grade_form_uses_selected_scale(self):
+        response = self.client.post(reverse('calculators:grade_calculator'), {
+            'calc_mode': 'final', 'grade_scale': 'letter', 'assignment_count': '1',
+            'assignment_name_0': 'Exam', 'assignment_score_0': '91', 'assignment_max_0': '100',
+            'assignment_weight_0': '100', 'assignment_category_0': 'exam',
+        }, headers={'X-Requested-With': 'XMLHttpRequest'})
+        self.assertEqual(response.json()['result']['letter_grade'], 'A')
@@ -0,0 +1,54 @@
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+
+from calculators.landing import SITEMAP_INDEX, expand_spec, load_landing_pages
+
+BMI_SPEC = {
+    'calculator': 'bmi-calculator',
+    'slug': 'bmi-{weight}-kg-{height}-cm',
+    'title': 'BMI for {weight} kg at {height} cm',
+    'description': 'Body mass index for {weight} kg and {height} cm.',
+    'inputs': {'weight': [60, 70.5], 'height': 175},
+}
+
+
+class LandingPageTests(SimpleTestCase):
+    def test_expand_spec(self):
+        pages = list(expand_spec(BMI_SPEC))
+        self.assertEqual([page.path for page in pages],
+                         ['/bmi-calculator/bmi-60-kg-175-cm/', '/bmi-calculator/bmi-70-5-kg-175-cm/'])
+        self.assertEqual(pages[1].title, 'BMI for 70.5 kg at 175 cm')
+        self.assertEqual(pages[1].params, (('weight', '70.5'), ('height', '175')))
+
+    def test_unknown_calculator(self):
+        with self.assertRaises(ValueError):
+            list(expand_spec({**BMI_SPEC, 'calculator': 'gpa-calculator'}))
+
+    def test_bundled_source_loads_without_duplicates(self):
+        pages = load_landing_pages()
+        self.assertTrue(pages)
+        self.assertEqual(len({page.path for page in pages}), len(pages))
+
+
+class BuildLandingPagesTests(TestCase):
+    def test_pages_and_sitemaps_are_written(self):
+        with tempfile.TemporaryDirectory() as directory:
+            source = Path(directory) / 'pages.json'
+            # The last combination (0 kg) does not produce a result and is skipped
+            source.write_text(json.dumps([{**BMI_SPEC, 'inputs': {'weight': [60, 70, 0], 'height': 175}}]))
+            output = Path(directory) / 'site'
+            call_command('build_landing_pages', source=str(source), output=str(output),
+                         base_url='https://calc.example', shard_size=1, stdout=StringIO(), stderr=StringIO())
+
+            page = (output / 'bmi-calculator' / 'bmi-70-kg-175-cm' / 'index.html').read_text()
+            self.assertIn('22.9', page)
+            self.assertIn('https://calc.example/bmi-calculator/bmi-70-kg-175-cm/', page)
+            self.assertFalse((output / 'bmi-calculator' / 'bmi-0-kg-175-cm').exists())
+            index = (output / SITEMAP_INDEX).read_text()
+            self.assertIn('https://calc.example/sitemap-landing-2.xml', index)
+            self.assertNotIn('sitemap-landing-3.xml', index)
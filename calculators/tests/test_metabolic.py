@@ -0,0 +1,55 @@
+import json
+
+from django.test import SimpleTestCase
+from django.urls import reverse
+
+from calculators.metabolic import ACTIVITY_MULTIPLIERS, FORMULAS, evaluate_batch, person_columns
+from calculators.utils import calculate_bmr
+
+PEOPLE = [
+    {'age': 30, 'gender': 'male', 'height': 180, 'weight': 80, 'body_fat': 15},
+    {'age': 45, 'gender': 'female', 'height': 65, 'height_unit': 'inches', 'weight': 150, 'weight_unit': 'lbs'},
+]
+
+
+class MetabolicBatchTests(SimpleTestCase):
+    def test_batch_matches_single_calculation(self):
+        result = evaluate_batch(**person_columns(PEOPLE))
+        self.assertEqual(result['count'], 2)
+        self.assertEqual(set(result['formulas']), set(FORMULAS))
+        for key in ('mifflin_st_jeor', 'harris_benedict'):
+            for index, person in enumerate(PEOPLE):
+                single = calculate_bmr(person['age'], person['gender'], person['height'],
+                                       person.get('height_unit', 'cm'), person['weight'],
+                                       person.get('weight_unit', 'kg'), formula=key)
+                self.assertEqual(result['formulas'][key]['bmr'][index], single['bmr'])
+        # 10 * 80 + 6.25 * 180 - 5 * 30 + 5
+        self.assertEqual(result['formulas']['mifflin_st_jeor']['bmr'][0], 1780.0)
+        self.assertEqual(result['formulas']['mifflin_st_jeor']['tdee']['sedentary'][0], round(1780 * 1.2))
+        self.assertEqual(set(result['formulas']['cunningham']['tdee']), set(ACTIVITY_MULTIPLIERS))
+
+    def test_body_fat_formulas_skip_people_without_it(self):
+        result = evaluate_batch(**person_columns(PEOPLE), formulas=['katch_mcardle'])
+        self.assertEqual(list(result['formulas']), ['katch_mcardle'])
+        # 370 + 21.6 * 80 * 0.85
+        self.assertEqual(result['formulas']['katch_mcardle']['bmr'], [1838.8, None])
+        self.assertIsNone(result['formulas']['katch_mcardle']['tdee']['very_active'][1])
+
+    def test_invalid_batches(self):
+        with self.assertRaises(ValueError):
+            evaluate_batch(**person_columns(PEOPLE), formulas=['guess'])
+        with self.assertRaises(ValueError):
+            evaluate_batch([30], ['male'], [180], [])
+        with self.assertRaises(ValueError):
+            person_columns([{**PEOPLE[0], 'gender': 'other'}])
+        with self.assertRaises(ValueError):
+            person_columns([{**PEOPLE[0], 'body_fat': 120}])
+
+    def test_api(self):
+        url = reverse('calculators:metabolic_api')
+        response = self.client.post(url, json.dumps({'people': PEOPLE, 'formulas': ['mifflin_st_jeor']}),
+                                    content_type='application/json')
+        self.assertEqual(response.json()['result']['formulas']['mifflin_st_jeor']['bmr'][0], 1780.0)
+        for body in ({}, {'people': 'nobody'}, {'people': [{'age': 30}]}):
+            response = self.client.post(url, json.dumps(body), content_type='application/json')
+            self.assertEqual(response.status_code, 400)
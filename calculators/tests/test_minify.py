@@ -0,0 +1,56 @@
+import re
+from pathlib import Path
+
+from django.template import Engine
+from django.test import SimpleTestCase
+
+from calculators.minify import minify_css, minify_js, minify_template
+
+TEMPLATES_DIR = Path(__file__).resolve().parent.parent / 'templates'
+TEMPLATE_TOKEN_RE = re.compile(r'{%.*?%}|{{.*?}}', re.DOTALL)
+
+
+class MinifyTests(SimpleTestCase):
+    def test_html_whitespace_and_comments(self):
+        source = '<div>\n    <p>Hello   world</p>\n    <!-- note -->\n</div>\n<!--[if IE]>old<![endif]-->'
+        self.assertEqual(minify_template(source), '<div> <p>Hello world</p> </div> <!--[if IE]>old<![endif]-->')
+
+    def test_template_syntax_is_untouched(self):
+        source = '<p>{% if   a %}\n  {{ a|default:"x   y" }}\n{% endif %}</p>{# keep   this #}'
+        minified = minify_template(source)
+        self.assertIn('{% if   a %}', minified)
+        self.assertIn('{{ a|default:"x   y" }}', minified)
+        self.assertIn('{# keep   this #}', minified)
+        self.assertIn('{% verbatim %}  {{ raw }}  {% endverbatim %}',
+                      minify_template('<b>{% verbatim %}  {{ raw }}  {% endverbatim %}</b>'))
+
+    def test_comments_with_template_syntax_are_kept(self):
+        source = '<!-- {% if debug %} -->\n<p>x</p>\n<!-- {% endif %} -->'
+        self.assertEqual(minify_template(source), '<!-- {% if debug %} --> <p>x</p> <!-- {% endif %} -->')
+
+    def test_raw_elements_are_untouched(self):
+        source = '<pre>\n  a\n    b\n</pre>\n<textarea>  x  </textarea>'
+        self.assertEqual(minify_template(source), source.replace('</pre>\n', '</pre> '))
+
+    def test_css(self):
+        css = '/* heading */\n.a  >  .b {\n  color : red ;\n  margin: 0;\n}\n'
+        self.assertEqual(minify_css(css), '.a>.b{color : red;margin: 0}')
+
+    def test_js_keeps_line_breaks_and_template_literals(self):
+        js = 'const a = 1\n\n// comment\n/* block\n   comment */\nconst b = `line one\n    line two`\nlet c = a + b'
+        self.assertEqual(minify_js(js), 'const a = 1\nconst b = `line one\nline two`\nlet c = a + b')
+
+    def test_non_javascript_scripts_are_only_trimmed(self):
+        source = '<script type="application/ld+json">\n  {\n    "//": "not a comment"\n  }\n</script>'
+        self.assertEqual(minify_template(source),
+                         '<script type="application/ld+json">{\n"//": "not a comment"\n}</script>')
+
+    def test_every_template_keeps_its_template_syntax(self):
+        engine = Engine.get_default()
+        for path in sorted(TEMPLATES_DIR.rglob('*.html')):
+            source = path.read_text()
+            minified = minify_template(source)
+            with self.subTest(template=str(path.relative_to(TEMPLATES_DIR))):
+                self.assertEqual(TEMPLATE_TOKEN_RE.findall(minified), TEMPLATE_TOKEN_RE.findall(source))
+                engine.from_string(minified)
+                self.assertLess(len(minified), len(source))
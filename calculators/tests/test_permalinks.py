@@ -0,0 +1,58 @@
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+
+from calculators.permalinks import canonical_params, normalize_value, permalink_form_data, permalink_url
+
+
+class PermalinkTests(SimpleTestCase):
+    def test_normalize_value(self):
+        self.assertEqual(normalize_value('100'), '100')
+        self.assertEqual(normalize_value('100.00'), '100')
+        self.assertEqual(normalize_value(' 1,250.50 '), '1250.5')
+        self.assertEqual(normalize_value('1e3'), '1000')
+        self.assertEqual(normalize_value('Imperial'), 'imperial')
+        for value in ('nan', 'inf', '1e30', '1e100'):
+            with self.assertRaises(ValueError):
+                normalize_value(value)
+
+    def test_canonical_params(self):
+        data = {'weight': '70.0', 'height': '175', 'unit_system': 'metric'}
+        self.assertEqual(canonical_params('bmi-calculator', data), [('weight', '70'), ('height', '175')])
+        self.assertEqual(canonical_params('bmi-calculator', {'weight': '154', 'height': '70', 'units': 'imperial'}),
+                         [('weight', '154'), ('height', '70'), ('units', 'imperial')])
+        with self.assertRaises(ValueError):
+            canonical_params('bmi-calculator', {'weight': '70'})
+
+    def test_url_and_form_data_round_trip(self):
+        url = permalink_url('loan-calculator', {'loan_amount': '10000', 'interest_rate': '5.50', 'loan_term': '3'})
+        self.assertEqual(url, reverse('calculators:loan_permalink') + '?amount=10000&rate=5.5&term=3')
+        form_data = permalink_form_data('loan-calculator', [('amount', '10000'), ('rate', '5.5'), ('term', '3')])
+        self.assertEqual(form_data['payment_frequency'], '12')
+
+
+class PermalinkViewTests(TestCase):
+    def test_non_canonical_query_redirects(self):
+        url = reverse('calculators:bmi_permalink')
+        response = self.client.get(url, {'weight': '70.0', 'height': '175', 'units': 'metric'})
+        self.assertEqual(response.status_code, 301)
+        self.assertEqual(response['Location'], f'{url}?weight=70&height=175')
+
+    def test_canonical_query_is_public(self):
+        response = self.client.get(reverse('calculators:bmi_permalink'), {'weight': '70', 'height': '175'})
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('public', response['Cache-Control'])
+        self.assertContains(response, '22.9')
+
+    def test_huge_numbers_are_input_errors(self):
+        for value in ('1e30', '1e40', '1e100'):
+            response = self.client.get(reverse('calculators:loan_permalink'),
+                                       {'amount': value, 'rate': '5', 'term': '3'})
+            self.assertEqual(response.status_code, 302)
+            response = self.client.post(reverse('calculators:loan_calculator'),
+                                        {'loan_amount': value, 'interest_rate': '5', 'loan_term': '3'})
+            self.assertIn(response.status_code, (200, 302))
+            response = self.client.post(reverse('calculators:401k_calculator'), {
+                'current_age': '30', 'retirement_age': '65', 'annual_salary': value,
+                'contribution_rate': '10', 'return_rate': '7',
+            })
+            self.assertIn(response.status_code, (200, 302))
@@ -0,0 +1,54 @@
+import json
+import re
+
+from django.template import Context, Template
+from django.test import RequestFactory, SimpleTestCase
+
+from calculators.prefetch import is_prefetch, speculation_rules
+
+
+class Page:
+    def __init__(self, url):
+        self.url = url
+
+    def get_page_url(self):
+        return self.url
+
+
+class PrefetchTests(SimpleTestCase):
+    factory = RequestFactory()
+
+    def test_is_prefetch(self):
+        self.assertFalse(is_prefetch(self.factory.get('/')))
+        self.assertTrue(is_prefetch(self.factory.get('/', headers={'Sec-Purpose': 'prefetch'})))
+        self.assertTrue(is_prefetch(self.factory.get('/', headers={'Sec-Purpose': 'prefetch;prerender'})))
+        self.assertTrue(is_prefetch(self.factory.get('/', headers={'Purpose': 'Prefetch'})))
+        self.assertTrue(is_prefetch(self.factory.get('/', headers={'X-Moz': 'prefetch'})))
+        self.assertFalse(is_prefetch(self.factory.get('/', headers={'Sec-Purpose': 'prerender'})))
+
+    def test_speculation_rules(self):
+        rules = speculation_rules(['/a/', '/b/'])
+        self.assertEqual(rules['prefetch'][0]['where'], {'href_matches': ['/a/', '/b/']})
+        self.assertEqual(rules['prefetch'][0]['eagerness'], 'moderate')
+
+    def render_hints(self, *lists, path='/bmi-calculator/'):
+        template = Template('{% load calculator_tags %}{% prefetch_hints first second %}')
+        context = {'request': self.factory.get(path), 'first': lists[0], 'second': lists[1]}
+        return template.render(Context(context))
+
+    def test_hints_skip_current_page_and_duplicates(self):
+        html = self.render_hints(
+            [Page('/bmi-calculator/'), Page('/age-calculator/')],
+            [Page('/age-calculator/'), Page('/gpa-calculator/')],
+        )
+        rules = re.search(r'<script type="speculationrules">(.*?)</script>', html).group(1)
+        self.assertEqual(json.loads(rules)['prefetch'][0]['where']['href_matches'],
+                         ['/age-calculator/', '/gpa-calculator/'])
+
+    def test_no_hints_without_links(self):
+        self.assertEqual(self.render_hints([Page('/bmi-calculator/')], None), '')
+
+    def test_urls_cannot_close_the_script(self):
+        html = self.render_hints([Page('/x/</script><script>alert(1)//')], [])
+        self.assertNotIn('</script><script>alert', html)
+        self.assertIn('\\u003C/script\\u003E', html)
@@ -0,0 +1,72 @@
+from datetime import date, timedelta
+
+from django.test import SimpleTestCase
+from django.urls import reverse
+
+from calculators.pregnancy import pregnancy_dates, pregnancy_summary, pregnancy_timeline
+
+LMP = date(2026, 1, 1)
+
+
+class PregnancyTests(SimpleTestCase):
+    def test_standard_cycle_dates(self):
+        start, conception, due = pregnancy_dates('lmp', LMP)
+        self.assertEqual(start, LMP)
+        self.assertEqual(conception, LMP + timedelta(days=14))
+        self.assertEqual(due, LMP + timedelta(days=280))
+        self.assertEqual(pregnancy_dates('conception', conception)[2], due)
+        self.assertEqual(pregnancy_dates('due_date', due)[:2], (start, conception))
+
+    def test_cycle_length_shifts_lmp_dates(self):
+        _, conception, due = pregnancy_dates('lmp', LMP, 35)
+        self.assertEqual(conception, LMP + timedelta(days=21))
+        self.assertEqual(due, LMP + timedelta(days=287))
+        # Conception and due-date inputs do not depend on the cycle
+        self.assertEqual(pregnancy_dates('due_date', due, 35)[2], due)
+        with self.assertRaises(ValueError):
+            pregnancy_dates('lmp', LMP, 60)
+        with self.assertRaises(ValueError):
+            pregnancy_dates('ultrasound', LMP)
+
+    def test_summary(self):
+        summary = pregnancy_summary('lmp', LMP, 28, LMP + timedelta(days=100))
+        self.assertEqual(summary['days_pregnant'], 100)
+        self.assertEqual(summary['current_week'], 14)
+        self.assertEqual(summary['trimester'], 2)
+        self.assertEqual(summary['days_until_due'], 180)
+        self.assertEqual(summary['weeks_remaining'], 26)
+        self.assertEqual(summary['percent_complete'], 35.0)
+        self.assertEqual([m.week for m in summary['milestones']], [20, 24, 28, 37])
+        self.assertEqual(summary['milestones'][0].date, 'May 21, 2026')
+
+    def test_summary_after_due_date(self):
+        summary = pregnancy_summary('lmp', LMP, 28, LMP + timedelta(days=300))
+        self.assertEqual(summary['current_week'], 40)
+        self.assertEqual(summary['days_until_due'], 0)
+        self.assertEqual(summary['milestones'], ())
+
+    def test_timeline_covers_weeks_0_to_40(self):
+        timeline = pregnancy_timeline('lmp', LMP, today=LMP + timedelta(days=3))
+        weeks = timeline['weeks']
+        self.assertEqual([week.week for week in weeks], list(range(41)))
+        self.assertEqual(weeks[0].start_date, '2026-01-01')
+        self.assertEqual(weeks[0].end_date, '2026-01-07')
+        self.assertEqual(weeks[40].start_date, timeline['due_date'])
+        self.assertEqual([week.week for week in weeks if week.is_current], [0])
+        self.assertEqual(weeks[20].milestone, 'Anatomy scan - you can usually find out the sex')
+        self.assertEqual((weeks[13].trimester, weeks[14].trimester, weeks[28].trimester), (1, 2, 3))
+
+    def test_timeline_matches_summary_week(self):
+        today = LMP + timedelta(days=200)
+        timeline = pregnancy_timeline('lmp', LMP, today=today)
+        current = [week for week in timeline['weeks'] if week.is_current]
+        self.assertEqual(current[0].week, pregnancy_summary('lmp', LMP, 28, today)['current_week'])
+        self.assertLessEqual(date.fromisoformat(current[0].start_date), today)
+
+    def test_timeline_api(self):
+        url = reverse('calculators:pregnancy_timeline')
+        response = self.client.get(url, {'method': 'due_date', 'date': '2026-10-08', 'cycle_length': 28})
+        result = response.json()['result']
+        self.assertEqual(result['gestation_start'], '2026-01-01')
+        self.assertEqual(len(result['weeks']), 41)
+        self.assertEqual(self.client.get(url, {'date': 'soon'}).status_code, 400)
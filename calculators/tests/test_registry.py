@@ -0,0 +1,66 @@
+import json
+
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+
+from calculators.registry import REGISTRY, RELATED, page_path
+
+
+class RegistryTests(SimpleTestCase):
+    def test_related_calculators_are_registered(self):
+        for slug, related in RELATED.items():
+            self.assertEqual([spec.slug for spec in related], list(REGISTRY[slug].related))
+            self.assertNotIn(REGISTRY[slug], related)
+
+    def test_page_path(self):
+        self.assertEqual(page_path('bmi-calculator'), reverse('calculators:bmi_calculator'))
+        self.assertEqual(REGISTRY['401k-calculator'].get_page_url(), reverse('calculators:401k_calculator'))
+
+    def test_api_calculators_have_schemas(self):
+        for spec in REGISTRY.values():
+            self.assertEqual(spec.compute is None, spec.schema is None, spec.slug)
+
+    def test_seo_context_prefers_row_values(self):
+        spec = REGISTRY['bmr-calculator']
+        calculator = spec.fallback()
+        self.assertEqual(spec.seo_context(calculator)['page_title'], spec.title)
+        calculator.meta_title = 'Custom'
+        self.assertEqual(spec.seo_context(calculator)['page_title'], 'Custom')
+
+
+class RegistryPageTests(TestCase):
+    def test_pages_render_their_registered_template(self):
+        for spec in REGISTRY.values():
+            with self.subTest(spec.slug):
+                response = self.client.get(spec.get_page_url())
+                self.assertEqual(response.status_code, 200)
+                self.assertTemplateUsed(response, spec.template)
+
+
+class CalculateAPITests(SimpleTestCase):
+    def post(self, slug, data):
+        url = reverse('calculators:calculate_api', args=[slug])
+        return self.client.post(url, json.dumps(data), content_type='application/json')
+
+    def test_computes_registered_calculator(self):
+        response = self.post('bmi-calculator', {'weight': 70, 'height': 175})
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertTrue(body['success'])
+        self.assertEqual(body['result']['bmi'], 22.9)
+
+    def test_unknown_slug(self):
+        self.assertEqual(self.post('no-such-calculator', {}).status_code, 404)
+        # Registered, but without flat inputs
+        self.assertEqual(self.post('age-calculator', {}).status_code, 404)
+
+    def test_schema_errors(self):
+        response = self.post('bmi-calculator', {'weight': 'heavy'})
+        self.assertEqual(response.status_code, 400)
+        errors = response.json()['errors']
+        self.assertIn('weight', errors)
+        self.assertIn('height', errors)
+
+    def test_get_not_allowed(self):
+        response = self.client.get(reverse('calculators:calculate_api', args=['bmi-calculator']))
+        self.assertEqual(response.status_code, 405)
@@ -0,0 +1,68 @@
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+
+from calculators.taxes import income_tax
+from calculators.utils import compare_roth_traditional
+
+PLAN = dict(current_age=30, retirement_age=65, current_balance=10000, annual_salary=80000,
+            contribution_rate=10, employer_match=4, return_rate=7, filing_status='single')
+
+
+class RothComparisonTests(SimpleTestCase):
+    def test_invested_savings_pay_tax_on_growth(self):
+        result = compare_roth_traditional(
+            current_age=64, retirement_age=65, current_balance=0, annual_salary=80000, contribution_rate=10,
+            employer_match=0, return_rate=10, filing_status='single', inflation=0
+        )
+        taxes = income_tax('single')
+        saved = taxes.tax(80000) - taxes.tax(72000)
+        growth = 0.10 * (1 - taxes.marginal_rate(72000))
+        self.assertAlmostEqual(result['paths'][0]['invested_tax_savings'], saved * (1 + growth / 2), places=2)
+
+    def test_withdrawals_taxed_as_only_income(self):
+        result = compare_roth_traditional(
+            current_age=40, retirement_age=65, current_balance=0, annual_salary=80000, contribution_rate=10,
+            employer_match=0, return_rate=0, filing_status='single', inflation=0, retirement_years=20
+        )
+        path = result['paths'][0]
+        balance = 25 * 8000
+        rate = income_tax('single').effective_rate(balance / 20)
+        self.assertEqual(path['retirement_tax_rate'], round(rate * 100, 1))
+        self.assertAlmostEqual(path['roth_after_tax'], balance, places=2)
+        self.assertAlmostEqual(path['traditional_after_tax'], balance * (1 - rate) + path['invested_tax_savings'], places=1)
+
+    def test_no_contributions_is_a_tie(self):
+        path = compare_roth_traditional(**{**PLAN, 'contribution_rate': 0})['paths'][0]
+        self.assertEqual(path['traditional_after_tax'], path['roth_after_tax'])
+        self.assertEqual(path['difference'], 0)
+
+    def test_one_comparison_per_raise_path(self):
+        result = compare_roth_traditional(**PLAN, salary_growth=(0, 3, 5))
+        paths = result['paths']
+        self.assertEqual([path['salary_growth'] for path in paths], [0, 3, 5])
+        self.assertEqual(paths[0]['final_salary'], 80000)
+        self.assertLess(paths[1]['final_salary'], paths[2]['final_salary'])
+        for path in paths:
+            self.assertEqual(path['better'], 'roth' if path['roth_after_tax'] > path['traditional_after_tax'] else 'traditional')
+            self.assertAlmostEqual(path['difference'], abs(path['roth_after_tax'] - path['traditional_after_tax']), places=1)
+
+    def test_state_tax(self):
+        federal = compare_roth_traditional(**PLAN)
+        california = compare_roth_traditional(**PLAN, state='ca')
+        self.assertGreater(california['marginal_rate'], federal['marginal_rate'])
+        self.assertEqual(california['state_name'], 'California')
+
+    def test_invalid_plans(self):
+        with self.assertRaises(ValueError):
+            compare_roth_traditional(**{**PLAN, 'retirement_age': 30})
+        with self.assertRaises(ValueError):
+            compare_roth_traditional(**{**PLAN, 'filing_status': 'head_of_household'})
+
+
+class RothPageTests(TestCase):
+    def test_page_states_the_assumptions(self):
+        data = {key: value for key, value in PLAN.items()}
+        response = self.client.post(reverse('calculators:401k_calculator'), data, follow=True)
+        self.assertContains(response, 'Roth vs. Traditional After Taxes')
+        self.assertContains(response, 'taxed as your only income')
+        self.assertContains(response, 'growth taxed each year')
@@ -0,0 +1,81 @@
+from datetime import date
+
+from django.http import QueryDict
+from django.test import SimpleTestCase
+
+from calculators import schemas
+from calculators.schemas import NON_FIELD_ERRORS, Schema, SchemaError, integer, number, parse_formset
+
+
+class SchemaTests(SimpleTestCase):
+    def test_values_come_out_typed(self):
+        values = schemas.BMI.parse(QueryDict('weight=70&height=%20175%20'))
+        self.assertEqual(values, {'weight': 70.0, 'height': 175.0, 'unit_system': 'metric'})
+
+    def test_errors_are_collected_per_field(self):
+        with self.assertRaises(SchemaError) as raised:
+            schemas.BMI.parse({'weight': 'heavy', 'unit_system': 'stone'})
+        self.assertEqual(raised.exception.errors, {
+            'weight': 'must be a number',
+            'height': 'is required',
+            'unit_system': 'must be one of imperial, metric',
+        })
+
+    def test_numbers(self):
+        field = number('x', 0, 10)
+        self.assertEqual(field.convert('2.5'), 2.5)
+        for value in ('nan', 'inf', True, None, '11', -1):
+            with self.assertRaises(ValueError):
+                field.convert(value)
+
+    def test_integers(self):
+        field = integer('n', 1, 12)
+        self.assertEqual(field.convert('12.0'), 12)
+        for value in ('1.5', 'twelve', False, 13):
+            with self.assertRaises(ValueError):
+                field.convert(value)
+
+    def test_checks_run_after_fields(self):
+        with self.assertRaises(SchemaError) as raised:
+            schemas.BMI.parse({'weight': 600, 'height': 170})
+        self.assertEqual(raised.exception.errors, {NON_FIELD_ERRORS: 'Weight seems unrealistic for metric system'})
+
+    def test_dates_are_combined(self):
+        values = schemas.AGE.parse({
+            'birth_month': '2', 'birth_day': '29', 'birth_year': '2000',
+            'target_month': '1', 'target_day': '1', 'target_year': '2024',
+        })
+        self.assertEqual(values['birth_date'], date(2000, 2, 29))
+        with self.assertRaises(SchemaError) as raised:
+            schemas.AGE.parse({
+                'birth_month': '2', 'birth_day': '30', 'birth_year': '2001',
+                'target_month': '1', 'target_day': '1', 'target_year': '2024',
+            })
+        self.assertEqual(list(raised.exception.errors), ['birth_day'])
+
+    def test_arguments_are_renamed(self):
+        arguments = schemas.LOAN.arguments({'loan_amount': 1000, 'interest_rate': 5, 'loan_term': 2})
+        self.assertEqual(arguments, {'principal': 1000.0, 'annual_rate': 5.0, 'years': 2.0, 'payment_frequency': 12})
+
+    def test_submitted_echoes_text(self):
+        echo = schemas.BMI.submitted(QueryDict('weight=70&height='))
+        self.assertEqual(echo, {'weight': '70', 'height': '', 'unit_system': 'metric'})
+
+    def test_prefixed_errors(self):
+        schema = Schema(number('score'))
+        with self.assertRaises(SchemaError) as raised:
+            schema.parse({'row-score': 'x'}, prefix='row-')
+        self.assertEqual(raised.exception.errors, {'row-score': 'must be a number'})
+
+    def test_formset_skips_blank_rows(self):
+        data = QueryDict(
+            'form-TOTAL_FORMS=3&form-0-subject_name=Math&form-0-grade=A&form-0-credit_hours=3'
+            '&form-2-subject_name=Art&form-2-grade=B&form-2-credit_hours=2'
+        )
+        rows = parse_formset(schemas.GPA_ROW, data)
+        self.assertEqual([row['subject_name'] for row in rows], ['Math', 'Art'])
+
+    def test_formset_row_count_is_bounded(self):
+        with self.assertRaises(SchemaError) as raised:
+            parse_formset(schemas.GPA_ROW, {'form-TOTAL_FORMS': '21'})
+        self.assertIn('form-TOTAL_FORMS', raised.exception.errors)
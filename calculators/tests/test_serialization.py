@@ -0,0 +1,70 @@
+import json
+from dataclasses import FrozenInstanceError, replace
+from datetime import date
+from decimal import Decimal
+from unittest import mock
+
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy
+
+from calculators import serialization
+from calculators.results import LoanPayment, Milestone
+from calculators.serialization import JsonResponse, dumps
+from calculators.utils import calculate_loan_payment
+
+ROW = LoanPayment(1, 100.0, 90.0, 10.0, 910.0)
+DATA = {
+    'row': ROW,
+    'day': date(2024, 2, 29),
+    'amount': Decimal('1.50'),
+    'label': gettext_lazy('Total'),
+    1: 'numeric key',
+}
+EXPECTED = {
+    'row': {'payment_number': 1, 'payment_amount': 100.0, 'principal_payment': 90.0,
+            'interest_payment': 10.0, 'remaining_balance': 910.0},
+    'day': '2024-02-29',
+    'amount': '1.50',
+    'label': 'Total',
+    '1': 'numeric key',
+}
+
+
+class SerializationTests(SimpleTestCase):
+    def test_dumps(self):
+        self.assertEqual(json.loads(dumps(DATA)), EXPECTED)
+
+    def test_dumps_without_orjson(self):
+        with mock.patch.object(serialization, 'orjson', None):
+            self.assertEqual(json.loads(dumps(DATA)), EXPECTED)
+
+    def test_unknown_types_fail(self):
+        with self.assertRaises(TypeError):
+            dumps({'value': object()})
+
+    def test_json_response(self):
+        response = JsonResponse({'success': True, 'result': {'rows': [ROW]}})
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(json.loads(response.content)['result']['rows'][0]['payment_number'], 1)
+        with self.assertRaises(TypeError):
+            JsonResponse([ROW])
+        self.assertEqual(json.loads(JsonResponse([1], safe=False).content), [1])
+
+
+class ResultRowTests(SimpleTestCase):
+    def test_rows_are_frozen_and_slotted(self):
+        with self.assertRaises(FrozenInstanceError):
+            ROW.payment_amount = 0
+        self.assertFalse(hasattr(ROW, '__dict__'))
+        self.assertEqual(replace(ROW, payment_number=2).payment_number, 2)
+        self.assertEqual(ROW.payment_number, 1)
+
+    def test_rows_are_hashable_values(self):
+        self.assertEqual(Milestone(4, 'Heartbeat', '2024-01-01'), Milestone(4, 'Heartbeat', '2024-01-01'))
+        self.assertEqual(len({ROW, replace(ROW)}), 1)
+
+    def test_calculators_return_rows(self):
+        result = calculate_loan_payment(10000, 6, 5)
+        schedule = result['amortization_schedule']
+        self.assertTrue(all(isinstance(row, LoanPayment) for row in schedule))
+        self.assertEqual(schedule[0].payment_number, 1)
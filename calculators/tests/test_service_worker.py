@@ -0,0 +1,27 @@
+from django.test import TestCase
+from django.urls import reverse
+
+
+class ServiceWorkerTests(TestCase):
+    def test_worker_skips_private_pages(self):
+        response = self.client.get(reverse('calculators:service_worker'))
+        worker = response.content.decode()
+        self.assertIn('!/no-store|private/.test(cacheControl)', worker)
+
+    def test_queued_bodies_keep_raw_bytes(self):
+        worker = self.client.get(reverse('calculators:service_worker')).content.decode()
+        self.assertIn('copy.arrayBuffer()', worker)
+        self.assertNotIn('copy.text()', worker)
+
+
+class PrivateFlashMessageTests(TestCase):
+    url = reverse('calculators:bmi_calculator')
+
+    def test_page_with_flash_message_is_private(self):
+        response = self.client.post(self.url, {'weight': 'heavy', 'height': '175'})
+        self.assertContains(response, 'Invalid input values')
+        self.assertIn('private', response['Cache-Control'])
+
+    def test_plain_page_stays_cacheable(self):
+        response = self.client.get(self.url)
+        self.assertNotIn('private', response.get('Cache-Control', ''))
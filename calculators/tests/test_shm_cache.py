@@ -0,0 +1,132 @@
+import os
+import tempfile
+import threading
+import time
+
+from django.test import SimpleTestCase
+
+from calculators.shm_cache import SharedMemoryCache, _segments, close_segments
+
+
+class SharedMemoryCacheTests(SimpleTestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.location = os.path.join(self.directory.name, 'cache')
+        self.cache = self.make_cache()
+        self.addCleanup(close_segments, self.directory.name)
+
+    def make_cache(self, **options):
+        options = {'SLOTS': 64, 'SLOT_SIZE': 1024, 'LARGE_SLOTS': 8, 'LARGE_SLOT_SIZE': 8192, 'WAYS': 4, **options}
+        return SharedMemoryCache(self.location, {'TIMEOUT': 60, 'OPTIONS': options})
+
+    def test_set_get_delete(self):
+        self.cache.set('key', {'value': [1, 2, 3]})
+        self.assertEqual(self.cache.get('key'), {'value': [1, 2, 3]})
+        self.assertTrue(self.cache.delete('key'))
+        self.assertIsNone(self.cache.get('key'))
+
+    def test_add_and_touch(self):
+        self.assertTrue(self.cache.add('key', 1))
+        self.assertFalse(self.cache.add('key', 2))
+        self.assertEqual(self.cache.get('key'), 1)
+        self.assertTrue(self.cache.touch('key', 120))
+        self.assertFalse(self.cache.touch('missing'))
+
+    def test_expiry(self):
+        self.cache.set('key', 1, 0.05)
+        time.sleep(0.1)
+        self.assertIsNone(self.cache.get('key'))
+        self.assertTrue(self.cache.add('key', 2))
+
+    def test_large_values_use_the_large_slots(self):
+        self.cache.set('key', 'small')
+        self.cache.set('key', 'x' * 4096)
+        self.assertEqual(self.cache.get('key'), 'x' * 4096)
+        self.cache.set('key', 'small again')
+        self.assertEqual(self.cache.get('key'), 'small again')
+        self.assertTrue(self.cache.delete('key'))
+        self.assertIsNone(self.cache.get('key'))
+
+    def test_oversized_values_are_not_cached(self):
+        self.cache.set('key', 'x' * 4096)
+        self.cache.set('key', 'x' * 16384)
+        self.assertIsNone(self.cache.get('key'))
+        self.assertFalse(self.cache.add('key', 'x' * 16384))
+
+    def test_eviction_keeps_recent_keys(self):
+        for i in range(500):
+            self.cache.set(f'key-{i}', i)
+        self.assertEqual(self.cache.get('key-499'), 499)
+        self.assertLessEqual(sum(self.cache.get(f'key-{i}') is not None for i in range(500)), 64)
+        for i in range(50):
+            self.cache.set(f'page-{i}', 'x' * 4096)
+        self.assertLessEqual(sum(self.cache.get(f'page-{i}') is not None for i in range(50)), 8)
+
+    def test_instances_share_one_mapping(self):
+        self.cache.set('key', 'shared')
+        opened = len(_segments)
+        caches = [self.make_cache() for _ in range(20)]
+        self.assertTrue(all(cache.get('key') == 'shared' for cache in caches))
+        self.assertEqual(len(_segments), opened)
+
+    def test_concurrent_readers_see_whole_values(self):
+        stop = threading.Event()
+        torn = []
+
+        def write():
+            i = 0
+            while not stop.is_set():
+                i += 1
+                self.cache.set('key', (i, 'x' * (i % 500), i))
+
+        def read():
+            while not stop.is_set():
+                value = self.cache.get('key')
+                if value is not None and (value[0] != value[2] or len(value[1]) != value[0] % 500):
+                    torn.append(value)
+
+        threads = [threading.Thread(target=write) for _ in range(2)] + [threading.Thread(target=read) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.5)
+        stop.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(torn, [])
+
+    def test_shared_with_forked_processes(self):
+        if not hasattr(os, 'fork'):
+            self.skipTest('fork is not available')
+        self.cache.set('parent', 'set before fork')
+        pid = os.fork()
+        if pid == 0:
+            try:
+                ok = self.cache.get('parent') == 'set before fork'
+                self.cache.set('child', os.getpid() if ok else None)
+            finally:
+                os._exit(0)
+        os.waitpid(pid, 0)
+        self.assertEqual(self.cache.get('child'), pid)
+
+    def test_geometry_change_uses_a_new_file(self):
+        self.cache.set('key', 1)
+        resized = self.make_cache(SLOT_SIZE=2048)
+        self.assertNotEqual(resized.path, self.cache.path)
+        self.assertIsNone(resized.get('key'))
+        resized.set('key', 2)
+        # The file the first geometry mapped is left as it was
+        self.assertEqual(self.cache.get('key'), 1)
+        self.assertEqual(os.path.getsize(self.cache.path), self.cache._size)
+
+    def test_foreign_file_is_not_resized(self):
+        with open(self.cache.path, 'wb') as file:
+            file.write(b'not a cache file')
+        with self.assertRaises(ValueError):
+            self.cache.get('key')
+        with open(self.cache.path, 'rb') as file:
+            self.assertEqual(file.read(), b'not a cache file')
+
+    def test_tests_use_a_temporary_cache(self):
+        from django.core.cache import caches
+        self.assertNotIn('/dev/shm', caches['shared'].path)
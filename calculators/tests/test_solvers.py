@@ -0,0 +1,69 @@
+import json
+
+from django.test import SimpleTestCase
+from django.urls import reverse
+
+from calculators.solvers import max_home_price, required_contribution, solve_apr, solve_term
+from calculators.utils import calculate_401k, calculate_loan_payment, calculate_mortgage
+
+
+class SolverTests(SimpleTestCase):
+    def test_apr_round_trip(self):
+        for annual_rate, years in ((7.25, 5), (3.5, 30), (19.99, 2)):
+            payment = calculate_loan_payment(20000, annual_rate, years)['payment_amount']
+            self.assertAlmostEqual(solve_apr(20000, payment, years)['apr'], annual_rate, delta=0.01)
+
+    def test_term_round_trip(self):
+        for annual_rate, years in ((7.25, 5), (0, 4), (4.5, 15)):
+            payment = calculate_loan_payment(20000, annual_rate, years)['payment_amount']
+            result = solve_term(20000, annual_rate, payment)
+            self.assertEqual(result['total_payments'], years * 12)
+            self.assertLessEqual(result['final_payment'], payment)
+
+    def test_term_rejects_endless_loans(self):
+        with self.assertRaises(ValueError):
+            solve_term(1e9, 0, 0.01)
+        with self.assertRaises(ValueError):
+            solve_term(100000, 12, 1000)
+
+    def test_home_price_round_trip(self):
+        for budget, down_payment in ((2500, 80000), (4000, 200000), (1800, 10000)):
+            price = max_home_price(budget, down_payment, 6.5, 30, property_tax=3000, home_insurance=1200)['home_price']
+            cost = calculate_mortgage(price, down_payment, 6.5, 30, 3000, 1200)['total_monthly']
+            self.assertLessEqual(cost, budget)
+            more = calculate_mortgage(price + 100, down_payment, 6.5, 30, 3000, 1200)['total_monthly']
+            self.assertGreater(more, budget)
+
+    def test_contribution_round_trip(self):
+        result = required_contribution(2000000, 30, 65, 10000, 80000, 3, 7)
+        projected = calculate_401k(30, 65, 10000, 80000, result['contribution_rate'], 3, 7)
+        self.assertAlmostEqual(projected['total_at_retirement'], 2000000, delta=2000000 * 0.001)
+
+
+
+class SolveAPITests(SimpleTestCase):
+    def post(self, goal, data):
+        url = reverse('calculators:solve_api', args=[goal])
+        return self.client.post(url, json.dumps(data), content_type='application/json')
+
+    def test_single_case(self):
+        response = self.post('loan-term', {'loan_amount': 20000, 'interest_rate': 0, 'payment': 500})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['result']['total_payments'], 40)
+
+    def test_cases_keep_order_and_key_errors(self):
+        cases = [
+            {'loan_amount': 20000, 'interest_rate': 0, 'payment': 500},
+            {'loan_amount': 20000, 'interest_rate': 0, 'payment': 1000},
+        ]
+        results = self.post('loan-term', {'cases': cases}).json()['results']
+        self.assertEqual([result['total_payments'] for result in results], [40, 20])
+
+        response = self.post('loan-term', {'cases': [cases[0], {'loan_amount': 'x'}, 3]})
+        self.assertEqual(response.status_code, 400)
+        errors = response.json()['errors']
+        self.assertIn('cases.1.loan_amount', errors)
+        self.assertEqual(errors['cases.2'], 'must be an object')
+
+    def test_unknown_goal(self):
+        self.assertEqual(self.post('interest', {}).status_code, 404)
@@ -0,0 +1,46 @@
+import json
+import tempfile
+from pathlib import Path
+
+from django.test import TestCase, override_settings
+
+from calculators.models import Calculator, HomepageContent, Testimonial
+from calculators.static_export import MANIFEST_NAME, export_site
+
+
+class StaticExportSignalTests(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.root = Path(directory.name)
+        settings = override_settings(STATIC_EXPORT_ROOT=self.root)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        self.homepage = HomepageContent.objects.create(title='Calculator Hub', subtitle='Free calculators')
+
+    def manifest(self):
+        return json.loads((self.root / MANIFEST_NAME).read_text())['pages']
+
+    def test_nothing_is_exported_before_the_first_export(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            Testimonial.objects.create(name='Ada', message='Handy')
+        self.assertEqual(callbacks, [])
+        self.assertFalse((self.root / MANIFEST_NAME).exists())
+
+    def test_homepage_content_changes_re_export(self):
+        export_site()
+        self.assertIn('sw.js', self.manifest()['/sw.js']['file'])
+        before = self.manifest()['/']['etag']
+        with self.captureOnCommitCallbacks(execute=True):
+            self.homepage.title = 'Number Hub'
+            self.homepage.save()
+        self.assertNotEqual(self.manifest()['/']['etag'], before)
+        self.assertIn('Number Hub', (self.root / 'index.html').read_text())
+
+    def test_usage_counts_do_not_re_export(self):
+        calculator = Calculator.objects.create(name='BMI', slug='bmi-calculator', description='BMI', icon='x')
+        export_site()
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            calculator.usage_count += 1
+            calculator.save(update_fields=['usage_count'])
+        self.assertEqual(callbacks, [])
@@ -0,0 +1,108 @@
+import threading
+import time
+import uuid
+from unittest import mock
+
+from django.core.cache import caches
+from django.test import SimpleTestCase
+
+from calculators import tiered_cache
+from calculators.tiered_cache import remember
+
+
+class Counter:
+    """A computation that counts its calls and can be made slow."""
+
+    def __init__(self, value='value', delay=0.0):
+        self.value = value
+        self.delay = delay
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        time.sleep(self.delay)
+        return self.value
+
+
+class RememberTests(SimpleTestCase):
+    def setUp(self):
+        self.cache = caches['default']
+        self.key = f'test:{uuid.uuid4().hex}'
+
+    def wait_for(self, condition, seconds=3):
+        deadline = time.monotonic() + seconds
+        while not condition():
+            if time.monotonic() > deadline:
+                self.fail('timed out')
+            time.sleep(0.01)
+
+    def test_caches_the_value(self):
+        compute = Counter()
+        self.assertEqual(remember(self.key, compute), 'value')
+        self.assertEqual(remember(self.key, compute), 'value')
+        self.assertEqual(compute.calls, 1)
+
+    def test_concurrent_misses_compute_once(self):
+        compute = Counter(delay=0.2)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(remember(self.key, compute))) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, ['value'] * 4)
+        self.assertEqual(compute.calls, 1)
+
+    def test_miss_waits_for_another_process(self):
+        # Another process holds the lock and stores its result shortly
+        self.cache.add(f'{self.key}:lock', 'other', 30)
+        threading.Timer(0.2, lambda: self.cache.set(self.key, ('theirs', time.time() + 60, 0.2), 60)).start()
+        compute = Counter('ours')
+        self.assertEqual(remember(self.key, compute), 'theirs')
+        self.assertEqual(compute.calls, 0)
+
+    def test_miss_wait_is_bounded(self):
+        # The lock holder never finishes
+        self.cache.add(f'{self.key}:lock', 'other', 30)
+        compute = Counter('ours')
+        started = time.monotonic()
+        with mock.patch.object(tiered_cache, 'MISS_WAIT', 0.2):
+            self.assertEqual(remember(self.key, compute), 'ours')
+        self.assertLess(time.monotonic() - started, 2)
+        self.assertEqual(compute.calls, 1)
+        # The other caller's lock is left alone
+        self.assertEqual(self.cache.get(f'{self.key}:lock'), 'other')
+
+    def test_stale_value_served_while_refreshing(self):
+        self.cache.set(self.key, ('old', time.time() - 1, 0.01), 60)
+        compute = Counter('new', delay=0.1)
+        self.assertEqual(remember(self.key, compute, timeout=60, stale=60), 'old')
+        self.wait_for(lambda: self.cache.get(self.key)[0] == 'new')
+        self.assertEqual(remember(self.key, compute, timeout=60, stale=60), 'new')
+        self.assertEqual(compute.calls, 1)
+        self.wait_for(lambda: self.cache.get(f'{self.key}:lock') is None)
+
+    def test_refresh_lock_expires(self):
+        self.cache.set(self.key, ('old', time.time() - 1, 0.01), 60)
+        compute = Counter('new')
+        with mock.patch.object(tiered_cache, 'LOCK_TIMEOUT', 1):
+            # A refresh elsewhere holds the lock: serve stale without computing
+            self.cache.add(f'{self.key}:lock', 'other', tiered_cache.LOCK_TIMEOUT)
+            self.assertEqual(remember(self.key, compute, timeout=60, stale=60), 'old')
+            time.sleep(0.1)
+            self.assertEqual(compute.calls, 0)
+
+            # That refresh died; once its lock expires the next request refreshes
+            time.sleep(1.1)
+            self.assertEqual(remember(self.key, compute, timeout=60, stale=60), 'old')
+            self.wait_for(lambda: self.cache.get(self.key)[0] == 'new')
+        self.assertEqual(compute.calls, 1)
+
+    def test_errors_are_not_cached(self):
+        def fail():
+            raise ValueError('boom')
+
+        with self.assertRaises(ValueError):
+            remember(self.key, fail)
+        self.assertIsNone(self.cache.get(self.key))
+        self.assertIsNone(self.cache.get(f'{self.key}:lock'))
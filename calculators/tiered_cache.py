@@ -0,0 +1,244 @@
+"""
+Two-tier caching with stampede protection.
+
+``TieredCache`` is a cache backend that keeps a small in-process LRU (L1) in
+front of another configured cache (L2, normally the shared-memory one). L1
+entries live a few seconds at most, so a value changed through one worker is
+seen by the others within ``L1_TIMEOUT``.
+
+``remember()`` memoizes an expensive computation in a cache without letting
+a hot key's expiry turn into a burst of identical recomputations:
+
+* single flight: on a miss, one caller per key computes (a thread lock within
+  the process, an ``add()``-based lock across processes) while the others
+  wait for its result, for up to ``MISS_WAIT`` seconds before computing it
+  themselves;
+* probabilistic early refresh: as expiry nears, a request recomputes early
+  with a probability that grows with how long the value took to compute
+  ("XFetch"), so refreshes spread out instead of lining up at expiry;
+* stale while revalidate: for ``stale`` seconds after expiry the old value is
+  still served while one background thread recomputes it.
+"""
+import logging
+import math
+import pickle
+import random
+import threading
+import time
+import uuid
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict
+
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_L1_MAX_ENTRIES = 1000
+DEFAULT_L1_TIMEOUT = 5
+# Longest a computation may hold its single-flight lock, and how often waiters look for its result
+LOCK_TIMEOUT = 30
+POLL_INTERVAL = 0.05
+# Longest a miss waits for another process's computation before computing the value itself.
+# Calculator results take milliseconds, so this only matters when the lock holder hangs or died.
+MISS_WAIT = 1.0
+# XFetch aggressiveness; above 1 refreshes earlier
+EARLY_REFRESH_BETA = 1.0
+
+# L1 stores by LOCATION, shared by the per-thread backend instances like LocMemCache's
+_l1_stores: Dict[str, OrderedDict] = {}
+_l1_locks: Dict[str, threading.Lock] = {}
+
+
+class TieredCache(BaseCache):
+    pickle_protocol = pickle.HIGHEST_PROTOCOL
+
+    def __init__(self, location, params):
+        super().__init__(params)
+        options = params.get('OPTIONS', {})
+        self._l2_alias = options.get('L2', 'shared')
+        self._l1_max_entries = int(options.get('L1_MAX_ENTRIES', DEFAULT_L1_MAX_ENTRIES))
+        self._l1_timeout = float(options.get('L1_TIMEOUT', DEFAULT_L1_TIMEOUT))
+        self._l1 = _l1_stores.setdefault(location, OrderedDict())
+        self._lock = _l1_locks.setdefault(location, threading.Lock())
+
+    @property
+    def l2(self) -> BaseCache:
+        return caches[self._l2_alias]
+
+    # L1: pickled values, so callers never share (and mutate) one object
+
+    def _l1_get(self, key):
+        with self._lock:
+            entry = self._l1.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._l1[key]
+                return None
+            self._l1.move_to_end(key)
+            return entry
+
+    def _l1_set(self, key, value, timeout):
+        lifetime = self._l1_timeout
+        if timeout is not None:
+            lifetime = min(lifetime, timeout)
+        if lifetime <= 0:
+            self._l1_delete(key)
+            return
+        entry = (time.monotonic() + lifetime, pickle.dumps(value, self.pickle_protocol))
+        with self._lock:
+            self._l1[key] = entry
+            self._l1.move_to_end(key)
+            while len(self._l1) > self._l1_max_entries:
+                self._l1.popitem(last=False)
+
+    def _l1_delete(self, key):
+        with self._lock:
+            self._l1.pop(key, None)
+
+    def _timeout(self, timeout):
+        """Seconds for this entry (None for forever), resolving DEFAULT_TIMEOUT."""
+        return self.default_timeout if timeout is DEFAULT_TIMEOUT else timeout
+
+    # Cache API
+
+    def get(self, key, default=None, version=None):
+        local_key = self.make_and_validate_key(key, version=version)
+        entry = self._l1_get(local_key)
+        if entry is not None:
+            return pickle.loads(entry[1])
+        value = self.l2.get(key, self._missing_key, version=version)
+        if value is self._missing_key:
+            return default
+        self._l1_set(local_key, value, None)
+        return value
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        timeout = self._timeout(timeout)
+        self.l2.set(key, value, timeout, version=version)
+        self._l1_set(self.make_and_validate_key(key, version=version), value, timeout)
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        timeout = self._timeout(timeout)
+        if not self.l2.add(key, value, timeout, version=version):
+            return False
+        self._l1_set(self.make_and_validate_key(key, version=version), value, timeout)
+        return True
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        self._l1_delete(self.make_and_validate_key(key, version=version))
+        return self.l2.touch(key, self._timeout(timeout), version=version)
+
+    def delete(self, key, version=None):
+        self._l1_delete(self.make_and_validate_key(key, version=version))
+        return self.l2.delete(key, version=version)
+
+    def has_key(self, key, version=None):
+        return self.get(key, self._missing_key, version=version) is not self._missing_key
+
+    def clear(self):
+        with self._lock:
+            self._l1.clear()
+        self.l2.clear()
+
+
+# Memoization with stampede protection
+
+# Per-key locks of computations in progress; entries go away with their last user
+_flights: 'weakref.WeakValueDictionary[str, threading.Lock]' = weakref.WeakValueDictionary()
+_flights_lock = threading.Lock()
+
+
+def _flight(key: str) -> threading.Lock:
+    with _flights_lock:
+        lock = _flights.get(key)
+        if lock is None:
+            lock = _flights[key] = threading.Lock()
+        return lock
+
+
+def _acquire(cache: BaseCache, key: str):
+    """The cross-process lock of ``key``: a token if this caller got it, else None."""
+    token = uuid.uuid4().hex
+    return token if cache.add(f'{key}:lock', token, LOCK_TIMEOUT) else None
+
+
+def _release(cache: BaseCache, key: str, token: str):
+    if cache.get(f'{key}:lock') == token:
+        cache.delete(f'{key}:lock')
+
+
+def _compute(cache: BaseCache, key: str, compute: Callable[[], Any], timeout: float, stale: float):
+    started = time.monotonic()
+    value = compute()
+    took = time.monotonic() - started
+    cache.set(key, (value, time.time() + timeout, took), timeout + stale)
+    return value
+
+
+def _refresh_in_background(alias: str, key: str, compute, timeout, stale, token):
+    def run():
+        cache = caches[alias]
+        try:
+            _compute(cache, key, compute, timeout, stale)
+        except Exception:
+            logger.exception("Background refresh of %s failed", key)
+        finally:
+            _release(cache, key, token)
+            # Close the database connections this thread opened
+            connections.close_all()
+
+    threading.Thread(target=run, name=f'refresh {key}', daemon=True).start()
+
+
+def remember(key: str, compute: Callable[[], Any], timeout: float = 300, stale: float = 0,
+             alias: str = 'default') -> Any:
+    """
+    The value of ``compute()``, cached under ``key`` for ``timeout`` seconds
+    and served stale for ``stale`` seconds more while it is recomputed.
+
+    Exceptions from ``compute`` propagate to the caller that ran it and
+    nothing is cached.
+    """
+    cache = caches[alias]
+    entry = cache.get(key)
+    if entry is not None:
+        value, fresh_until, took = entry
+        now = time.time()
+        if now < fresh_until:
+            # XFetch: -log(U) is exponential, so early refreshes are rare until close to expiry
+            if now - took * EARLY_REFRESH_BETA * math.log(1 - random.random()) < fresh_until:
+                return value
+            token = _acquire(cache, key)
+            if token is None:
+                return value
+            try:
+                return _compute(cache, key, compute, timeout, stale)
+            finally:
+                _release(cache, key, token)
+        token = _acquire(cache, key)
+        if token is not None:
+            _refresh_in_background(alias, key, compute, timeout, stale, token)
+        return value
+
+    # Miss: one computation per key at a time, in this process and across them
+    with _flight(key):
+        entry = cache.get(key)
+        if entry is not None:
+            return entry[0]
+        token = _acquire(cache, key)
+        deadline = time.monotonic() + MISS_WAIT
+        while token is None and time.monotonic() < deadline:
+            time.sleep(POLL_INTERVAL)
+            entry = cache.get(key)
+            if entry is not None:
+                return entry[0]
+            token = _acquire(cache, key)
+        try:
+            return _compute(cache, key, compute, timeout, stale)
+        finally:
+            if token is not None:
+                _release(cache, key, token)
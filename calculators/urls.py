@@ -8,28 +8,44 @@ urlpatterns = [
     
     path('sitemap.xml', views.sitemap_xml, name='sitemap_xml'),
     path('robots.txt', views.robots_txt, name='robots_txt'),
+    path('sw.js', views.service_worker, name='service_worker'),
     
     
     path('calculator/<slug:slug>/', views.calculator_detail, name='calculator_detail'),
     path('citation-generator/', views.citation_generator, name='citation_generator'),
     path('age-calculator/', views.age_calculator, name='age_calculator'),
+    path('age-calculator/bulk/', views.bulk_age_calculator, name='bulk_age_calculator'),
     path('bmi-calculator/', views.bmi_calculator, name='bmi_calculator'),
+    path('bmi-calculator/r/', views.bmi_permalink, name='bmi_permalink'),
     path('bmr-calculator/', views.bmr_calculator, name='bmr_calculator'),
+    path('bmr-calculator/r/', views.bmr_permalink, name='bmr_permalink'),
     path('mortgage-calculator/', views.mortgage_calculator, name='mortgage_calculator'),
+    path('mortgage-calculator/r/', views.mortgage_permalink, name='mortgage_permalink'),
     path('date-of-birth-calculator/', views.date_of_birth_calculator, name='date_of_birth_calculator'),
     path('calculator/date-of-birth-calculator/', views.calculator_detail, {'slug': 'date-of-birth-calculator'}, name='date_of_birth_calculator_detail'),
     path('grade-calculator/', views.grade_calculator, name='grade_calculator'),
+    path('grade-calculator/gradebook/', views.gradebook_calculator, name='gradebook_calculator'),
     path('calculator/grade-calculator/', views.calculator_detail, {'slug': 'grade-calculator'}, name='grade_calculator_detail'),
     path('gpa-calculator/', views.gpa_calculator, name='gpa_calculator'),
     path('pregnancy-calculator/', views.pregnancy_calculator, name='pregnancy_calculator'),
+    path('pregnancy-calculator/timeline/', views.pregnancy_timeline_api, name='pregnancy_timeline'),
     path('calculator/pregnancy-calculator/', views.calculator_detail, {'slug': 'pregnancy-calculator'}, name='pregnancy_calculator_detail'),    path('calorie-calculator/', views.calorie_calculator, name='calorie_calculator'),
     path('401k-calculator/', views.k401_calculator, name='401k_calculator'),
+    path('401k-calculator/r/', views.k401_permalink, name='401k_permalink'),
     path('calculator/401k-calculator/', views.calculator_detail, {'slug': '401k-calculator'}, name='401k_calculator_detail'),
     path('percentage-calculator/', views.percentage_calculator, name='percentage_calculator'),
     path('loan-calculator/', views.loan_calculator, name='loan_calculator'),
+    path('loan-calculator/r/', views.loan_permalink, name='loan_permalink'),
     path('calculator/loan-calculator/', views.calculator_detail, {'slug': 'loan-calculator'}, name='loan_calculator_detail'),
     # AJAX endpoints
     path('ajax/add-gpa-row/', views.add_gpa_row, name='add_gpa_row'),
+    path('ajax/csrf-token/', views.csrf_token, name='csrf_token'),
+    
+    # JSON API
+    path('api/metabolic/', views.metabolic_api, name='metabolic_api'),
+    path('api/bmi/', views.bmi_roster_api, name='bmi_roster_api'),
+    path('api/calculate/<slug:slug>/', views.calculate_api, name='calculate_api'),
+    path('api/solve/<slug:goal>/', views.solve_api, name='solve_api'),
     
         # Static pages
     path('about/', views.about_us, name='about_us'),
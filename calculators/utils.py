@@ -1,19 +1,25 @@
 from datetime import date, datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Iterable, Iterator, Mapping, Optional, Sequence, Tuple
 from calendar import monthrange
+from fractions import Fraction
+from .bmi import adult_category
+from .business_days import business_calendar, business_day_summary
+from .grading import get_grade_scale
+from .finance import amortize, apply_rate, div_half_even, periodic_rate, to_cents, to_dollars
+from .results import LoanPayment, MortgagePayment, RetirementYear
+from .taxes import FILING_STATUSES, STATES, income_tax
+
+# Assumptions of the Roth / traditional 401k comparison, in percent and years
+INFLATION = 2.5
+RETIREMENT_YEARS = 25
 
 def calculate_age_detailed(birth_date: date) -> Dict[str, Any]:
     """Calculate detailed age information including next birthday."""
     today = date.today()
     return calculate_age_between_dates(birth_date, today)
 
-def calculate_age_between_dates(birth_date: date, target_date: date) -> Dict[str, Any]:
-    """Calculate age between two specific dates."""
-    
-    if birth_date > target_date:
-        raise ValueError("Birth date cannot be after the target date")
-    
-    # Calculate age
+def _split_age(birth_date: date, target_date: date):
+    """Split the span between two dates into (years, months, days)."""
     years = target_date.year - birth_date.year
     months = target_date.month - birth_date.month
     days = target_date.day - birth_date.day
@@ -35,6 +41,16 @@ def calculate_age_between_dates(birth_date: date, target_date: date) -> Dict[str
         years -= 1
         months = 12 + months
     
+    return years, months, days
+
+def calculate_age_between_dates(birth_date: date, target_date: date) -> Dict[str, Any]:
+    """Calculate age between two specific dates."""
+    
+    if birth_date > target_date:
+        raise ValueError("Birth date cannot be after the target date")
+    
+    years, months, days = _split_age(birth_date, target_date)
+    
     # Calculate totals
     total_days = (target_date - birth_date).days
     total_weeks = total_days // 7
@@ -68,52 +84,72 @@ def calculate_age_between_dates(birth_date: date, target_date: date) -> Dict[str
         'target_date_formatted': target_date.strftime('%B %d, %Y')
     }
 
-def get_bmi_category_info(bmi: float) -> Dict[str, str]:
-    """Get BMI category information with health recommendations."""
-    if bmi < 18.5:
-        return {
-            'category': 'Underweight',
-            'color': 'info',
-            'description': 'Below normal weight range',
-            'recommendation': 'Consider consulting a healthcare provider about healthy weight gain.',
-            'range': 'Below 18.5'
-        }
-    elif 18.5 <= bmi < 25:
-        return {
-            'category': 'Normal weight',
-            'color': 'success',
-            'description': 'Within healthy weight range',
-            'recommendation': 'Maintain your current lifestyle with balanced diet and regular exercise.',
-            'range': '18.5 - 24.9'
-        }
-    elif 25 <= bmi < 30:
-        return {
-            'category': 'Overweight',
-            'color': 'warning',
-            'description': 'Above normal weight range',
-            'recommendation': 'Consider a balanced diet and increased physical activity.',
-            'range': '25.0 - 29.9'
-        }
-    else:
-        return {
-            'category': 'Obese',
-            'color': 'danger',
-            'description': 'Significantly above normal weight range',
-            'recommendation': 'Consult a healthcare provider for personalized weight management advice.',
-            'range': '30.0 and above'
-        }
+def calculate_ages_batch(date_pairs: Iterable[Tuple[date, Optional[date]]]) -> Iterator[Optional[Tuple[int, int, int, int]]]:
+    """
+    Calculate ages for many (birth_date, target_date) pairs at once.
+    
+    Results are yielded lazily in input order, so rosters of any length can be
+    processed without holding them in memory. Only the core age components are
+    produced; the formatted strings and next-birthday lookup of
+    calculate_age_between_dates are skipped.
+    
+    Args:
+        date_pairs: Iterable of (birth_date, target_date) tuples. A target date
+            of None means today.
+    
+    Yields:
+        (years, months, days, total_days) tuples, or None when the birth date
+        is after the target date.
+    """
+    today = date.today()
+    
+    for birth_date, target_date in date_pairs:
+        if target_date is None:
+            target_date = today
+        
+        if birth_date > target_date:
+            yield None
+            continue
+        
+        years, months, days = _split_age(birth_date, target_date)
+        yield years, months, days, (target_date - birth_date).days
+
+def calculate_business_days(start_date: date, end_date: date, region: str = 'us',
+                            offset: int = 0) -> Dict[str, Any]:
+    """
+    Working days between two dates, and optionally the date ``offset``
+    business days after ``end_date`` (before it, if negative).
+    
+    Counts run from ``start_date`` up to but not including ``end_date``.
+    Raises ValueError when the dates are outside the calendar's 1900-2150
+    range; an offset date past either end is reported in ``offset_error``
+    instead, so the counts are kept.
+    """
+    result = business_day_summary(start_date, end_date, region)
+    result['offset'] = offset
+    result['offset_date'] = None
+    result['offset_error'] = None
+    if offset:
+        try:
+            result['offset_date'] = business_calendar(region).add(end_date, offset)
+        except ValueError as e:
+            result['offset_error'] = str(e)
+    return result
+
+def get_bmi_category_info(bmi: float) -> Mapping[str, str]:
+    """Get BMI category information with health recommendations.
 
-def calculate_gpa(entries: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Calculate GPA from list of grade entries."""
+    Returns the shared read-only record for the category; copy it before
+    changing anything.
+    """
+    return adult_category(bmi)
+
+def calculate_gpa(entries: List[Dict[str, Any]], scale: Optional[str] = None) -> Dict[str, Any]:
+    """Calculate GPA from list of grade entries on the given grade scale."""
     if not entries:
         raise ValueError("No entries provided")
     
-    grade_points = {
-        'A+': 4.0, 'A': 4.0, 'A-': 3.7,
-        'B+': 3.3, 'B': 3.0, 'B-': 2.7,
-        'C+': 2.3, 'C': 2.0, 'C-': 1.7,
-        'D+': 1.3, 'D': 1.0, 'F': 0.0
-    }
+    grade_scale = get_grade_scale(scale)
     
     total_quality_points = 0
     total_credit_hours = 0
@@ -122,7 +158,9 @@ def calculate_gpa(entries: List[Dict[str, Any]]) -> Dict[str, Any]:
     for entry in entries:
         grade = entry['grade']
         credit_hours = float(entry['credit_hours'])
-        points = grade_points.get(grade, 0.0)
+        points = grade_scale.grade_point(grade, None)
+        if points is None:
+            raise ValueError(f"Invalid letter grade: {grade}")
         
         total_quality_points += points * credit_hours
         total_credit_hours += credit_hours
@@ -138,14 +176,15 @@ def calculate_gpa(entries: List[Dict[str, Any]]) -> Dict[str, Any]:
     
     gpa = total_quality_points / total_credit_hours
     
-    # Determine GPA category
-    if gpa >= 3.7:
+    # Determine GPA category (thresholds are on the 4.0 scale)
+    normalized_gpa = gpa * 4.0 / grade_scale.top
+    if normalized_gpa >= 3.7:
         category = 'Excellent'
         color = 'success'
-    elif gpa >= 3.0:
+    elif normalized_gpa >= 3.0:
         category = 'Good'
         color = 'info'
-    elif gpa >= 2.0:
+    elif normalized_gpa >= 2.0:
         category = 'Satisfactory'
         color = 'warning'
     else:
@@ -160,7 +199,8 @@ def calculate_gpa(entries: List[Dict[str, Any]]) -> Dict[str, Any]:
         'color': color,
         'grade_distribution': grade_distribution,
         'entries': entries,
-        'percentage': round(gpa * 25, 1) if gpa <= 4.0 else 100  # Convert to percentage
+        'percentage': min(100, round(grade_scale.percentage_for_points(gpa), 1)),  # Convert to percentage
+        'scale': grade_scale.key
     }
     
     
@@ -170,45 +210,32 @@ def calculate_loan_payment(principal, annual_rate, years, payment_frequency=12):
     """Calculate loan payment with comprehensive details."""
     try:
         principal = float(principal)
-        annual_rate = float(annual_rate) / 100  # Convert percentage to decimal
+        rate_percent = float(annual_rate)
+        annual_rate = rate_percent / 100  # Convert percentage to decimal
         years = float(years)
         payment_frequency = int(payment_frequency)
         
         if principal <= 0 or annual_rate < 0 or years <= 0:
             raise ValueError("Invalid input values")
         
-        # Calculate payment details
-        total_payments = years * payment_frequency
-        periodic_rate = annual_rate / payment_frequency if annual_rate > 0 else 0
-        
-        if annual_rate == 0:
-            # No interest loan
-            payment = principal / total_payments
-            total_amount = principal
-            total_interest = 0
-        else:
-            # Standard loan calculation
-            payment = (principal * periodic_rate * (1 + periodic_rate)**total_payments) / \
-                     ((1 + periodic_rate)**total_payments - 1)
-            total_amount = payment * total_payments
-            total_interest = total_amount - principal
-        
-        # Create amortization schedule (first 12 payments for display)
-        schedule = []
-        remaining_balance = principal
-        
-        for i in range(min(12, int(total_payments))):
-            interest_payment = remaining_balance * periodic_rate
-            principal_payment = payment - interest_payment
-            remaining_balance -= principal_payment
-            
-            schedule.append({
-                'payment_number': i + 1,
-                'payment_amount': round(payment, 2),
-                'principal_payment': round(principal_payment, 2),
-                'interest_payment': round(interest_payment, 2),
-                'remaining_balance': round(max(0, remaining_balance), 2)
-            })
+        # Calculate payment details in whole cents
+        total_payments = round(years * payment_frequency)
+        ledger = amortize(to_cents(principal), periodic_rate(rate_percent, payment_frequency), total_payments)
+        payment = to_dollars(ledger.payment[0])
+        total_amount = to_dollars(ledger.total_paid)
+        total_interest = to_dollars(ledger.total_interest)
+        
+        # Amortization schedule (first 12 payments for display)
+        schedule = [
+            LoanPayment(
+                payment_number=i + 1,
+                payment_amount=to_dollars(ledger.payment[i]),
+                principal_payment=to_dollars(ledger.principal[i]),
+                interest_payment=to_dollars(ledger.interest[i]),
+                remaining_balance=to_dollars(ledger.balance[i])
+            )
+            for i in range(min(12, total_payments))
+        ]
         
         # Calculate summary statistics
         monthly_payment = payment if payment_frequency == 12 else payment * payment_frequency / 12
@@ -300,9 +327,12 @@ def calculate_401k(current_age, retirement_age, current_balance, annual_salary,
         retirement_age = int(retirement_age)
         current_balance = float(current_balance) if current_balance else 0
         annual_salary = float(annual_salary)
-        contribution_rate = float(contribution_rate) / 100
-        employer_match = float(employer_match) / 100
-        return_rate = float(return_rate) / 100
+        contribution_percent = float(contribution_rate)
+        match_percent = float(employer_match)
+        return_percent = float(return_rate)
+        contribution_rate = contribution_percent / 100
+        employer_match = match_percent / 100
+        return_rate = return_percent / 100
         
         # Validation
         if current_age >= retirement_age:
@@ -317,53 +347,49 @@ def calculate_401k(current_age, retirement_age, current_balance, annual_salary,
         if annual_salary < 1000 or annual_salary > 10000000:
             raise ValueError("Annual salary must be between $1,000 and $10,000,000")
         
-        # Calculate annual contributions
-        annual_contribution = annual_salary * contribution_rate
-        annual_employer_match = annual_salary * employer_match
-        annual_total_contribution = annual_contribution + annual_employer_match
+        # Calculate annual contributions in whole cents
+        salary_cents = to_cents(annual_salary)
+        personal_contrib = apply_rate(salary_cents, periodic_rate(contribution_percent))
+        employer_contrib = apply_rate(salary_cents, periodic_rate(match_percent))
+        # Contributions happen throughout the year, so on average half of
+        # them earn a full year's return: interest is on 2 * balance +
+        # contributions at half the rate, rounded once
+        half_return = periodic_rate(return_percent) / 2
         
         # Calculate year by year
         years_to_retirement = retirement_age - current_age
-        balance = current_balance
-        
-        total_personal_contributions = 0
-        total_employer_contributions = 0
-        total_investment_growth = 0
+        initial_cents = to_cents(current_balance)
+        balance = initial_cents
         
         yearly_breakdown = []
         
         for year in range(years_to_retirement):
             age = current_age + year + 1
             
-            # Add contributions
-            personal_contrib = annual_contribution
-            employer_contrib = annual_employer_match
-            
-            # Calculate interest on current balance plus contributions
-            # Assumes contributions happen throughout the year (average)
-            interest_earned = (balance + (personal_contrib + employer_contrib) / 2) * return_rate
-            
-            # Update balance
+            interest_earned = apply_rate(2 * balance + personal_contrib + employer_contrib, half_return)
             balance += personal_contrib + employer_contrib + interest_earned
             
-            # Track totals
-            total_personal_contributions += personal_contrib
-            total_employer_contributions += employer_contrib
-            total_investment_growth += interest_earned
-            
             # Store first 10 years for display
             if year < 10:
-                yearly_breakdown.append({
-                    'age': age,
-                    'contribution': personal_contrib,
-                    'employer': employer_contrib,
-                    'interest': interest_earned,
-                    'balance': balance
-                })
-        
-        # Calculate total investment growth
-        # (subtracting initial balance that wasn't from contributions)
-        total_investment_growth = balance - current_balance - total_personal_contributions - total_employer_contributions
+                yearly_breakdown.append(RetirementYear(
+                    age=age,
+                    contribution=to_dollars(personal_contrib),
+                    employer=to_dollars(employer_contrib),
+                    interest=to_dollars(interest_earned),
+                    balance=to_dollars(balance)
+                ))
+        
+        total_personal_contributions = personal_contrib * years_to_retirement
+        total_employer_contributions = employer_contrib * years_to_retirement
+        # Growth is whatever the balance gained beyond what was paid in
+        total_investment_growth = balance - initial_cents - total_personal_contributions - total_employer_contributions
+        
+        balance = to_dollars(balance)
+        total_personal_contributions = to_dollars(total_personal_contributions)
+        total_employer_contributions = to_dollars(total_employer_contributions)
+        total_investment_growth = to_dollars(total_investment_growth)
+        annual_contribution = to_dollars(personal_contrib)
+        annual_employer_match = to_dollars(employer_contrib)
         
         return {
             'total_at_retirement': round(balance, 2),
@@ -382,12 +408,103 @@ def calculate_401k(current_age, retirement_age, current_balance, annual_salary,
         
     except (ValueError, ZeroDivisionError, TypeError) as e:
         raise ValueError(f"Invalid calculation parameters: {str(e)}")
+
+
+def compare_roth_traditional(current_age: int, retirement_age: int, current_balance: float,
+                             annual_salary: float, contribution_rate: float, employer_match: float,
+                             return_rate: float, filing_status: str, state: str = '',
+                             salary_growth: Sequence[float] = (0.0,), inflation: float = INFLATION,
+                             retirement_years: int = RETIREMENT_YEARS) -> Dict[str, Any]:
+    """
+    Compare Roth and traditional 401k contributions after income tax.
+
+    Both put the same share of salary in. Traditional contributions lower
+    this year's tax and the saving is invested in a taxable account, whose
+    growth is taxed every year at that year's marginal rate; at retirement
+    the pre-tax balance is taxed as it is drawn down evenly over
+    ``retirement_years``, as the retiree's only income. Roth contributions
+    are taxed now and withdrawn tax-free. Employer contributions and the current balance are pre-tax in
+    both cases. Brackets are treated as inflation-indexed, so future
+    incomes are deflated by ``inflation`` (percent) before lookup.
+
+    ``salary_growth`` holds annual raise percentages; every path is
+    projected in the same pass and gets its own comparison.
+    """
+    years = retirement_age - current_age
+    if years <= 0:
+        raise ValueError("Retirement age must be greater than current age")
+    taxes = income_tax(filing_status, state)
+    rate = return_rate / 100
+    contribution_share = contribution_rate / 100
+    match_share = employer_match / 100
+    paths = [growth / 100 for growth in salary_growth]
+
+    # Per path: salary, elective and matched pre-tax balances, Roth balance, invested tax savings
+    salaries = [float(annual_salary)] * len(paths)
+    elective = [0.0] * len(paths)
+    matched = [0.0] * len(paths)
+    roth = [0.0] * len(paths)
+    savings = [0.0] * len(paths)
+    deflator = 1.0
+    for _ in range(years):
+        for i, salary in enumerate(salaries):
+            contribution = salary * contribution_share
+            # Tax saved by deducting the contribution, in today's brackets
+            real_salary = salary / deflator
+            taxable = real_salary - contribution / deflator
+            saved = (taxes.tax(real_salary) - taxes.tax(taxable)) * deflator
+            # Growth of the invested savings is taxed as it is earned
+            after_tax_rate = rate * (1 - taxes.marginal_rate(taxable))
+            elective[i] = elective[i] * (1 + rate) + contribution * (1 + rate / 2)
+            roth[i] = roth[i] * (1 + rate) + contribution * (1 + rate / 2)
+            matched[i] = matched[i] * (1 + rate) + salary * match_share * (1 + rate / 2)
+            savings[i] = savings[i] * (1 + after_tax_rate) + saved * (1 + after_tax_rate / 2)
+            salaries[i] = salary * (1 + paths[i])
+        deflator *= 1 + inflation / 100
+
+    initial = current_balance * (1 + rate) ** years
+
+    def after_withdrawal_tax(pre_tax):
+        # Level withdrawals in today's dollars, taxed at that income's effective rate
+        withdrawal = pre_tax / deflator / retirement_years
+        return pre_tax * (1 - taxes.effective_rate(withdrawal)), taxes.effective_rate(withdrawal)
+
+    comparisons = []
+    for i, growth in enumerate(salary_growth):
+        traditional_net, traditional_rate = after_withdrawal_tax(initial + elective[i] + matched[i])
+        roth_pre_tax_net, _ = after_withdrawal_tax(initial + matched[i])
+        traditional_total = traditional_net + savings[i]
+        roth_total = roth_pre_tax_net + roth[i]
+        comparisons.append({
+            'salary_growth': growth,
+            'final_salary': round(salaries[i] / (1 + paths[i]), 2),
+            'traditional_after_tax': round(traditional_total, 2),
+            'roth_after_tax': round(roth_total, 2),
+            'invested_tax_savings': round(savings[i], 2),
+            'retirement_tax_rate': round(traditional_rate * 100, 1),
+            'better': 'roth' if roth_total > traditional_total else 'traditional',
+            'difference': round(abs(roth_total - traditional_total), 2),
+        })
+
+    return {
+        'filing_status': filing_status,
+        'filing_status_name': FILING_STATUSES[filing_status],
+        'state': state,
+        'state_name': STATES.get(state, ''),
+        'marginal_rate': round(taxes.marginal_rate(annual_salary) * 100, 1),
+        'effective_rate': round(taxes.effective_rate(annual_salary) * 100, 1),
+        'inflation': inflation,
+        'retirement_years': retirement_years,
+        'paths': comparisons,
+    }
     
 
 # Add these functions to your utils.py file
 
-from datetime import date, timedelta
+from datetime import date
 from typing import Dict, Any
+from .pregnancy import pregnancy_summary
+from .metabolic import DEFAULT_FORMULA, FORMULAS, activity_breakdown, basal_metabolic_rate, to_metric
 
 def calculate_pregnancy(calc_method: str, month: int, day: int, year: int, cycle_length: int = 28) -> Dict[str, Any]:
     """
@@ -398,119 +515,27 @@ def calculate_pregnancy(calc_method: str, month: int, day: int, year: int, cycle
         month: Month (1-12)
         day: Day (1-31)
         year: Year
-        cycle_length: Average cycle length in days (default 28)
+        cycle_length: Average cycle length in days (default 28), used to
+            adjust conception and due date for the 'lmp' method
     
     Returns:
         Dictionary with pregnancy information
     """
     try:
         input_date = date(int(year), int(month), int(day))
-        today = date.today()
+        summary = pregnancy_summary(calc_method, input_date, int(cycle_length), date.today())
         
-        # Calculate due date based on method
-        if calc_method == 'lmp':
-            # Standard pregnancy: 280 days from LMP
-            due_date = input_date + timedelta(days=280)
-            conception_date = input_date + timedelta(days=14)  # Approximate
-            
-        elif calc_method == 'conception':
-            # 266 days from conception
-            due_date = input_date + timedelta(days=266)
-            conception_date = input_date
-            
-        elif calc_method == 'due_date':
-            # Working backwards from due date
-            due_date = input_date
-            conception_date = input_date - timedelta(days=266)
-        
-        else:
-            raise ValueError("Invalid calculation method")
-        
-        # Calculate current pregnancy stats
-        days_pregnant = (today - (due_date - timedelta(days=280))).days
-        
-        # Ensure we don't show negative days
-        if days_pregnant < 0:
-            days_pregnant = 0
-        
-        weeks_pregnant = days_pregnant // 7
-        current_week = min(weeks_pregnant, 40)  # Cap at 40 weeks
-        
-        # Days until due date
-        days_until_due = (due_date - today).days
-        
-        # Determine trimester
-        if current_week <= 13:
-            trimester = 1
-            trimester_name = "First Trimester"
-            trimester_info = "Your baby's organs and body systems are forming. You might experience morning sickness, fatigue, and tender breasts. This is a critical time for development."
-        elif current_week <= 27:
-            trimester = 2
-            trimester_name = "Second Trimester"
-            trimester_info = "You'll likely feel better now. Your baby is growing fast, and you'll probably start to feel movements. Your bump will become more noticeable."
-        else:
-            trimester = 3
-            trimester_name = "Third Trimester"
-            trimester_info = "Your baby is gaining weight and getting ready for birth. You might feel more uncomfortable as your due date approaches. Start preparing for your baby's arrival."
-        
-        # Key milestones
-        milestones = [
-            {
-                'week': 8,
-                'description': 'First ultrasound and heartbeat detection',
-                'date': (conception_date + timedelta(weeks=6)).strftime('%b %d, %Y')
-            },
-            {
-                'week': 12,
-                'description': 'End of first trimester - morning sickness often improves',
-                'date': (conception_date + timedelta(weeks=10)).strftime('%b %d, %Y')
-            },
-            {
-                'week': 20,
-                'description': 'Anatomy scan - you can usually find out the sex',
-                'date': (conception_date + timedelta(weeks=18)).strftime('%b %d, %Y')
-            },
-            {
-                'week': 24,
-                'description': 'Viability milestone - baby could survive with medical help',
-                'date': (conception_date + timedelta(weeks=22)).strftime('%b %d, %Y')
-            },
-            {
-                'week': 28,
-                'description': 'Third trimester begins',
-                'date': (conception_date + timedelta(weeks=26)).strftime('%b %d, %Y')
-            },
-            {
-                'week': 37,
-                'description': 'Full term - baby is considered ready for birth',
-                'date': (conception_date + timedelta(weeks=35)).strftime('%b %d, %Y')
-            }
-        ]
-        
-        # Only show upcoming milestones
-        upcoming_milestones = [m for m in milestones if m['week'] > current_week][:4]
-        
-        return {
-            'due_date': due_date,
-            'due_date_formatted': due_date.strftime('%B %d, %Y'),
-            'conception_date': conception_date.strftime('%B %d, %Y'),
-            'days_pregnant': max(0, days_pregnant),
-            'current_week': max(0, current_week),
-            'days_until_due': max(0, days_until_due),
-            'trimester': trimester,
-            'trimester_name': trimester_name,
-            'trimester_info': trimester_info,
-            'milestones': upcoming_milestones,
-            'weeks_remaining': max(0, 40 - current_week),
-            'percent_complete': min(100, round((current_week / 40) * 100, 1))
-        }
+        # The summary is cached and shared, so hand out a copy; the milestone
+        # rows are read-only
+        return dict(summary)
         
     except (ValueError, TypeError) as e:
         raise ValueError(f"Invalid date or calculation parameters: {str(e)}")
     
-def calculate_bmr(age, gender, height, height_unit, weight, weight_unit):
+def calculate_bmr(age, gender, height, height_unit, weight, weight_unit,
+                  formula=DEFAULT_FORMULA, body_fat=None):
     """
-    Calculate Basal Metabolic Rate using Mifflin-St Jeor Equation.
+    Calculate Basal Metabolic Rate (Mifflin-St Jeor Equation by default).
     
     Args:
         age: Age in years
@@ -519,70 +544,29 @@ def calculate_bmr(age, gender, height, height_unit, weight, weight_unit):
         height_unit: 'cm' or 'inches'
         weight: Weight value
         weight_unit: 'kg' or 'lbs'
+        formula: 'mifflin_st_jeor', 'harris_benedict', 'katch_mcardle'
+            or 'cunningham'
+        body_fat: Body fat percentage, required by Katch-McArdle and
+            Cunningham
     
     Returns:
         Dictionary with BMR and activity level calorie calculations
     """
     try:
         age = int(age)
-        height = float(height)
-        weight = float(weight)
-        
-        # Convert to metric
-        if height_unit == 'inches':
-            height = height * 2.54  # Convert to cm
-        
-        if weight_unit == 'lbs':
-            weight = weight * 0.453592  # Convert to kg
-        
-        # Mifflin-St Jeor Equation
-        if gender == 'male':
-            bmr = (10 * weight) + (6.25 * height) - (5 * age) + 5
-        else:  # female
-            bmr = (10 * weight) + (6.25 * height) - (5 * age) - 161
-        
-        # Calculate TDEE for different activity levels
-        activity_levels = [
-            {
-                'name': 'Sedentary',
-                'description': 'Little to no exercise, desk job',
-                'multiplier': 1.2,
-                'calories': round(bmr * 1.2, 0)
-            },
-            {
-                'name': 'Lightly Active',
-                'description': 'Light exercise 1-3 days/week',
-                'multiplier': 1.375,
-                'calories': round(bmr * 1.375, 0)
-            },
-            {
-                'name': 'Moderately Active',
-                'description': 'Moderate exercise 3-5 days/week',
-                'multiplier': 1.55,
-                'calories': round(bmr * 1.55, 0)
-            },
-            {
-                'name': 'Very Active',
-                'description': 'Hard exercise 6-7 days/week',
-                'multiplier': 1.725,
-                'calories': round(bmr * 1.725, 0)
-            },
-            {
-                'name': 'Extra Active',
-                'description': 'Very hard exercise, physical job',
-                'multiplier': 1.9,
-                'calories': round(bmr * 1.9, 0)
-            }
-        ]
+        height, weight = to_metric(float(height), height_unit, float(weight), weight_unit)
+        bmr = basal_metabolic_rate(formula, weight, height, age, gender, body_fat)
         
         return {
             'bmr': round(bmr, 1),
             'weekly_bmr': round(bmr * 7, 0),
-            'activity_levels': activity_levels,
+            'activity_levels': activity_breakdown(bmr),
             'age': age,
             'gender': gender,
             'height_cm': round(height, 1),
-            'weight_kg': round(weight, 1)
+            'weight_kg': round(weight, 1),
+            'formula': formula,
+            'formula_name': FORMULAS[formula][0]
         }
         
     except (ValueError, TypeError) as e:
@@ -591,6 +575,9 @@ def calculate_bmr(age, gender, height, height_unit, weight, weight_unit):
 from datetime import date
 from dateutil.relativedelta import relativedelta
 
+# Annual private mortgage insurance, as a share of the loan amount
+PMI_RATE = Fraction(1, 100)
+
 def calculate_mortgage(home_price, down_payment, interest_rate, loan_term, 
                        property_tax=0, home_insurance=0, hoa_fees=0):
     """
@@ -599,7 +586,7 @@ def calculate_mortgage(home_price, down_payment, interest_rate, loan_term,
     try:
         home_price = float(home_price)
         down_payment = float(down_payment)
-        interest_rate = float(interest_rate) / 100
+        rate_percent = float(interest_rate)
         loan_term = int(loan_term)
         property_tax = float(property_tax) if property_tax else 0
         home_insurance = float(home_insurance) if home_insurance else 0
@@ -609,54 +596,50 @@ def calculate_mortgage(home_price, down_payment, interest_rate, loan_term,
         loan_amount = home_price - down_payment
         down_payment_percent = (down_payment / home_price) * 100
         
-        # Calculate monthly payment (P&I)
-        monthly_rate = interest_rate / 12
+        # Calculate monthly payment (P&I) in whole cents
         num_payments = loan_term * 12
-        
-        if interest_rate == 0:
-            principal_interest = loan_amount / num_payments
-        else:
-            principal_interest = loan_amount * (monthly_rate * (1 + monthly_rate)**num_payments) / \
-                                ((1 + monthly_rate)**num_payments - 1)
+        loan_cents = to_cents(loan_amount)
+        ledger = amortize(loan_cents, periodic_rate(rate_percent, 12), num_payments)
+        principal_interest = ledger.payment[0]
         
         # Calculate PMI if down payment < 20%
         monthly_pmi = 0
         has_pmi = False
         if down_payment_percent < 20:
             has_pmi = True
-            annual_pmi = loan_amount * 0.01  # 1% of loan amount
-            monthly_pmi = annual_pmi / 12
+            annual_pmi = apply_rate(loan_cents, PMI_RATE)
+            monthly_pmi = div_half_even(annual_pmi, 12)
         
         # Monthly extras
-        monthly_tax = property_tax / 12 if property_tax else 0
-        monthly_insurance = home_insurance / 12 if home_insurance else 0
+        monthly_tax = div_half_even(to_cents(property_tax), 12)
+        monthly_insurance = div_half_even(to_cents(home_insurance), 12)
+        hoa_cents = to_cents(hoa_fees)
         
         # Total monthly payment
-        total_monthly = principal_interest + monthly_tax + monthly_insurance + monthly_pmi + hoa_fees
+        total_monthly = to_dollars(principal_interest + monthly_tax + monthly_insurance + monthly_pmi + hoa_cents)
         
         # Calculate totals
-        total_paid = principal_interest * num_payments
-        total_interest = total_paid - loan_amount
+        total_paid = to_dollars(ledger.total_paid)
+        total_interest = to_dollars(ledger.total_interest)
+        principal_interest = to_dollars(principal_interest)
+        monthly_tax = to_dollars(monthly_tax)
+        monthly_insurance = to_dollars(monthly_insurance)
+        monthly_pmi = to_dollars(monthly_pmi)
         
         # Payoff date
         payoff_date = date.today() + relativedelta(years=loan_term)
         
         # Amortization schedule (first 12 months)
-        schedule = []
-        balance = loan_amount
-        
-        for month in range(1, min(13, num_payments + 1)):
-            interest_payment = balance * monthly_rate
-            principal_payment = principal_interest - interest_payment
-            balance -= principal_payment
-            
-            schedule.append({
-                'month': month,
-                'payment': principal_interest,
-                'principal': principal_payment,
-                'interest': interest_payment,
-                'balance': balance
-            })
+        schedule = [
+            MortgagePayment(
+                month=month + 1,
+                payment=to_dollars(ledger.payment[month]),
+                principal=to_dollars(ledger.principal[month]),
+                interest=to_dollars(ledger.interest[month]),
+                balance=to_dollars(ledger.balance[month])
+            )
+            for month in range(min(12, num_payments))
+        ]
         
         return {
             'total_monthly': round(total_monthly, 2),
@@ -681,17 +664,19 @@ def calculate_mortgage(home_price, down_payment, interest_rate, loan_term,
 
 # Add these functions to your utils.py file
 
-def calculate_final_grade(assignments: list) -> dict:
+def calculate_final_grade(assignments: list, scale: Optional[str] = None) -> dict:
     """
     Calculate final grade from weighted assignments.
     
     Args:
         assignments: List of dicts with 'name', 'score', 'max_points', 'weight'
+        scale: Grade scale key used for the letter grade (default scale if None)
     
     Returns:
         Dictionary with grade calculations
     """
     try:
+        grade_scale = get_grade_scale(scale)
         total_weight = 0
         weighted_score = 0
         category_breakdown = {}
@@ -736,32 +721,7 @@ def calculate_final_grade(assignments: list) -> dict:
         final_grade = weighted_score
         
         # Determine letter grade
-        if final_grade >= 97:
-            letter = 'A+'
-        elif final_grade >= 93:
-            letter = 'A'
-        elif final_grade >= 90:
-            letter = 'A-'
-        elif final_grade >= 87:
-            letter = 'B+'
-        elif final_grade >= 83:
-            letter = 'B'
-        elif final_grade >= 80:
-            letter = 'B-'
-        elif final_grade >= 77:
-            letter = 'C+'
-        elif final_grade >= 73:
-            letter = 'C'
-        elif final_grade >= 70:
-            letter = 'C-'
-        elif final_grade >= 67:
-            letter = 'D+'
-        elif final_grade >= 63:
-            letter = 'D'
-        elif final_grade >= 60:
-            letter = 'D-'
-        else:
-            letter = 'F'
+        letter = grade_scale.letter_for(final_grade)
         
         # Calculate category percentages
         for category, data in category_breakdown.items():
@@ -774,7 +734,8 @@ def calculate_final_grade(assignments: list) -> dict:
             'total_weight': round(total_weight, 1),
             'category_breakdown': category_breakdown,
             'assignments': assignments,
-            'passing': final_grade >= 60
+            'passing': final_grade >= grade_scale.cutoffs[0],
+            'scale': grade_scale.key
         }
         
     except (ValueError, TypeError, ZeroDivisionError) as e:
@@ -833,24 +794,19 @@ def calculate_needed_grade(current_grade: float, desired_grade: float,
         raise ValueError(f"Invalid calculation parameters: {str(e)}")
 
 
-def calculate_semester_grade(course_grades: list) -> dict:
+def calculate_semester_grade(course_grades: list, scale: Optional[str] = None) -> dict:
     """
     Calculate semester GPA and average from multiple courses.
     
     Args:
         course_grades: List of dicts with 'course_name', 'grade', 'credits'
+        scale: Grade scale key for letter grade points (default scale if None)
     
     Returns:
         Dictionary with semester calculations
     """
     try:
-        grade_points_map = {
-            'A+': 4.0, 'A': 4.0, 'A-': 3.7,
-            'B+': 3.3, 'B': 3.0, 'B-': 2.7,
-            'C+': 2.3, 'C': 2.0, 'C-': 1.7,
-            'D+': 1.3, 'D': 1.0, 'D-': 0.7,
-            'F': 0.0
-        }
+        grade_scale = get_grade_scale(scale)
         
         total_points = 0
         total_credits = 0
@@ -864,16 +820,16 @@ def calculate_semester_grade(course_grades: list) -> dict:
             if isinstance(course['grade'], str):
                 # Letter grade
                 grade = course['grade'].upper()
-                if grade not in grade_points_map:
+                points = grade_scale.grade_point(grade, None)
+                if points is None:
                     raise ValueError(f"Invalid letter grade: {grade}")
-                points = grade_points_map[grade]
-                percentage = points * 25  # Approximate percentage
+                percentage = grade_scale.percentage_for_points(points)  # Approximate percentage
             else:
                 # Percentage grade
                 percentage = float(course['grade'])
                 if percentage < 0 or percentage > 100:
                     raise ValueError("Grade percentage must be between 0 and 100")
-                points = percentage / 25  # Convert to 4.0 scale
+                points = grade_scale.points_for_percentage(percentage)  # Convert to grade points
             
             total_points += points * credits
             total_credits += credits
@@ -886,12 +842,13 @@ def calculate_semester_grade(course_grades: list) -> dict:
         semester_gpa = total_points / total_credits
         average_percentage = total_percentage / course_count
         
-        # Determine semester standing
-        if semester_gpa >= 3.7:
+        # Determine semester standing (thresholds are on the 4.0 scale)
+        normalized_gpa = semester_gpa * 4.0 / grade_scale.top
+        if normalized_gpa >= 3.7:
             standing = 'Dean\'s List'
-        elif semester_gpa >= 3.0:
+        elif normalized_gpa >= 3.0:
             standing = 'Good Standing'
-        elif semester_gpa >= 2.0:
+        elif normalized_gpa >= 2.0:
             standing = 'Satisfactory'
         else:
             standing = 'Academic Warning'
@@ -902,7 +859,8 @@ def calculate_semester_grade(course_grades: list) -> dict:
             'total_credits': total_credits,
             'course_count': course_count,
             'standing': standing,
-            'courses': course_grades
+            'courses': course_grades,
+            'scale': grade_scale.key
         }
         
     except (ValueError, TypeError) as e:
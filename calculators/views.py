@@ -1,16 +1,32 @@
-from django.shortcuts import render, get_object_or_404
+from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib import messages
-from django.http import JsonResponse
 from django.views.decorators.http import require_http_methods
 from django.db.models import Count, Avg
 from datetime import date, datetime
+import hashlib
 import uuid
 import json
-from .forms import AgeCalculatorForm, BMICalculatorForm, GPAFormSet
+from .forms import AgeCalculatorForm, GPAFormSet
 from .models import Calculator, HomepageContent, Feature, Testimonial, SEOContent
-from .utils import calculate_age_detailed, get_bmi_category_info, calculate_gpa
+from .utils import calculate_age_detailed, calculate_business_days, get_bmi_category_info, calculate_gpa
+from .conditional import content_version, dated_page, versioned_page
+from .grading import available_scales, get_grade_scale, scale_tables
+from .static_export import static_export
+from .prefetch import is_prefetch
+from .tiered_cache import remember
+from .serialization import JsonResponse
+from .registry import REGISTRY, RELATED
+from . import schemas
+from .schemas import SchemaError, parse_formset, parse_rows, request_data, submitted_rows
+from .bmi import body_mass_index, roster_columns, evaluate_batch as evaluate_bmi_batch
 
+@static_export
+@versioned_page
 def home(request):
+    context = _page_data('home', _home_context)
+    return render(request, 'calculators/home.html', context)
+
+def _home_context():
     # Get dynamic homepage content
     homepage_content = HomepageContent.objects.filter(is_active=True).first()
     if not homepage_content:
@@ -20,23 +36,23 @@ def home(request):
             show_features=True
         )
 
-    # Get active calculators
-    calculators = Calculator.objects.filter(is_active=True).order_by('order', 'name')
-    featured_calculators = calculators.filter(featured=True)[:3]
+    # Get active calculators (evaluated, so the context can be cached)
+    calculators = list(Calculator.objects.filter(is_active=True).order_by('order', 'name'))
+    featured_calculators = [calc for calc in calculators if calc.featured][:3]
     
     # Get features if enabled
     features = []
     if homepage_content.show_features:
-        features = Feature.objects.filter(is_active=True).order_by('order')
+        features = list(Feature.objects.filter(is_active=True).order_by('order'))
 
     # Get testimonials
     testimonials = []
     if homepage_content.show_testimonials:
-        testimonials = Testimonial.objects.filter(is_active=True)[:3]
+        testimonials = list(Testimonial.objects.filter(is_active=True)[:3])
 
-    # Calculate statistics
-    total_calculators = calculators.count()
-    total_calculations = sum(calc.usage_count for calc in calculators)
+    # Calculate statistics (no usage counts: saving those doesn't re-export
+    # or re-version the page, so they would go stale)
+    total_calculators = len(calculators)
     
     # Get SEO content
     seo_content = SEOContent.objects.filter(page_name='homepage', is_active=True).first()
@@ -50,7 +66,6 @@ def home(request):
         'seo_content': seo_content,
         'statistics': {
             'total_calculators': total_calculators,
-            'total_calculations': total_calculations,
             'user_satisfaction': 98,
             'years_active': 1
         },
@@ -59,194 +74,183 @@ def home(request):
         'meta_keywords': (seo_content.keywords if seo_content else homepage_content.meta_keywords) or 'calculator, online calculator, free tools'
     }
     
-    return render(request, 'calculators/home.html', context)
+    return context
 
 def calculator_detail(request, slug):
     calculator = get_object_or_404(Calculator, slug=slug, is_active=True)
     
-    # Increment usage count
-    calculator.increment_usage()
-    
-    # Route to specific calculator logic
-    if slug == 'age-calculator':
-        return age_calculator(request, calculator)
-    elif slug == 'bmi-calculator':
-        return bmi_calculator(request, calculator)
-    elif slug == 'gpa-calculator':
-        return gpa_calculator(request, calculator)
-    else:
-        # Generic calculator handler (for future calculators)
-        return render(request, 'calculators/generic_calculator.html', {
-            'calculator': calculator,
-            'page_title': calculator.meta_title or f"{calculator.name} - Calculator Hub",
-            'meta_description': calculator.meta_description or calculator.description
-        })
+    # Count visits, not speculative prefetches of the page. This runs before
+    # the calculator's view answers If-None-Match, so 304s are counted too.
+    if not is_prefetch(request):
+        calculator.increment_usage()
+    
+    # Route to the calculator's own view
+    view = CALCULATOR_VIEWS.get(slug, _generic_calculator)
+    return view(request, calculator)
+
+@versioned_page
+def _generic_calculator(request, calculator):
+    """Generic calculator handler (for future calculators)"""
+    return render(request, 'calculators/generic_calculator.html', {
+        'calculator': calculator,
+        'page_title': calculator.meta_title or f"{calculator.name} - Calculator Hub",
+        'meta_description': calculator.meta_description or calculator.description
+    })
+
+def _calculator(slug):
+    """The calculator's database row, or the registry's unsaved stand-in."""
+    calculator = _page_data(f'calculator:{slug}', lambda: Calculator.objects.filter(slug=slug).first())
+    return calculator or REGISTRY[slug].fallback()
+
+def _page_data(name, compute):
+    """
+    ``compute()`` cached for the current content version, so saves in the
+    admin show up at once while a hot page's data is built once at a time.
+    """
+    timeout, stale = getattr(settings, 'CALCULATOR_CACHE_SECONDS', (300, 3600))
+    return remember(f'calculators:page:{name}:{content_version()}', compute, timeout, stale)
 
+def _memoized(function, **arguments):
+    """
+    ``function(**arguments)`` cached by its arguments for the day (a few
+    results depend on today's date). Callers get their own copy.
+    """
+    timeout, stale = getattr(settings, 'RESULT_CACHE_SECONDS', (3600, 3600))
+    digest = hashlib.md5(repr(sorted(arguments.items())).encode()).hexdigest()
+    key = f'calculators:result:{function.__name__}:{digest}:{date.today().isoformat()}'
+    return remember(key, lambda: function(**arguments), timeout, stale)
+
+def _business_days(values, data):
+    """Working-day figures between the two dates of an age result, or None outside the calendar's range."""
+    options = schemas.BUSINESS_DAYS.parse(data)
+    try:
+        return calculate_business_days(values['birth_date'], values['target_date'],
+                                       options['region'], options['business_days'])
+    except ValueError:
+        return None
+
+@dated_page
 def age_calculator(request, calculator=None):
-    if not calculator:
-        try:
-            calculator = Calculator.objects.get(slug='age-calculator')
-        except Calculator.DoesNotExist:
-            calculator = Calculator(
-                name="Age Calculator",
-                description="Calculate your exact age in years, months, and days",
-                slug="age-calculator"
-            )
+    calculator = calculator or _calculator('age-calculator')
     
     # Handle AJAX requests for calculation
     if request.method == 'POST' and request.headers.get('X-Requested-With') == 'XMLHttpRequest':
         try:
-            birth_month = int(request.POST.get('birth_month'))
-            birth_day = int(request.POST.get('birth_day'))
-            birth_year = int(request.POST.get('birth_year'))
-            
-            target_month = int(request.POST.get('target_month'))
-            target_day = int(request.POST.get('target_day'))
-            target_year = int(request.POST.get('target_year'))
-            
-            birth_date = date(birth_year, birth_month, birth_day)
-            target_date = date(target_year, target_month, target_day)
-            
-            if birth_date > target_date:
+            data = request_data(request)
+            values = schemas.AGE.parse(data)
+            if values['birth_date'] > values['target_date']:
                 return JsonResponse({'error': 'Birth date cannot be after target date'})
             
-            result = calculate_age_between_dates(birth_date, target_date)
+            result = calculate_age_between_dates(values['birth_date'], values['target_date'])
+            result['business'] = _business_days(values, data)
             return JsonResponse({'success': True, 'result': result})
             
         except (ValueError, TypeError) as e:
-            return JsonResponse({'error': 'Invalid date values'})
+            return JsonResponse({'error': 'Invalid date values', 'errors': getattr(e, 'errors', {})})
     
-    # Get related calculators
-    related_calculators = Calculator.objects.filter(
-        is_active=True
-    ).exclude(slug='age-calculator')[:3]
+    related_calculators = RELATED['age-calculator']
     
     context = {
         'calculator': calculator,
         'related_calculators': related_calculators,
-        'page_title': getattr(calculator, 'meta_title', None) or f"{calculator.name} - Calculator Hub",
-        'meta_description': getattr(calculator, 'meta_description', None) or calculator.description,
-        'meta_keywords': getattr(calculator, 'meta_keywords', None) or 'age calculator, calculate age, birth date'
+        **REGISTRY['age-calculator'].seo_context(calculator)
     }
     
-    return render(request, 'calculators/age_calculator.html', context)
+    return render(request, REGISTRY['age-calculator'].template, context)
 
-def bmi_calculator(request, calculator=None):
-    if not calculator:
-        try:
-            calculator = Calculator.objects.get(slug='bmi-calculator')
-        except Calculator.DoesNotExist:
-            calculator = Calculator(
-                name="BMI Calculator",
-                description="Calculate your Body Mass Index and health category",
-                slug="bmi-calculator"
-            )
+@versioned_page
+def bmi_calculator(request, calculator=None, permalink=None, extra_context=None):
+    calculator = calculator or _calculator('bmi-calculator')
     
-    form = BMICalculatorForm()
     result = None
     
-    if request.method == 'POST':
-        form = BMICalculatorForm(request.POST)
-        if form.is_valid():
-            weight = form.cleaned_data['weight']
-            height = form.cleaned_data['height']
-            unit_system = form.cleaned_data['unit_system']
-            
-            # Convert to metric if needed
-            if unit_system == 'imperial':
-                weight = weight * 0.453592  # lbs to kg
-                height = height * 2.54  # inches to cm
-            
-            # Convert height from cm to meters
-            height_m = height / 100
+    if request.method == 'POST' or permalink:
+        try:
+            values = schemas.BMI.parse(permalink or request_data(request))
+        except SchemaError as e:
+            if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                return JsonResponse({'error': 'Invalid input values. Please check your entries.', 'errors': e.errors})
+            messages.error(request, 'Invalid input values. Please check your entries.')
+        else:
+            weight = values['weight']
+            height = values['height']
+            unit_system = values['unit_system']
             
-            # Calculate BMI
-            bmi = weight / (height_m ** 2)
+            bmi = body_mass_index(weight, height, unit_system)
             category_info = get_bmi_category_info(bmi)
             
             result = {
                 'bmi': round(bmi, 1),
-                'weight': form.cleaned_data['weight'],
-                'height': form.cleaned_data['height'],
+                'weight': weight,
+                'height': height,
                 'unit_system': unit_system,
                 **category_info
             }
             
             if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
                 return JsonResponse({'success': True, 'result': result})
+            if not permalink:
+                return redirect(permalink_url('bmi-calculator', values))
     
-    # Get related calculators
-    related_calculators = Calculator.objects.filter(
-        is_active=True
-    ).exclude(slug='bmi-calculator')[:3]
+    related_calculators = RELATED['bmi-calculator']
     
     context = {
         'calculator': calculator,
-        'form': form,
         'result': result,
+        'permalink': bool(permalink),
         'related_calculators': related_calculators,
-        'page_title': getattr(calculator, 'meta_title', None) or f"{calculator.name} - Calculator Hub",
-        'meta_description': getattr(calculator, 'meta_description', None) or calculator.description,
-        'meta_keywords': getattr(calculator, 'meta_keywords', None) or 'BMI calculator, body mass index, health calculator'
+        **REGISTRY['bmi-calculator'].seo_context(calculator)
     }
+    context.update(extra_context or {})
     
-    return render(request, 'calculators/bmi_calculator.html', context)
+    return render(request, REGISTRY['bmi-calculator'].template, context)
 
+@versioned_page
 def gpa_calculator(request, calculator=None):
-    if not calculator:
-        try:
-            calculator = Calculator.objects.get(slug='gpa-calculator')
-        except Calculator.DoesNotExist:
-            calculator = Calculator(
-                name="GPA Calculator",
-                description="Calculate your Grade Point Average from your grades and credit hours",
-                slug="gpa-calculator"
-            )
+    calculator = calculator or _calculator('gpa-calculator')
     
     session_id = request.session.get('gpa_session_id')
     if not session_id:
         session_id = str(uuid.uuid4())
         request.session['gpa_session_id'] = session_id
     
-    formset = GPAFormSet()
     result = None
     
     if request.method == 'POST':
-        formset = GPAFormSet(request.POST)
-        if formset.is_valid():
-            entries = []
-            for form in formset:
-                if form.cleaned_data and not form.cleaned_data.get('DELETE', False):
-                    entries.append({
-                        'subject_name': form.cleaned_data['subject_name'],
-                        'grade': form.cleaned_data['grade'],
-                        'credit_hours': form.cleaned_data['credit_hours']
-                    })
-            
+        try:
+            entries = parse_formset(schemas.GPA_ROW, request.POST)
+        except SchemaError as e:
+            entries = None
+            if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                return JsonResponse({'error': 'Invalid input values. Please check your entries.', 'errors': e.errors})
+            messages.error(request, 'Invalid input values. Please check your entries.')
+        
+        if entries is not None:
             if entries:
-                result = calculate_gpa(entries)
+                try:
+                    result = calculate_gpa(entries, scale=request.POST.get('grade_scale'))
+                except ValueError as e:
+                    if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                        return JsonResponse({'error': str(e)})
+                    messages.error(request, str(e))
                 
-                if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                if result and request.headers.get('X-Requested-With') == 'XMLHttpRequest':
                     return JsonResponse({'success': True, 'result': result})
             else:
                 messages.error(request, 'Please add at least one subject.')
     
-    # Get related calculators
-    related_calculators = Calculator.objects.filter(
-        is_active=True
-    ).exclude(slug='gpa-calculator')[:3]
+    related_calculators = RELATED['gpa-calculator']
     
     context = {
         'calculator': calculator,
-        'formset': formset,
         'result': result,
+        'grade_scales': scale_tables(),
+        'default_grade_scale': get_grade_scale().key,
         'related_calculators': related_calculators,
-        'page_title': getattr(calculator, 'meta_title', None) or f"{calculator.name} - Calculator Hub",
-        'meta_description': getattr(calculator, 'meta_description', None) or calculator.description,
-        'meta_keywords': getattr(calculator, 'meta_keywords', None) or 'GPA calculator, grade point average, academic calculator'
+        **REGISTRY['gpa-calculator'].seo_context(calculator)
     }
     
-    return render(request, 'calculators/gpa_calculator.html', context)
+    return render(request, REGISTRY['gpa-calculator'].template, context)
 
 @require_http_methods(["POST"])
 def add_gpa_row(request):
@@ -264,124 +268,80 @@ def add_gpa_row(request):
 
 from .utils import calculate_loan_payment, get_loan_recommendations
 
-def loan_calculator(request, calculator=None):
-    if not calculator:
-        try:
-            calculator = Calculator.objects.get(slug='loan-calculator')
-        except Calculator.DoesNotExist:
-            calculator = Calculator(
-                name="Loan Calculator",
-                description="Calculate monthly payments, total interest, and amortization schedule for any loan",
-                slug="loan-calculator"
-            )
+@versioned_page
+def loan_calculator(request, calculator=None, permalink=None, extra_context=None):
+    calculator = calculator or _calculator('loan-calculator')
     
     result = None
     form_data = None
     
-    if request.method == 'POST':
+    if request.method == 'POST' or permalink:
         try:
-            loan_amount = request.POST.get('loan_amount')
-            interest_rate = request.POST.get('interest_rate')
-            loan_term = request.POST.get('loan_term')
-            payment_frequency = request.POST.get('payment_frequency', '12')
+            data = permalink or request_data(request)
+            arguments = schemas.LOAN.arguments(data)
+            result = _memoized(calculate_loan_payment, **arguments)
             
-            if loan_amount and interest_rate and loan_term:
-                result = calculate_loan_payment(
-                    principal=loan_amount,
-                    annual_rate=interest_rate,
-                    years=loan_term,
-                    payment_frequency=payment_frequency
-                )
-                
-                # Add loan recommendations
-                result['recommendations'] = get_loan_recommendations(float(loan_amount))
-                
-                # Store form data
-                form_data = {
-                    'loan_amount': loan_amount,
-                    'interest_rate': interest_rate,
-                    'loan_term': loan_term,
-                    'payment_frequency': payment_frequency
-                }
-                
-                if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-                    return JsonResponse({'success': True, 'result': result})
+            # Add loan recommendations
+            result['recommendations'] = get_loan_recommendations(arguments['principal'])
+            
+            # Store form data
+            form_data = schemas.LOAN.submitted(data)
+            
+            if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                return JsonResponse({'success': True, 'result': result})
+            if not permalink:
+                return redirect(permalink_url('loan-calculator', form_data))
                     
         except (ValueError, TypeError) as e:
             if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-                return JsonResponse({'error': 'Invalid input values. Please check your entries.'})
+                return JsonResponse({'error': 'Invalid input values. Please check your entries.', 'errors': getattr(e, 'errors', {})})
             messages.error(request, 'Invalid input values. Please check your entries.')
     
-    # Get related calculators
-    related_calculators = Calculator.objects.filter(
-        is_active=True
-    ).exclude(slug='loan-calculator')[:3]
+    related_calculators = RELATED['loan-calculator']
     
     context = {
         'calculator': calculator,
         'result': result,
         'form_data': form_data,
+        'permalink': bool(permalink),
         'related_calculators': related_calculators,
-        'page_title': 'Loan Calculator - Calculate Monthly Payments & Interest | Free Online Tool',
-        'meta_description': 'Free loan calculator to calculate monthly payments, total interest, and amortization schedule. Compare loan terms, rates, and payment frequencies. Get instant results for personal loans, mortgages, auto loans, and more.',
-        'meta_keywords': 'loan calculator, monthly payment calculator, mortgage calculator, auto loan calculator, personal loan calculator, loan payment, interest calculator, amortization schedule, loan comparison, debt calculator'
+        **REGISTRY['loan-calculator'].seo_context(calculator)
     }
+    context.update(extra_context or {})
     
-    return render(request, 'calculators/loan_calculator.html', context)
+    return render(request, REGISTRY['loan-calculator'].template, context)
 
 
+@static_export
+@versioned_page
 def percentage_calculator(request, calculator=None):
-    if not calculator:
-        try:
-            calculator = Calculator.objects.get(slug='percentage-calculator')
-        except Calculator.DoesNotExist:
-            calculator = Calculator(
-                name="Percentage Calculator",
-                description="Calculate percentages, percentage changes, discounts, tips, and more",
-                slug="percentage-calculator"
-            )
+    calculator = calculator or _calculator('percentage-calculator')
     
-    # Get related calculators
-    related_calculators = Calculator.objects.filter(
-        is_active=True
-    ).exclude(slug='percentage-calculator')[:3]
+    related_calculators = RELATED['percentage-calculator']
     
     context = {
         'calculator': calculator,
         'related_calculators': related_calculators,
-        'page_title': 'Percentage Calculator - Calculate Percentages, Discounts, Tips & More | Free Online Tool',
-        'meta_description': 'Free percentage calculator to calculate percentages, percentage changes, discounts, markups, tips, and more. Instant results with detailed breakdowns. Works on all devices.',
-        'meta_keywords': 'percentage calculator, calculate percentage, percentage change calculator, discount calculator, tip calculator, markup calculator, percentage of a number, how to calculate percentage, percentage increase calculator, percentage decrease calculator, online percentage calculator, free percentage calculator'
+        **REGISTRY['percentage-calculator'].seo_context(calculator)
     }
     
-    return render(request, 'calculators/percentage_calculator.html', context)
+    return render(request, REGISTRY['percentage-calculator'].template, context)
 
 
+@static_export
+@versioned_page
 def calorie_calculator(request, calculator=None):
-    if not calculator:
-        try:
-            calculator = Calculator.objects.get(slug='calorie-calculator')
-        except Calculator.DoesNotExist:
-            calculator = Calculator(
-                name="Calorie Calculator",
-                description="Calculate your daily calorie needs for healthy weight management",
-                slug="calorie-calculator"
-            )
+    calculator = calculator or _calculator('calorie-calculator')
     
-    # Get related calculators
-    related_calculators = Calculator.objects.filter(
-        is_active=True
-    ).exclude(slug='calorie-calculator')[:3]
+    related_calculators = RELATED['calorie-calculator']
     
     context = {
         'calculator': calculator,
         'related_calculators': related_calculators,
-        'page_title': 'Calorie Calculator - Calculate Daily Calorie Needs for Weight Management | Free Tool',
-        'meta_description': 'Free calorie calculator to determine your daily calorie requirements based on age, gender, height, weight, and activity level. Get personalized recommendations for healthy weight management, weight loss, and weight gain goals.',
-        'meta_keywords': 'calorie calculator, daily calorie needs, BMR calculator, TDEE calculator, weight loss calculator, weight management, calories per day, metabolic rate calculator, calorie requirements, healthy weight loss, calorie deficit calculator, maintenance calories'
+        **REGISTRY['calorie-calculator'].seo_context(calculator)
     }
     
-    return render(request, 'calculators/calorie_calculator.html', context)
+    return render(request, REGISTRY['calorie-calculator'].template, context)
 
 
 # Add these imports at the top
@@ -391,6 +351,8 @@ from django.contrib import messages
 
 # Add these view functions to your existing views.py
 
+@static_export
+@versioned_page
 def about_us(request):
     context = {
         'page_title': 'About Us - myCalculator.us | Free Online Calculators',
@@ -399,6 +361,7 @@ def about_us(request):
     }
     return render(request, 'calculators/about_us.html', context)
 
+@versioned_page
 def contact_us(request):
     if request.method == 'POST':
         name = request.POST.get('name')
@@ -430,6 +393,8 @@ def contact_us(request):
     }
     return render(request, 'calculators/contact_us.html', context)
 
+@static_export
+@versioned_page
 def privacy_policy(request):
     context = {
         'page_title': 'Privacy Policy - myCalculator.us | Your Privacy Matters',
@@ -438,6 +403,8 @@ def privacy_policy(request):
     }
     return render(request, 'calculators/privacy_policy.html', context)
 
+@static_export
+@versioned_page
 def terms_conditions(request):
     context = {
         'page_title': 'Terms and Conditions - myCalculator.us | Terms of Use',
@@ -446,6 +413,8 @@ def terms_conditions(request):
     }
     return render(request, 'calculators/terms_conditions.html', context)
 
+@static_export
+@versioned_page
 def sitemap_page(request):
     # Get all active calculators for sitemap
     calculators = Calculator.objects.filter(is_active=True).order_by('name')
@@ -465,7 +434,12 @@ from datetime import datetime
 
 def sitemap_xml(request):
     """Generate dynamic XML sitemap"""
-    
+    # Depends only on the site's address and today's date
+    key = f'calculators:sitemap:{request.scheme}://{request.get_host()}:{date.today().isoformat()}'
+    xml_content = remember(key, lambda: _sitemap_xml(request), timeout=3600, stale=600)
+    return HttpResponse(xml_content, content_type='application/xml')
+
+def _sitemap_xml(request):
     # Static pages with their priorities and change frequencies
     static_pages = [
         {
@@ -506,88 +480,15 @@ def sitemap_xml(request):
         }
     ]
     
-    # Calculator pages with high priority
-    # Calculator pages with high priority
+    # Calculator pages, in registry order
     calculator_pages = [
         {
-            'loc': request.build_absolute_uri(reverse('calculators:age_calculator')),
-            'changefreq': 'weekly',
-            'priority': '0.9',
-            'lastmod': datetime.now().strftime('%Y-%m-%d')
-        },
-        {
-            'loc': request.build_absolute_uri(reverse('calculators:bmi_calculator')),
-            'changefreq': 'weekly',
-            'priority': '0.9',
-            'lastmod': datetime.now().strftime('%Y-%m-%d')
-        },
-        {
-            'loc': request.build_absolute_uri(reverse('calculators:bmr_calculator')),
-            'changefreq': 'weekly',
-            'priority': '0.9',
-            'lastmod': datetime.now().strftime('%Y-%m-%d')
-        },
-        {
-            'loc': request.build_absolute_uri(reverse('calculators:gpa_calculator')),
-            'changefreq': 'weekly',
-            'priority': '0.9',
-            'lastmod': datetime.now().strftime('%Y-%m-%d')
-        },
-        {
-            'loc': request.build_absolute_uri(reverse('calculators:grade_calculator')),
-            'changefreq': 'weekly',
-            'priority': '0.9',
-            'lastmod': datetime.now().strftime('%Y-%m-%d')
-        },
-        {
-            'loc': request.build_absolute_uri(reverse('calculators:loan_calculator')),
-            'changefreq': 'weekly',
-            'priority': '0.9',
-            'lastmod': datetime.now().strftime('%Y-%m-%d')
-        },
-        {
-            'loc': request.build_absolute_uri(reverse('calculators:mortgage_calculator')),
-            'changefreq': 'weekly',
-            'priority': '0.9',
-            'lastmod': datetime.now().strftime('%Y-%m-%d')
-        },
-        {
-            'loc': request.build_absolute_uri(reverse('calculators:percentage_calculator')),
-            'changefreq': 'weekly',
-            'priority': '0.9',
-            'lastmod': datetime.now().strftime('%Y-%m-%d')
-        },
-        {
-            'loc': request.build_absolute_uri(reverse('calculators:calorie_calculator')),
-            'changefreq': 'weekly',
-            'priority': '0.9',
-            'lastmod': datetime.now().strftime('%Y-%m-%d')
-        },
-        {
-            'loc': request.build_absolute_uri(reverse('calculators:date_of_birth_calculator')),
-            'changefreq': 'weekly',
-            'priority': '0.9',
-            'lastmod': datetime.now().strftime('%Y-%m-%d')
-        },
-        {
-            'loc': request.build_absolute_uri(reverse('calculators:pregnancy_calculator')),
-            'changefreq': 'weekly',
-            'priority': '0.9',
-            'lastmod': datetime.now().strftime('%Y-%m-%d')
-        },
-        {
-            'loc': request.build_absolute_uri(reverse('calculators:401k_calculator')),
-            'changefreq': 'weekly',
-            'priority': '0.9',
-            'lastmod': datetime.now().strftime('%Y-%m-%d')
-        },
-        {
-            'loc': request.build_absolute_uri(reverse('calculators:citation_generator')),
-            'changefreq': 'weekly',
-            'priority': '0.9',
+            'loc': request.build_absolute_uri(spec.get_page_url()),
+            'changefreq': spec.changefreq,
+            'priority': spec.priority,
             'lastmod': datetime.now().strftime('%Y-%m-%d')
         }
-        
+        for spec in REGISTRY.values()
     ]
     
     # Combine all pages
@@ -600,9 +501,11 @@ def sitemap_xml(request):
         'domain': request.get_host()
     }
     
-    xml_content = template.render(context)
-    return HttpResponse(xml_content, content_type='application/xml')
+    return template.render(context)
 
+from .landing import SITEMAP_INDEX, landing_root
+
+@static_export
 def robots_txt(request):
     """Generate robots.txt file"""
     lines = [
@@ -611,6 +514,11 @@ def robots_txt(request):
         "",
         "# Sitemap location",
         f"Sitemap: {request.build_absolute_uri('/sitemap.xml')}",
+    ]
+    # Pre-rendered landing pages have their own sitemap index once built
+    if (landing_root() / SITEMAP_INDEX).exists():
+        lines.append(f"Sitemap: {request.build_absolute_uri('/' + SITEMAP_INDEX)}")
+    lines += [
         "",
         "# Crawl-delay for politeness",
         "Crawl-delay: 1",
@@ -621,363 +529,297 @@ def robots_txt(request):
         "Disallow: /api/",
         "",
         "# Allow all calculator pages",
-        "Allow: /age-calculator/",
-        "Allow: /bmi-calculator/",
-        "Allow: /gpa-calculator/",
-        "Allow: /loan-calculator/",
-        "Allow: /percentage-calculator/",
-        "Allow: /calorie-calculator/",
     ]
+    lines += [f"Allow: {spec.get_page_url()}" for spec in REGISTRY.values()]
     
     return HttpResponse("\n".join(lines), content_type="text/plain")
 
 
 # Add this view function to your views.py file
 
-from .utils import calculate_401k
+from .taxes import FILING_STATUSES, STATES
+from .utils import calculate_401k, compare_roth_traditional
 
-def k401_calculator(request, calculator=None):
+
+def _salary_growth_paths(growth):
+    """Raise scenarios for the tax comparison: flat, the user's estimate and two points faster."""
+    return tuple(sorted({0.0, growth, growth + 2}))
+
+@versioned_page
+def k401_calculator(request, calculator=None, permalink=None, extra_context=None):
     """401k retirement calculator view"""
-    if not calculator:
-        try:
-            calculator = Calculator.objects.get(slug='401k-calculator')
-        except Calculator.DoesNotExist:
-            calculator = Calculator(
-                name="401k Calculator",
-                description="Calculate your retirement savings with compound interest and employer matching",
-                slug="401k-calculator"
-            )
+    calculator = calculator or _calculator('401k-calculator')
     
     result = None
     form_data = None
     
-    if request.method == 'POST':
+    if request.method == 'POST' or permalink:
         try:
-            current_age = request.POST.get('current_age')
-            retirement_age = request.POST.get('retirement_age')
-            current_balance = request.POST.get('current_balance', '0')
-            annual_salary = request.POST.get('annual_salary')
-            contribution_rate = request.POST.get('contribution_rate')
-            employer_match = request.POST.get('employer_match', '0')
-            return_rate = request.POST.get('return_rate')
-            
-            if current_age and retirement_age and annual_salary and contribution_rate and return_rate:
-                result = calculate_401k(
-                    current_age=current_age,
-                    retirement_age=retirement_age,
-                    current_balance=current_balance,
-                    annual_salary=annual_salary,
-                    contribution_rate=contribution_rate,
-                    employer_match=employer_match,
-                    return_rate=return_rate
+            data = permalink or request_data(request)
+            arguments = schemas.K401.arguments(data)
+            tax_options = schemas.K401_TAX.parse(data)
+            result = _memoized(calculate_401k, **arguments)
+            if tax_options['filing_status']:
+                result['tax_comparison'] = _memoized(
+                    compare_roth_traditional,
+                    **arguments,
+                    filing_status=tax_options['filing_status'],
+                    state=tax_options['state'],
+                    salary_growth=_salary_growth_paths(tax_options['salary_growth']),
                 )
-                
-                # Store form data for display
-                form_data = {
-                    'current_age': current_age,
-                    'retirement_age': retirement_age,
-                    'current_balance': current_balance,
-                    'annual_salary': annual_salary,
-                    'contribution_rate': contribution_rate,
-                    'employer_match': employer_match,
-                    'return_rate': return_rate
-                }
-                
-                if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-                    return JsonResponse({'success': True, 'result': result})
+            
+            # Store form data for display
+            form_data = {**schemas.K401.submitted(data), **schemas.K401_TAX.submitted(data)}
+            
+            if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                return JsonResponse({'success': True, 'result': result})
+            if not permalink:
+                return redirect(permalink_url('401k-calculator', form_data))
                     
         except (ValueError, TypeError) as e:
             if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-                return JsonResponse({'error': 'Invalid input values. Please check your entries.'})
+                return JsonResponse({'error': 'Invalid input values. Please check your entries.', 'errors': getattr(e, 'errors', {})})
             messages.error(request, 'Invalid input values. Please check your entries.')
     
-    # Get related calculators
-    related_calculators = Calculator.objects.filter(
-        is_active=True
-    ).exclude(slug='401k-calculator')[:3]
+    related_calculators = RELATED['401k-calculator']
     
     context = {
         'calculator': calculator,
         'result': result,
         'form_data': form_data,
+        'permalink': bool(permalink),
         'related_calculators': related_calculators,
-        'page_title': '401k Calculator - Plan Your Retirement Savings | Free Retirement Tool',
-        'meta_description': 'Free 401k retirement calculator. See how much you could save by retirement with contributions, employer matching, and compound interest. Plan your financial future today.',
-        'meta_keywords': '401k calculator, retirement calculator, retirement savings calculator, 401k planner, retirement planning tool, compound interest calculator, employer match calculator, retirement nest egg, 401k projection, retirement fund calculator'
+        'filing_statuses': FILING_STATUSES,
+        'states': STATES,
+        **REGISTRY['401k-calculator'].seo_context(calculator)
     }
+    context.update(extra_context or {})
     
-    return render(request, 'calculators/401k_calculator.html', context)
+    return render(request, REGISTRY['401k-calculator'].template, context)
 
 # Add this view function to your views.py file
 
 from .utils import calculate_pregnancy
 
+@versioned_page
 def pregnancy_calculator(request, calculator=None):
     """Pregnancy due date calculator view"""
-    if not calculator:
-        try:
-            calculator = Calculator.objects.get(slug='pregnancy-calculator')
-        except Calculator.DoesNotExist:
-            calculator = Calculator(
-                name="Pregnancy Calculator",
-                description="Calculate your pregnancy due date and track your pregnancy week by week",
-                slug="pregnancy-calculator"
-            )
+    calculator = calculator or _calculator('pregnancy-calculator')
     
     result = None
     form_data = None
     
     if request.method == 'POST':
         try:
-            calc_method = request.POST.get('calc_method', 'lmp')
-            cycle_length = int(request.POST.get('cycle_length', 28))
+            data = request_data(request)
+            calc_method = data.get('calc_method') or 'lmp'
+            schema = schemas.PREGNANCY_FORMS.get(calc_method)
+            if schema is None:
+                raise SchemaError({'calc_method': 'is not a valid calculation method'})
             
-            # Get date based on calculation method
-            if calc_method == 'lmp':
-                month = request.POST.get('lmp_month')
-                day = request.POST.get('lmp_day')
-                year = request.POST.get('lmp_year')
-            elif calc_method == 'conception':
-                month = request.POST.get('con_month')
-                day = request.POST.get('con_day')
-                year = request.POST.get('con_year')
-            elif calc_method == 'due_date':
-                month = request.POST.get('due_month')
-                day = request.POST.get('due_day')
-                year = request.POST.get('due_year')
-            else:
-                raise ValueError("Invalid calculation method")
+            # Date fields are named after the method: lmp_month, con_month, due_month
+            values = schema.parse(data)
+            result = calculate_pregnancy(
+                calc_method=calc_method,
+                month=values['date'].month,
+                day=values['date'].day,
+                year=values['date'].year,
+                cycle_length=values['cycle_length']
+            )
             
-            if month and day and year:
-                result = calculate_pregnancy(
-                    calc_method=calc_method,
-                    month=month,
-                    day=day,
-                    year=year,
-                    cycle_length=cycle_length
-                )
-                
-                # Store form data for display
-                form_data = {
-                    'calc_method': calc_method,
-                    'cycle_length': cycle_length
-                }
-                
-                if calc_method == 'lmp':
-                    form_data.update({
-                        'lmp_month': month,
-                        'lmp_day': day,
-                        'lmp_year': year
-                    })
-                elif calc_method == 'conception':
-                    form_data.update({
-                        'con_month': month,
-                        'con_day': day,
-                        'con_year': year
-                    })
-                elif calc_method == 'due_date':
-                    form_data.update({
-                        'due_month': month,
-                        'due_day': day,
-                        'due_year': year
-                    })
-                
-                if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-                    return JsonResponse({'success': True, 'result': result})
+            # Store form data for display
+            form_data = schema.submitted(data)
+            
+            if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                return JsonResponse({'success': True, 'result': result})
                     
         except (ValueError, TypeError) as e:
             if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-                return JsonResponse({'error': 'Invalid input values. Please check your dates.'})
+                return JsonResponse({'error': 'Invalid input values. Please check your dates.', 'errors': getattr(e, 'errors', {})})
             messages.error(request, 'Invalid input values. Please check your dates.')
     
-    # Get related calculators
-    related_calculators = Calculator.objects.filter(
-        is_active=True
-    ).exclude(slug='pregnancy-calculator')[:3]
+    related_calculators = RELATED['pregnancy-calculator']
     
     context = {
         'calculator': calculator,
         'result': result,
         'form_data': form_data,
         'related_calculators': related_calculators,
-        'page_title': 'Pregnancy Calculator - Due Date & Week Calculator | Free Pregnancy Tool',
-        'meta_description': 'Free pregnancy calculator and pregnancy due date calculator. Calculate your baby\'s due date, track pregnancy week by week, understand calculation of pregnancy, and learn about early signs of pregnancy. Accurate and easy to use.',
-        'meta_keywords': 'pregnancy calculator, pregnancy due date calculator, due date calculator, calculation of pregnancy, early signs of pregnancy, pregnancy week calculator, how to calculate pregnancy, pregnancy tracker, conception calculator, trimester calculator, pregnancy symptoms'
+        **REGISTRY['pregnancy-calculator'].seo_context(calculator)
     }
     
-    return render(request, 'calculators/pregnancy_calculator.html', context)
+    return render(request, REGISTRY['pregnancy-calculator'].template, context)
+
+
+from .pregnancy import pregnancy_timeline
+
+@require_http_methods(["GET"])
+def pregnancy_timeline_api(request):
+    """
+    Week-by-week pregnancy timeline as JSON.
+    
+    Query parameters: method ('lmp', 'conception' or 'due_date'), date
+    (YYYY-MM-DD) and optional cycle_length (default 28).
+    """
+    try:
+        timeline = pregnancy_timeline(
+            calc_method=request.GET.get('method', 'lmp'),
+            input_date=date.fromisoformat(request.GET.get('date', '')),
+            cycle_length=int(request.GET.get('cycle_length', 28))
+        )
+        return JsonResponse({'success': True, 'result': timeline})
+    except (ValueError, TypeError) as e:
+        return JsonResponse({'error': f'Invalid input values: {e}'}, status=400)
 
 
 
+@static_export
+@versioned_page
 def citation_generator(request, calculator=None):
     """Citation generator view - client-side only"""
-    if not calculator:
-        try:
-            calculator = Calculator.objects.get(slug='citation-generator')
-        except Calculator.DoesNotExist:
-            calculator = Calculator(
-                name="Citation Generator",
-                description="Generate citations in APA, MLA, or Chicago format",
-                slug="citation-generator"
-            )
+    calculator = calculator or _calculator('citation-generator')
     
-    # Get related calculators
-    related_calculators = Calculator.objects.filter(
-        is_active=True
-    ).exclude(slug='citation-generator')[:3]
+    related_calculators = RELATED['citation-generator']
     
     context = {
         'calculator': calculator,
         'related_calculators': related_calculators,
-        'page_title': 'Citation Generator - Create APA, MLA, Chicago Citations | Free Tool',
-        'meta_description': 'Free citation generator for APA, MLA, and Chicago styles. Create properly formatted citations for books, websites, journals, magazines, and videos. Copy and paste ready citations for your academic papers.',
-        'meta_keywords': 'citation generator, APA citation, MLA citation, Chicago citation, bibliography generator, reference generator, cite sources, academic citation tool, format citations, works cited generator'
+        **REGISTRY['citation-generator'].seo_context(calculator)
     }
     
-    return render(request, 'calculators/citation_generator.html', context)
+    return render(request, REGISTRY['citation-generator'].template, context)
 
 
 from .utils import calculate_bmr
+from .metabolic import evaluate_batch, person_columns
 
-def bmr_calculator(request, calculator=None):
+@versioned_page
+def bmr_calculator(request, calculator=None, permalink=None, extra_context=None):
     """BMR calculator view"""
-    if not calculator:
-        try:
-            calculator = Calculator.objects.get(slug='bmr-calculator')
-        except Calculator.DoesNotExist:
-            calculator = Calculator(
-                name="BMR Calculator",
-                description="Calculate your Basal Metabolic Rate and daily calorie needs",
-                slug="bmr-calculator"
-            )
+    calculator = calculator or _calculator('bmr-calculator')
     
     result = None
     form_data = None
     
-    if request.method == 'POST':
+    if request.method == 'POST' or permalink:
         try:
-            age = request.POST.get('age')
-            gender = request.POST.get('gender')
-            height = request.POST.get('height')
-            height_unit = request.POST.get('height_unit')
-            weight = request.POST.get('weight')
-            weight_unit = request.POST.get('weight_unit')
+            data = permalink or request_data(request)
+            result = calculate_bmr(**schemas.BMR.arguments(data))
             
-            if age and gender and height and weight:
-                result = calculate_bmr(
-                    age=age,
-                    gender=gender,
-                    height=height,
-                    height_unit=height_unit,
-                    weight=weight,
-                    weight_unit=weight_unit
-                )
-                
-                form_data = {
-                    'age': age,
-                    'gender': gender,
-                    'height': height,
-                    'height_unit': height_unit,
-                    'weight': weight,
-                    'weight_unit': weight_unit
-                }
-                
-                if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-                    return JsonResponse({'success': True, 'result': result})
+            form_data = schemas.BMR.submitted(data)
+            
+            if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                return JsonResponse({'success': True, 'result': result})
+            if not permalink:
+                return redirect(permalink_url('bmr-calculator', form_data))
                     
         except (ValueError, TypeError) as e:
             if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-                return JsonResponse({'error': 'Invalid input values. Please check your entries.'})
+                return JsonResponse({'error': 'Invalid input values. Please check your entries.', 'errors': getattr(e, 'errors', {})})
             messages.error(request, 'Invalid input values. Please check your entries.')
     
-    related_calculators = Calculator.objects.filter(
-        is_active=True
-    ).exclude(slug='bmr-calculator')[:3]
+    related_calculators = RELATED['bmr-calculator']
     
     context = {
         'calculator': calculator,
         'result': result,
         'form_data': form_data,
+        'permalink': bool(permalink),
         'related_calculators': related_calculators,
-        'page_title': 'BMR Calculator - Calculate Your Basal Metabolic Rate | Free Tool',
-        'meta_description': 'Free BMR calculator - calculate your Basal Metabolic Rate and find out how many calories your body burns at rest. Get your TDEE for different activity levels.',
-        'meta_keywords': 'BMR calculator, basal metabolic rate, metabolism calculator, calories burned at rest, TDEE calculator, daily calorie needs, metabolic rate calculator, resting energy expenditure'
+        **REGISTRY['bmr-calculator'].seo_context(calculator)
     }
+    context.update(extra_context or {})
     
-    return render(request, 'calculators/bmr_calculator.html', context)
+    return render(request, REGISTRY['bmr-calculator'].template, context)
+
+
+@require_http_methods(["POST"])
+def metabolic_api(request):
+    """
+    Batch BMR/TDEE evaluation as JSON.
+    
+    Expects a JSON body with a ``people`` list (age, gender, height, weight,
+    optional height_unit, weight_unit and body_fat) and an optional
+    ``formulas`` list. Every requested formula is evaluated at every activity
+    level for all people in one call.
+    """
+    try:
+        payload = json.loads(request.body)
+        people = payload.get('people')
+        if not people or not isinstance(people, list):
+            raise ValueError("Please provide a list of people")
+        
+        result = evaluate_batch(formulas=payload.get('formulas'), **person_columns(people))
+        return JsonResponse({'success': True, 'result': result})
+        
+    except (ValueError, TypeError, KeyError, AttributeError) as e:
+        return JsonResponse({'error': f'Invalid input values: {e}'}, status=400)
+
+
+@require_http_methods(["POST"])
+def bmi_roster_api(request):
+    """
+    Batch BMI scoring as JSON.
+    
+    Expects a JSON body with a ``people`` list (weight, height, optional
+    unit_system, and for children sex plus age_months or age in years).
+    Children are scored against CDC BMI-for-age percentiles, adults get the
+    standard BMI categories. People who cannot be scored get a per-row error.
+    """
+    try:
+        payload = json.loads(request.body)
+        people = payload.get('people')
+        if not people or not isinstance(people, list):
+            raise ValueError("Please provide a list of people")
+        
+        result = evaluate_bmi_batch(**roster_columns(people))
+        return JsonResponse({'success': True, 'result': result})
+        
+    except (ValueError, TypeError, KeyError, AttributeError) as e:
+        return JsonResponse({'error': f'Invalid input values: {e}'}, status=400)
 
 
 from .utils import calculate_mortgage
 
-def mortgage_calculator(request, calculator=None):
+# Results show a payoff date counted from today
+@dated_page
+def mortgage_calculator(request, calculator=None, permalink=None, extra_context=None):
     """Mortgage calculator view"""
-    if not calculator:
-        try:
-            calculator = Calculator.objects.get(slug='mortgage-calculator')
-        except Calculator.DoesNotExist:
-            calculator = Calculator(
-                name="Mortgage Calculator",
-                description="Calculate monthly mortgage payments with taxes, insurance, and PMI",
-                slug="mortgage-calculator"
-            )
+    calculator = calculator or _calculator('mortgage-calculator')
     
     result = None
     form_data = None
     
-    if request.method == 'POST':
+    if request.method == 'POST' or permalink:
         try:
-            home_price = request.POST.get('home_price')
-            down_payment = request.POST.get('down_payment')
-            interest_rate = request.POST.get('interest_rate')
-            loan_term = request.POST.get('loan_term')
-            property_tax = request.POST.get('property_tax', 0)
-            home_insurance = request.POST.get('home_insurance', 0)
-            hoa_fees = request.POST.get('hoa_fees', 0)
+            data = permalink or request_data(request)
+            result = _memoized(calculate_mortgage, **schemas.MORTGAGE.arguments(data))
             
-            if home_price and down_payment and interest_rate and loan_term:
-                result = calculate_mortgage(
-                    home_price=home_price,
-                    down_payment=down_payment,
-                    interest_rate=interest_rate,
-                    loan_term=loan_term,
-                    property_tax=property_tax,
-                    home_insurance=home_insurance,
-                    hoa_fees=hoa_fees
-                )
-                
-                form_data = {
-                    'home_price': home_price,
-                    'down_payment': down_payment,
-                    'interest_rate': interest_rate,
-                    'loan_term': loan_term,
-                    'property_tax': property_tax,
-                    'home_insurance': home_insurance,
-                    'hoa_fees': hoa_fees
-                }
-                
-                if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-                    return JsonResponse({'success': True, 'result': result})
+            form_data = schemas.MORTGAGE.submitted(data)
+            
+            if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                return JsonResponse({'success': True, 'result': result})
+            if not permalink:
+                return redirect(permalink_url('mortgage-calculator', form_data))
                     
         except (ValueError, TypeError) as e:
             if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-                return JsonResponse({'error': str(e)})
+                return JsonResponse({'error': str(e), 'errors': getattr(e, 'errors', {})})
             messages.error(request, 'Invalid input values.')
     
-    related_calculators = Calculator.objects.filter(
-        is_active=True
-    ).exclude(slug='mortgage-calculator')[:3]
+    related_calculators = RELATED['mortgage-calculator']
     
     context = {
         'calculator': calculator,
         'result': result,
         'form_data': form_data,
+        'permalink': bool(permalink),
         'related_calculators': related_calculators,
-        'page_title': 'Mortgage Calculator - Calculate Monthly Payments & Payoff Schedule | Free Tool',
-        'meta_description': 'Free mortgage calculator and mortgage payment calculator. Calculate your monthly mortgage payment including property taxes, insurance, PMI, and HOA fees. See your mortgage payoff schedule and total interest. Simple mortgage rate calculator for home buyers.',
-        'meta_keywords': 'mortgage calculator, mortgage payment calculator, mortgage loan calculator, mortgage payoff calculator, mortgage rate calculator, simple mortgage calculator, home loan calculator, monthly mortgage payment, calculate mortgage, mortgage estimator'
+        **REGISTRY['mortgage-calculator'].seo_context(calculator)
     }
+    context.update(extra_context or {})
     
-    return render(request, 'calculators/mortgage_calculator.html', context)
+    return render(request, REGISTRY['mortgage-calculator'].template, context)
 
 
 
@@ -985,82 +827,47 @@ def mortgage_calculator(request, calculator=None):
 
 from .utils import calculate_final_grade, calculate_needed_grade, calculate_semester_grade
 
+@versioned_page
 def grade_calculator(request, calculator=None):
     """Grade calculator view with multiple calculation modes"""
-    if not calculator:
-        try:
-            calculator = Calculator.objects.get(slug='grade-calculator')
-        except Calculator.DoesNotExist:
-            calculator = Calculator(
-                name="Grade Calculator",
-                description="Calculate final grades, test grades, semester averages, and weighted grades",
-                slug="grade-calculator"
-            )
+    calculator = calculator or _calculator('grade-calculator')
     
     result = None
     form_data = None
-    calc_mode = request.POST.get('calc_mode', 'final') if request.method == 'POST' else 'final'
+    calc_mode = 'final'
     
     if request.method == 'POST':
         try:
+            data = request_data(request)
+            options = schemas.GRADE_OPTIONS.parse(data)
+            calc_mode = options['calc_mode']
+            grade_scale = options['grade_scale']
+            
             if calc_mode == 'final':
                 # Final Grade Calculator
-                assignments = []
-                assignment_count = int(request.POST.get('assignment_count', 0))
-                
-                for i in range(assignment_count):
-                    name = request.POST.get(f'assignment_name_{i}')
-                    score = request.POST.get(f'assignment_score_{i}')
-                    max_points = request.POST.get(f'assignment_max_{i}')
-                    weight = request.POST.get(f'assignment_weight_{i}')
-                    category = request.POST.get(f'assignment_category_{i}', 'Assignment')
-                    
-                    if name and score and max_points and weight:
-                        assignments.append({
-                            'name': name,
-                            'score': score,
-                            'max_points': max_points,
-                            'weight': weight,
-                            'category': category
-                        })
+                rows = submitted_rows(data, 'assignments', 'assignment', schemas.ASSIGNMENT_COLUMNS)
+                assignments = parse_rows(schemas.ASSIGNMENT_ROW, rows, 'assignments')
                 
                 if assignments:
-                    result = calculate_final_grade(assignments)
+                    result = calculate_final_grade(assignments, scale=grade_scale)
                     result['mode'] = 'final'
                     
             elif calc_mode == 'needed':
                 # Grade Needed Calculator
-                current_grade = request.POST.get('current_grade')
-                desired_grade = request.POST.get('desired_grade')
-                final_weight = request.POST.get('final_weight')
-                
-                if current_grade and desired_grade and final_weight:
-                    result = calculate_needed_grade(current_grade, desired_grade, final_weight)
-                    result['mode'] = 'needed'
+                result = calculate_needed_grade(**schemas.GRADE_NEEDED.parse(data))
+                result['mode'] = 'needed'
                     
             elif calc_mode == 'semester':
                 # Semester Grade Calculator
-                courses = []
-                course_count = int(request.POST.get('course_count', 0))
-                
-                for i in range(course_count):
-                    course_name = request.POST.get(f'course_name_{i}')
-                    grade = request.POST.get(f'course_grade_{i}')
-                    credits = request.POST.get(f'course_credits_{i}')
-                    
-                    if course_name and grade and credits:
-                        courses.append({
-                            'course_name': course_name,
-                            'grade': grade,
-                            'credits': credits
-                        })
+                rows = submitted_rows(data, 'courses', 'course', schemas.COURSE_COLUMNS)
+                courses = parse_rows(schemas.COURSE_ROW, rows, 'courses')
                 
                 if courses:
-                    result = calculate_semester_grade(courses)
+                    result = calculate_semester_grade(courses, scale=grade_scale)
                     result['mode'] = 'semester'
             
             # Store form data
-            form_data = dict(request.POST)
+            form_data = dict(data)
             form_data['calc_mode'] = calc_mode
             
             if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
@@ -1068,42 +875,33 @@ def grade_calculator(request, calculator=None):
                 
         except (ValueError, TypeError) as e:
             if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-                return JsonResponse({'error': str(e)})
+                return JsonResponse({'error': str(e), 'errors': getattr(e, 'errors', {})})
             messages.error(request, str(e))
     
-    # Get related calculators
-    related_calculators = Calculator.objects.filter(
-        is_active=True
-    ).exclude(slug='grade-calculator')[:3]
+    related_calculators = RELATED['grade-calculator']
     
     context = {
         'calculator': calculator,
         'result': result,
         'form_data': form_data,
         'calc_mode': calc_mode,
+        'grade_scales': available_scales(),
+        'default_grade_scale': get_grade_scale().key,
         'related_calculators': related_calculators,
-        'page_title': 'Grade Calculator - Final Grade, Test Grade & Semester Average Calculator | Free Tool',
-        'meta_description': 'Free grade calculator to calculate final grades, test grades, semester averages, and weighted grades. Find out what you need on your final exam. Calculate GPA and track your academic progress with our grade average calculator.',
-        'meta_keywords': 'grade calculator, final grade calculator, test grade calculator, semester grade calculator, grade average calculator, weighted grade calculator, what grade do I need calculator, calculate my grade, final exam grade calculator, college grade calculator'
+        **REGISTRY['grade-calculator'].seo_context(calculator)
     }
     
-    return render(request, 'calculators/grade_calculator.html', context)
+    return render(request, REGISTRY['grade-calculator'].template, context)
 
 # Add this function to your views.py file
 
+from .business_days import REGIONS as BUSINESS_REGIONS
 from .utils import calculate_age_between_dates
 
+@dated_page
 def date_of_birth_calculator(request, calculator=None):
     """Date of birth calculator view"""
-    if not calculator:
-        try:
-            calculator = Calculator.objects.get(slug='date-of-birth-calculator')
-        except Calculator.DoesNotExist:
-            calculator = Calculator(
-                name="Date of Birth Calculator",
-                description="Calculate your exact age from date of birth instantly",
-                slug="date-of-birth-calculator"
-            )
+    calculator = calculator or _calculator('date-of-birth-calculator')
     
     result = None
     form_data = {}
@@ -1118,44 +916,30 @@ def date_of_birth_calculator(request, calculator=None):
     
     if request.method == 'POST':
         try:
-            birth_month = int(request.POST.get('birth_month'))
-            birth_day = int(request.POST.get('birth_day'))
-            birth_year = int(request.POST.get('birth_year'))
-            
-            target_month = int(request.POST.get('target_month'))
-            target_day = int(request.POST.get('target_day'))
-            target_year = int(request.POST.get('target_year'))
-            
-            birth_date = date(birth_year, birth_month, birth_day)
-            target_date = date(target_year, target_month, target_day)
+            data = request_data(request)
+            values = schemas.AGE.parse(data)
+            birth_date = values['birth_date']
+            target_date = values['target_date']
             
             if birth_date > target_date:
                 messages.error(request, 'Birth date cannot be after the target date.')
             else:
                 result = calculate_age_between_dates(birth_date, target_date)
+                result['business'] = _business_days(values, data)
                 
                 # Store form data for display
-                form_data = {
-                    'birth_month': str(birth_month),
-                    'birth_day': str(birth_day),
-                    'birth_year': str(birth_year),
-                    'target_month': str(target_month),
-                    'target_day': str(target_day),
-                    'target_year': str(target_year)
-                }
+                form_data = {field.name: str(values[field.name]) for field in schemas.AGE.fields}
+                form_data.update(schemas.BUSINESS_DAYS.submitted(data))
                 
                 if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
                     return JsonResponse({'success': True, 'result': result})
                     
         except (ValueError, TypeError) as e:
             if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-                return JsonResponse({'error': 'Invalid date values. Please check your entries.'})
+                return JsonResponse({'error': 'Invalid date values. Please check your entries.', 'errors': getattr(e, 'errors', {})})
             messages.error(request, 'Invalid date values. Please check your entries.')
     
-    # Get related calculators
-    related_calculators = Calculator.objects.filter(
-        is_active=True
-    ).exclude(slug='date-of-birth-calculator')[:3]
+    related_calculators = RELATED['date-of-birth-calculator']
     
     context = {
         'calculator': calculator,
@@ -1164,10 +948,338 @@ def date_of_birth_calculator(request, calculator=None):
         'year_range': year_range,
         'target_year_range': target_year_range,
         'today': today,
+        'regions': {code: name for code, (name, _) in BUSINESS_REGIONS.items()},
         'related_calculators': related_calculators,
-        'page_title': 'Date of Birth Calculator - Calculate Age from Date of Birth | Free Age Calculator Online',
-        'meta_description': 'Free date of birth calculator to calculate age from date of birth instantly. Age calculator online by date of birth shows your exact age in years, months, days, hours, and seconds. Calculate age based on date of birth accurately.',
-        'meta_keywords': 'date of birth calculator, calculate age from date of birth, age calculator online by date of birth, calculate age based on date of birth, age from dob, birth date age calculator, exact age calculator, age calculator by date of birth, how to calculate age from date of birth, find age from date of birth'
+        **REGISTRY['date-of-birth-calculator'].seo_context(calculator)
     }
     
-    return render(request, 'calculators/date_of_birth_calculator.html', context)
\ No newline at end of file
+    return render(request, REGISTRY['date-of-birth-calculator'].template, context)
+
+
+# Bulk age calculation for uploaded CSV rosters
+
+import csv
+import codecs
+from django.http import StreamingHttpResponse
+from .utils import calculate_ages_batch
+
+BULK_AGE_RESULT_COLUMNS = ['age_years', 'age_months', 'age_days', 'total_days', 'error']
+
+
+class _Echo:
+    """File-like object that hands each written CSV line straight back."""
+
+    def write(self, value):
+        return value
+
+
+def _parse_roster_date(value):
+    value = (value or '').strip()
+    if not value:
+        return None
+    return date.fromisoformat(value)
+
+
+def _annotate_age_roster(header, reader):
+    """Yield the header and every roster row annotated with its computed age."""
+    columns = [column.strip().lower() for column in header]
+    birth_index = columns.index('birth_date')
+    target_index = columns.index('target_date') if 'target_date' in columns else None
+    yield header + BULK_AGE_RESULT_COLUMNS
+    
+    # The batch calculator yields one age per pair, so it is fed the current
+    # row's dates and nothing but that row is ever held in memory.
+    pair = None
+    
+    def current_pair():
+        while True:
+            yield pair
+    
+    ages = calculate_ages_batch(current_pair())
+    for row in reader:
+        # Short rows get blank cells so the result columns line up
+        row = row + [''] * (len(header) - len(row))
+        try:
+            birth_date = _parse_roster_date(row[birth_index])
+            if birth_date is None:
+                raise ValueError
+            target_date = _parse_roster_date(row[target_index]) if target_index is not None else None
+        except ValueError:
+            yield row + ['', '', '', '', 'Invalid date']
+            continue
+        pair = (birth_date, target_date)
+        age = next(ages)
+        if age is None:
+            yield row + ['', '', '', '', 'Birth date cannot be after target date']
+        else:
+            yield row + list(age) + ['']
+
+
+def _is_utf8(upload):
+    """Whether the whole upload decodes as UTF-8, checked a chunk at a time."""
+    decoder = codecs.getincrementaldecoder('utf-8-sig')()
+    try:
+        for chunk in upload.chunks():
+            decoder.decode(chunk)
+        decoder.decode(b'', final=True)
+    except UnicodeDecodeError:
+        return False
+    finally:
+        upload.seek(0)
+    return True
+
+
+@require_http_methods(["POST"])
+def bulk_age_calculator(request):
+    """
+    Bulk age calculation from an uploaded CSV roster.
+    
+    The upload needs a header row with a birth_date column and may include a
+    target_date column (ISO YYYY-MM-DD; blank means today). Every other column
+    is passed through untouched and the annotated CSV is streamed back row by
+    row, so memory stays flat regardless of roster size.
+    """
+    upload = request.FILES.get('file')
+    if upload is None:
+        return JsonResponse({'error': 'Please upload a CSV file.'}, status=400)
+    
+    # Checked up front: a decoding error once streaming has started would
+    # only cut the download short
+    if not _is_utf8(upload):
+        return JsonResponse({'error': 'The CSV must be UTF-8 encoded.'}, status=400)
+    
+    reader = csv.reader(codecs.iterdecode(upload, 'utf-8-sig'))
+    header = next(reader, None)
+    if not header or 'birth_date' not in [column.strip().lower() for column in header]:
+        return JsonResponse({'error': 'The CSV must have a header row with a birth_date column.'}, status=400)
+    
+    writer = csv.writer(_Echo())
+    response = StreamingHttpResponse(
+        (writer.writerow(row) for row in _annotate_age_roster(header, reader)),
+        content_type='text/csv'
+    )
+    response['Content-Disposition'] = 'attachment; filename="ages.csv"'
+    return response
+
+
+# Gradebook batch mode for the grade calculator
+
+from .gradebook import calculate_gradebook, parse_gradebook_csv
+
+@require_http_methods(["POST"])
+def gradebook_calculator(request):
+    """
+    Compute final grades, letters and GPAs for a whole class in one request.
+    
+    Accepts either an uploaded CSV gradebook (``file``) or a JSON body with
+    ``assignments`` and ``students`` lists, and returns every student's result
+    together with class-level distributions. The grade scale is picked with
+    ``grade_scale`` (form field) or ``scale`` (JSON key).
+    """
+    try:
+        upload = request.FILES.get('file')
+        if upload is not None:
+            gradebook = parse_gradebook_csv(codecs.iterdecode(upload, 'utf-8-sig'))
+            gradebook['scale'] = request.POST.get('grade_scale')
+        elif request.content_type == 'application/json':
+            gradebook = json.loads(request.body)
+            if not isinstance(gradebook, dict):
+                raise ValueError("Expected a JSON object")
+        else:
+            return JsonResponse({'error': 'Please upload a CSV gradebook or send JSON.'}, status=400)
+        
+        result = calculate_gradebook(
+            gradebook.get('assignments') or [],
+            gradebook.get('students') or [],
+            scale=gradebook.get('scale')
+        )
+        return JsonResponse({'success': True, 'result': result})
+        
+    except (ValueError, UnicodeDecodeError) as e:
+        return JsonResponse({'error': str(e)}, status=400)
+
+
+# Shareable GET permalinks for calculator results
+from django.http import HttpResponsePermanentRedirect
+from django.utils.cache import patch_cache_control
+from django.utils.http import urlencode
+from .permalinks import canonical_params, permalink_form_data, permalink_url
+
+PERMALINK_VIEWS = {
+    'mortgage-calculator': mortgage_calculator,
+    'loan-calculator': loan_calculator,
+    '401k-calculator': k401_calculator,
+    'bmi-calculator': bmi_calculator,
+    'bmr-calculator': bmr_calculator,
+}
+
+
+def _permalink_response(request, slug):
+    """
+    Render a calculator result from its canonical GET URL.
+    
+    Non-canonical queries (form field names, unnormalized numbers, default
+    values) get a permanent redirect to the canonical URL so each result is
+    cached once. Successful results are public; their ETag comes from the
+    versioned_page decorator on the calculator view.
+    """
+    try:
+        params = canonical_params(slug, request.GET)
+    except ValueError:
+        messages.error(request, 'Invalid input values. Please check your entries.')
+        return redirect(f"calculators:{slug.replace('-', '_')}")
+    
+    query = urlencode(params)
+    if request.META.get('QUERY_STRING', '') != query:
+        return HttpResponsePermanentRedirect(f"{request.path}?{query}")
+    
+    # The view answers If-None-Match itself from its version-based ETag
+    response = PERMALINK_VIEWS[slug](request, permalink=permalink_form_data(slug, params))
+    
+    # Error messages make the page request-specific
+    if response.status_code not in (200, 304) or list(messages.get_messages(request)):
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+    
+    patch_cache_control(response, public=True, max_age=settings.PERMALINK_CACHE_SECONDS)
+    return response
+
+
+@require_http_methods(["GET", "HEAD"])
+def mortgage_permalink(request):
+    return _permalink_response(request, 'mortgage-calculator')
+
+
+@require_http_methods(["GET", "HEAD"])
+def loan_permalink(request):
+    return _permalink_response(request, 'loan-calculator')
+
+
+@require_http_methods(["GET", "HEAD"])
+def k401_permalink(request):
+    return _permalink_response(request, '401k-calculator')
+
+
+@require_http_methods(["GET", "HEAD"])
+def bmi_permalink(request):
+    return _permalink_response(request, 'bmi-calculator')
+
+
+@require_http_methods(["GET", "HEAD"])
+def bmr_permalink(request):
+    return _permalink_response(request, 'bmr-calculator')
+
+
+# CSRF token for statically served pages
+from django.middleware.csrf import get_token
+from django.views.decorators.cache import never_cache
+from django.views.decorators.csrf import ensure_csrf_cookie
+
+
+@never_cache
+@ensure_csrf_cookie
+@require_http_methods(["GET"])
+def csrf_token(request):
+    """
+    Hand out a CSRF token (and cookie) to pages served as static files.
+    
+    Exported pages carry no token of their own; their scripts call this
+    before POSTing to the JSON endpoints.
+    """
+    return JsonResponse({'csrfToken': get_token(request)})
+
+
+# Service worker, served from the site root so its scope covers every page
+from django.views.decorators.http import condition
+from .service_worker import SERVICE_WORKER_TEMPLATE, UNCACHED_PREFIXES, cache_version, precache_urls, service_worker_etag
+
+
+@static_export
+@condition(etag_func=service_worker_etag)
+@require_http_methods(["GET", "HEAD"])
+def service_worker(request):
+    """Generated service worker that precaches the page shell and caches pages."""
+    template = loader.get_template(SERVICE_WORKER_TEMPLATE)
+    script = template.render({
+        'version': cache_version(),
+        'precache': json.dumps(precache_urls()),
+        'uncached_prefixes': json.dumps(UNCACHED_PREFIXES),
+        'offline_page': reverse('calculators:home'),
+    })
+    response = HttpResponse(script, content_type='application/javascript')
+    # Browsers should check for a new worker on every visit
+    patch_cache_control(response, no_cache=True)
+    return response
+
+
+# Registry-driven JSON API and dispatch
+
+@require_http_methods(["POST"])
+def calculate_api(request, slug):
+    """
+    Run a registered calculator's computation as JSON.
+    
+    Accepts a JSON object or form fields named as on the calculator's page;
+    calculators without flat inputs (age, GPA, grade, ...) are not exposed.
+    """
+    spec = REGISTRY.get(slug)
+    if spec is None or spec.compute is None:
+        return JsonResponse({'error': f'Unknown calculator: {slug}'}, status=404)
+    try:
+        result = spec.compute(**spec.schema.arguments(request_data(request)))
+        return JsonResponse({'success': True, 'result': result})
+        
+    except SchemaError as e:
+        return JsonResponse({'error': f'Invalid input values: {e}', 'errors': e.errors}, status=400)
+    except (ValueError, TypeError, ZeroDivisionError) as e:
+        return JsonResponse({'error': f'Invalid input values: {e}'}, status=400)
+
+
+@require_http_methods(["POST"])
+def solve_api(request, goal):
+    """
+    Solve for an input of a finance calculator (see ``calculators.solvers``).
+    
+    A JSON body may carry ``{"cases": [...]}`` to solve many at once; results
+    come back in the same order, and errors are keyed ``cases.<i>.<field>``.
+    """
+    from .solvers import GOALS
+    
+    solver = GOALS.get(goal)
+    if solver is None:
+        return JsonResponse({'error': f'Unknown goal: {goal}'}, status=404)
+    try:
+        data = request_data(request)
+        cases = data.get('cases')
+        if cases is None:
+            result = solver.solve(**solver.schema.arguments(data))
+            return JsonResponse({'success': True, 'result': result})
+        
+        if not isinstance(cases, list) or len(cases) > schemas.max_rows():
+            raise SchemaError({'cases': f'must be a list of at most {schemas.max_rows()} objects'})
+        results = []
+        errors = {}
+        for i, case in enumerate(cases):
+            try:
+                if not isinstance(case, dict):
+                    raise ValueError('must be an object')
+                results.append(solver.solve(**solver.schema.arguments(case)))
+            except SchemaError as e:
+                errors.update({
+                    f'cases.{i}' if field == schemas.NON_FIELD_ERRORS else f'cases.{i}.{field}': message
+                    for field, message in e.errors.items()
+                })
+            except (ValueError, ZeroDivisionError, OverflowError) as e:
+                errors[f'cases.{i}'] = str(e)
+        if errors:
+            raise SchemaError(errors)
+        return JsonResponse({'success': True, 'results': results})
+        
+    except SchemaError as e:
+        return JsonResponse({'error': f'Invalid input values: {e}', 'errors': e.errors}, status=400)
+    except (ValueError, ZeroDivisionError, OverflowError) as e:
+        return JsonResponse({'error': f'Invalid input values: {e}'}, status=400)
+
+
+# Page view of every registered calculator, resolved once at import
+CALCULATOR_VIEWS = {slug: globals()[spec.view] for slug, spec in REGISTRY.items()}